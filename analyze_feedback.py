@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Analyze feedback.jsonl to identify patterns and generate query improvement recommendations.
+Analyze stored feedback to identify patterns and generate query improvement recommendations.
 
 Minimum thresholds:
 - 20 ratings total (10 relevant + 10 not relevant) for basic analysis
@@ -8,12 +8,12 @@ Minimum thresholds:
 - 100+ ratings for high confidence recommendations
 """
 
-import json
-import os
 from collections import Counter
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import re
 
+from src.feedback_store import FeedbackStore, get_feedback_store, rating_level
+
 
 # Minimum thresholds
 MIN_RATINGS_BASIC = 20
@@ -24,43 +24,17 @@ MIN_RATINGS_CONFIDENT = 100
 MIN_WORD_FREQUENCY = 3  # Word must appear at least 3 times to be significant
 
 
-def load_feedback(filepath: str = "feedback.jsonl") -> Tuple[List[Dict], List[Dict], List[Dict], List[Dict], List[Dict]]:
+def load_feedback(store: Optional[FeedbackStore] = None) -> Tuple[List[Dict], List[Dict], List[Dict], List[Dict], List[Dict]]:
 	"""Load and categorize feedback by 1-5 rating scale."""
-	rating_1 = []  # Not relevant
-	rating_2 = []  # Slightly relevant
-	rating_3 = []  # Moderately relevant
-	rating_4 = []  # Very relevant
-	rating_5 = []  # Highly relevant
-	
-	if not os.path.exists(filepath):
-		return rating_1, rating_2, rating_3, rating_4, rating_5
-	
-	with open(filepath, 'r') as f:
-		for line in f:
-			try:
-				entry = json.loads(line)
-				rating = entry.get('rating', '')
-				
-				# Handle new 1-5 scale
-				if rating == 1:
-					rating_1.append(entry)
-				elif rating == 2:
-					rating_2.append(entry)
-				elif rating == 3:
-					rating_3.append(entry)
-				elif rating == 4:
-					rating_4.append(entry)
-				elif rating == 5:
-					rating_5.append(entry)
-				# Handle legacy binary ratings
-				elif rating == 'not_relevant':
-					rating_1.append(entry)
-				elif rating == 'relevant':
-					rating_4.append(entry)  # Treat legacy "relevant" as "very relevant"
-			except:
-				pass
-	
-	return rating_1, rating_2, rating_3, rating_4, rating_5
+	# Legacy binary ratings count as 1 (not_relevant) and 4 (relevant)
+	levels = {level: [] for level in range(1, 6)}
+	
+	for entry in (store or get_feedback_store()).entries():
+		level = rating_level(entry)
+		if level:
+			levels[level].append(entry)
+	
+	return levels[1], levels[2], levels[3], levels[4], levels[5]
 
 
 def extract_keywords(text: str) -> List[str]:
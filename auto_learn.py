@@ -5,15 +5,15 @@ Run weekly to improve relevance based on your ratings and notes.
 """
 
 import json
-import os
 import re
 from collections import Counter
 from typing import List, Set, Tuple
 from datetime import datetime
 
+from src.feedback_store import get_feedback_store, rating_level
+from src.keyword_rules import get_keyword_rules
+
 
-FEEDBACK_FILE = "feedback.jsonl"
-FILTERS_FILE = "main_simple.py"
 LEARNING_LOG = "learning_log.jsonl"
 MIN_OCCURRENCES = 3  # Keyword must appear 3+ times to be added
 
@@ -23,29 +23,13 @@ def load_feedback_by_rating():
 	low_relevance = []  # Ratings 1-2
 	high_relevance = []  # Ratings 4-5
 	
-	if not os.path.exists(FEEDBACK_FILE):
-		return low_relevance, high_relevance
-	
-	with open(FEEDBACK_FILE, 'r') as f:
-		for line in f:
-			try:
-				entry = json.loads(line)
-				rating = entry.get('rating')
-				
-				# Handle different rating formats
-				if isinstance(rating, str):
-					if rating == 'not_relevant':
-						rating = 1
-					elif rating == 'relevant':
-						rating = 4
-				
-				if isinstance(rating, int):
-					if 1 <= rating <= 2:
-						low_relevance.append(entry)
-					elif 4 <= rating <= 5:
-						high_relevance.append(entry)
-			except:
-				pass
+	for entry in get_feedback_store().entries():
+		# Legacy 'not_relevant' / 'relevant' count as 1 / 4
+		level = rating_level(entry)
+		if level in (1, 2):
+			low_relevance.append(entry)
+		elif level in (4, 5):
+			high_relevance.append(entry)
 	
 	return low_relevance, high_relevance
 
@@ -105,60 +89,23 @@ def find_new_inclusion_keywords(high_relevance: List[dict], current_inclusions:
 	return new_keywords
 
 
-def read_current_filters(filepath: str) -> Tuple[Set[str], Set[str]]:
-	"""Read current irrelevant and relevant keyword lists from main_simple.py."""
-	irrelevant = set()
-	relevant = set()
-	
-	with open(filepath, 'r') as f:
-		content = f.read()
-	
-	# Extract irrelevant_keywords list
-	irrel_match = re.search(r"irrelevant_keywords\s*=\s*\[(.*?)\]", content, re.DOTALL)
-	if irrel_match:
-		items = re.findall(r"'([^']+)'", irrel_match.group(1))
-		irrelevant = set(items)
-	
-	# Extract relevant_keywords list
-	rel_match = re.search(r"relevant_keywords\s*=\s*\[(.*?)\]", content, re.DOTALL)
-	if rel_match:
-		items = re.findall(r"'([^']+)'", rel_match.group(1))
-		relevant = set(items)
-	
-	return irrelevant, relevant
+def read_current_filters() -> Tuple[Set[str], Set[str]]:
+	"""Read current irrelevant and relevant keyword lists from the keyword rules file."""
+	rules = get_keyword_rules()
+	return set(rules.keywords("irrelevant")), set(rules.keywords("relevant"))
 
 
-def update_filters(filepath: str, new_exclusions: List[str], new_inclusions: List[str]) -> bool:
-	"""Update main_simple.py with new keywords."""
+def update_filters(new_exclusions: List[str], new_inclusions: List[str]) -> bool:
+	"""Add new keywords to the keyword rules file (a new rules version; filters pick it up on their next lookup)."""
 	if not new_exclusions and not new_inclusions:
 		return False
 	
-	with open(filepath, 'r') as f:
-		content = f.read()
-	
-	# Add new exclusions
-	if new_exclusions:
-		# Find the irrelevant_keywords list
-		match = re.search(r"(irrelevant_keywords\s*=\s*\[.*?)(\n\t])", content, re.DOTALL)
-		if match:
-			additions = ',\n\t\t'.join([f"'{kw}'" for kw in new_exclusions])
-			updated = match.group(1) + f",\n\t\t# Auto-learned from feedback:\n\t\t{additions}" + match.group(2)
-			content = content[:match.start()] + updated + content[match.end():]
-	
-	# Add new inclusions
-	if new_inclusions:
-		# Find the relevant_keywords list  
-		match = re.search(r"(relevant_keywords\s*=\s*\[.*?)(\n\t])", content, re.DOTALL)
-		if match:
-			additions = ',\n\t\t'.join([f"'{kw}'" for kw in new_inclusions])
-			updated = match.group(1) + f",\n\t\t# Auto-learned from feedback:\n\t\t{additions}" + match.group(2)
-			content = content[:match.start()] + updated + content[match.end():]
-	
-	# Write back
-	with open(filepath, 'w') as f:
-		f.write(content)
+	rules = get_keyword_rules()
+	section = "Auto-learned from feedback"
+	added = rules.add_keywords("irrelevant", new_exclusions, section=section)
+	added += rules.add_keywords("relevant", new_inclusions, section=section)
 	
-	return True
+	return bool(added)
 
 
 def log_learning(new_exclusions: List[str], new_inclusions: List[str]):
@@ -192,7 +139,7 @@ def main():
 	
 	# Read current filters
 	print("\n🔍 Analyzing current filters...")
-	current_excl, current_incl = read_current_filters(FILTERS_FILE)
+	current_excl, current_incl = read_current_filters()
 	print(f"   Current exclusions: {len(current_excl)} keywords")
 	print(f"   Current inclusions: {len(current_incl)} keywords")
 	
@@ -225,10 +172,10 @@ def main():
 	
 	# Update filters
 	print("\n🔧 Updating filters...")
-	success = update_filters(FILTERS_FILE, new_excl, new_incl)
+	success = update_filters(new_excl, new_incl)
 	
 	if success:
-		print("   ✅ Filters updated successfully!")
+		print(f"   ✅ Filters updated successfully! (keyword_rules.json v{get_keyword_rules().version})")
 		log_learning(new_excl, new_incl)
 		print(f"   📝 Changes logged to {LEARNING_LOG}")
 		print(f"\n💡 Next steps:")
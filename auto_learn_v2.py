@@ -5,15 +5,15 @@ Identifies what types of articles are relevant vs not relevant.
 """
 
 import json
-import os
 import re
 from collections import Counter
 from typing import List, Set, Tuple
 from datetime import datetime
 
+from src.feedback_store import get_feedback_store, rating_level
+from src.keyword_rules import get_keyword_rules
+
 
-FEEDBACK_FILE = "feedback.jsonl"
-FILTERS_FILE = "main_simple.py"
 LEARNING_LOG = "learning_log.jsonl"
 MIN_OCCURRENCES = 5  # Keyword must appear 5+ times to be significant
 
@@ -23,51 +23,34 @@ def load_feedback_with_articles():
 	low_relevance_articles = []  # Ratings 1-2
 	high_relevance_articles = []  # Ratings 4-5
 	
-	if not os.path.exists(FEEDBACK_FILE):
-		return low_relevance_articles, high_relevance_articles
-	
-	with open(FEEDBACK_FILE, 'r') as f:
-		for line in f:
-			try:
-				entry = json.loads(line)
-				
-				# SKIP promotional content - don't use for topic learning
-				if entry.get('is_promo', False):
-					continue
-				
-				rating = entry.get('rating')
-				
-				# Get article content (stored by dashboard)
-				title = entry.get('article_title', '')
-				summary = entry.get('article_summary', '')
-				
-				# If no stored content, skip (old feedback format)
-				if not title and not summary:
-					continue
-				
-				# Convert rating
-				if isinstance(rating, str):
-					if rating == 'not_relevant':
-						rating = 1
-					elif rating == 'relevant':
-						rating = 4
-				
-				# Combine title and summary for analysis
-				article_text = (title + ' ' + summary).lower()
-				
-				item = {
-					'title': title,
-					'summary': summary,
-					'text': article_text,
-				}
-				
-				if isinstance(rating, int):
-					if 1 <= rating <= 2:
-						low_relevance_articles.append(item)
-					elif 4 <= rating <= 5:
-						high_relevance_articles.append(item)
-			except:
-				pass
+	for entry in get_feedback_store().entries():
+		# SKIP promotional content - don't use for topic learning
+		if entry.get('is_promo', False):
+			continue
+		
+		# Get article content (stored by dashboard)
+		title = entry.get('article_title') or ''
+		summary = entry.get('article_summary') or ''
+		
+		# If no stored content, skip (old feedback format)
+		if not title and not summary:
+			continue
+		
+		# Combine title and summary for analysis
+		article_text = (title + ' ' + summary).lower()
+		
+		item = {
+			'title': title,
+			'summary': summary,
+			'text': article_text,
+		}
+		
+		# Legacy 'not_relevant' / 'relevant' count as 1 / 4
+		level = rating_level(entry)
+		if level in (1, 2):
+			low_relevance_articles.append(item)
+		elif level in (4, 5):
+			high_relevance_articles.append(item)
 	
 	return low_relevance_articles, high_relevance_articles
 
@@ -166,62 +149,23 @@ def find_distinctive_keywords(low_articles: List[dict], high_articles: List[dict
 	return new_exclusions[:10], new_inclusions[:10]
 
 
-def read_current_filters(filepath: str) -> Tuple[Set[str], Set[str]]:
-	"""Read current keyword lists from main_simple.py."""
-	irrelevant = set()
-	relevant = set()
-	
-	with open(filepath, 'r') as f:
-		content = f.read()
-	
-	# Extract irrelevant_keywords list
-	irrel_match = re.search(r"irrelevant_keywords\s*=\s*\[(.*?)\]", content, re.DOTALL)
-	if irrel_match:
-		items = re.findall(r"'([^']+)'", irrel_match.group(1))
-		irrelevant = set(items)
-	
-	# Extract relevant_keywords list
-	rel_match = re.search(r"relevant_keywords\s*=\s*\[(.*?)\]", content, re.DOTALL)
-	if rel_match:
-		items = re.findall(r"'([^']+)'", rel_match.group(1))
-		relevant = set(items)
-	
-	return irrelevant, relevant
+def read_current_filters() -> Tuple[Set[str], Set[str]]:
+	"""Read current irrelevant and relevant keyword lists from the keyword rules file."""
+	rules = get_keyword_rules()
+	return set(rules.keywords("irrelevant")), set(rules.keywords("relevant"))
 
 
-def update_filters(filepath: str, new_exclusions: List[Tuple], new_inclusions: List[Tuple]) -> bool:
-	"""Update main_simple.py with new keywords."""
+def update_filters(new_exclusions: List[Tuple], new_inclusions: List[Tuple]) -> bool:
+	"""Add new keywords to the keyword rules file (a new rules version; filters pick it up on their next lookup)."""
 	if not new_exclusions and not new_inclusions:
 		return False
 	
-	with open(filepath, 'r') as f:
-		content = f.read()
-	
-	# Add new exclusions
-	if new_exclusions:
-		keywords_to_add = [item[0] for item in new_exclusions]
-		match = re.search(r"(irrelevant_keywords\s*=\s*\[.*?)(\n\t])", content, re.DOTALL)
-		if match:
-			timestamp = datetime.now().strftime('%Y-%m-%d')
-			additions = ',\n\t\t'.join([f"'{kw}'" for kw in keywords_to_add])
-			updated = match.group(1) + f",\n\t\t# Auto-learned {timestamp} from article content analysis:\n\t\t{additions}" + match.group(2)
-			content = content[:match.start()] + updated + content[match.end():]
-	
-	# Add new inclusions
-	if new_inclusions:
-		keywords_to_add = [item[0] for item in new_inclusions]
-		match = re.search(r"(relevant_keywords\s*=\s*\[.*?)(\n\t])", content, re.DOTALL)
-		if match:
-			timestamp = datetime.now().strftime('%Y-%m-%d')
-			additions = ',\n\t\t'.join([f"'{kw}'" for kw in keywords_to_add])
-			updated = match.group(1) + f",\n\t\t# Auto-learned {timestamp} from article content analysis:\n\t\t{additions}" + match.group(2)
-			content = content[:match.start()] + updated + content[match.end():]
-	
-	# Write back
-	with open(filepath, 'w') as f:
-		f.write(content)
+	rules = get_keyword_rules()
+	section = f"Auto-learned {datetime.now().strftime('%Y-%m-%d')} from article content analysis"
+	added = rules.add_keywords("irrelevant", [item[0] for item in new_exclusions], section=section)
+	added += rules.add_keywords("relevant", [item[0] for item in new_inclusions], section=section)
 	
-	return True
+	return bool(added)
 
 
 def log_learning(new_exclusions: List[Tuple], new_inclusions: List[Tuple]):
@@ -256,7 +200,7 @@ def main():
 	
 	# Read current filters
 	print("\n🔍 Reading current filters...")
-	current_excl, current_incl = read_current_filters(FILTERS_FILE)
+	current_excl, current_incl = read_current_filters()
 	print(f"   Current exclusions: {len(current_excl)} keywords")
 	print(f"   Current inclusions: {len(current_incl)} keywords")
 	
@@ -298,10 +242,10 @@ def main():
 	
 	# Apply updates
 	print("\n🔧 Updating filters...")
-	success = update_filters(FILTERS_FILE, new_excl, new_incl)
+	success = update_filters(new_excl, new_incl)
 	
 	if success:
-		print("   ✅ Filters updated!")
+		print(f"   ✅ Filters updated! (keyword_rules.json v{get_keyword_rules().version})")
 		log_learning(new_excl, new_incl)
 		print(f"   📝 Logged to {LEARNING_LOG}")
 		print(f"\n💡 Next steps:")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for keyword filtering on a synthetic corpus.
+Compares the per-list `any(keyword in text ...)` passes (one substring scan per
+list: irrelevant, relevant, five categories, four score boosts, PR patterns)
+with the compiled matcher behind main_simple (built from keyword_rules.json),
+which scans each article once, and with the NumPy batch scorer behind
+main_simple.process_articles (src/batch_scoring.py).
+All paths must give the same relevance, category and score for every article,
+and the batch path the same report items as process_article.
+
+Run with: python benchmark_keywords.py --articles 20000
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from main_simple import (classify_by_keywords, is_corporate_pr, is_relevant, keyword_matches, keyword_score,
+                         process_article, process_articles)
+from src.batch_scoring import score_articles
+from src.keyword_rules import get_keyword_rules
+
+
+RULES = get_keyword_rules()
+IRRELEVANT_KEYWORDS = RULES.keywords("irrelevant")
+RELEVANT_KEYWORDS = RULES.keywords("relevant")
+PR_PATTERNS = RULES.keywords("pr_patterns")
+ANZ_KEYWORDS = RULES.keywords("anz_keywords")
+CATEGORY_KEYWORDS = [(entry["category"], entry["keywords"]) for entry in RULES.data["categories"]]
+SCORE_BOOSTS = [(entry["boost"], entry["keywords"]) for entry in RULES.data["score_boosts"]]
+
+
+FILLER = (
+	"the a of to in and said on for with by from at as its after over new year week government people "
+	"company report data market sector plan change rise fall quarter million billion people city state "
+	"statement official minister chief executive detail unsaid rain chair lawn paid"
+).split()
+URLS = ["https://www.biometricupdate.com/202501/story", "https://www.abc.net.au/news/story", "https://www.reuters.com/story"]
+SOURCE_TYPES = [None, "RSS", "Legislation", "Email"]
+
+
+def make_corpus(n: int, keyword_rate: float = 0.05, seed: int = 5) -> List[Dict]:
+	"""n articles of mostly filler words; keyword_rate of title words (and 40% of that in descriptions) come from the lists."""
+	rng = random.Random(seed)
+	keywords = IRRELEVANT_KEYWORDS + RELEVANT_KEYWORDS + PR_PATTERNS + ANZ_KEYWORDS
+	keywords += [w for _, words in CATEGORY_KEYWORDS + SCORE_BOOSTS for w in words]
+
+	def sentence(length: int, density: float) -> str:
+		return " ".join(rng.choice(keywords) if rng.random() < density else rng.choice(FILLER) for _ in range(length))
+
+	return [{
+		"title": sentence(rng.randint(6, 14), keyword_rate).capitalize(),
+		"description": sentence(rng.randint(20, 60), keyword_rate * 0.4).capitalize() + ".",
+		"url": rng.choice(URLS),
+		"_source_type": rng.choice(SOURCE_TYPES),
+	} for _ in range(n)]
+
+
+def legacy_decisions(article: Dict) -> Tuple[bool, Optional[str], int]:
+	"""The pre-matcher checks: one `any(... in text)` pass per keyword list."""
+	title, description, url = article["title"], article["description"], article["url"]
+	text = (title + " " + description).lower()
+	relevant = not any(k in text for k in IRRELEVANT_KEYWORDS) and any(k in text for k in RELEVANT_KEYWORDS)
+	if relevant and 'biometricupdate.com' in url and any(p in text for p in PR_PATTERNS):
+		relevant = any(k in text for k in ANZ_KEYWORDS)
+	if not relevant:
+		return False, None, 0
+	category = next((c for c, words in CATEGORY_KEYWORDS if any(w in text for w in words)), "Regulation")
+	score = min(50 + sum(boost for boost, words in SCORE_BOOSTS if any(w in text for w in words)), 100)
+	return True, category, score
+
+
+def compiled_decisions(article: Dict) -> Tuple[bool, Optional[str], int]:
+	"""The same decisions from a single KEYWORDS scan."""
+	title, description, url = article["title"], article["description"], article["url"]
+	matches = keyword_matches(title, description)
+	if not is_relevant(title, description, matches) or is_corporate_pr(title, description, url, matches):
+		return False, None, 0
+	return True, classify_by_keywords(title, description, matches), keyword_score(matches)
+
+
+def scalar_scores(articles: List[Dict], matches: List[Dict]) -> List[Tuple[bool, str, int]]:
+	"""Per-article decisions from precomputed matches, as process_article makes them (source tags aside)."""
+	return [(
+		is_relevant(article["title"], article["description"], found)
+		and not is_corporate_pr(article["title"], article["description"], article["url"], found),
+		classify_by_keywords(article["title"], article["description"], found),
+		keyword_score(found),
+	) for article, found in zip(articles, matches)]
+
+
+def batch_scores(articles: List[Dict], matches: List[Dict]) -> List[Tuple[bool, str, int]]:
+	"""The same decisions from the NumPy batch scorer."""
+	untagged = [dict(article, _source_type=None) for article in articles]
+	started = time.perf_counter()
+	scores = score_articles(untagged, matches=matches)
+	batch_scores.elapsed = time.perf_counter() - started
+	return list(zip(scores.kept.tolist(), scores.category.tolist(), scores.score.tolist()))
+
+
+def bench(decide, articles: List[Dict]) -> Tuple[float, List]:
+	started = time.perf_counter()
+	results = [decide(article) for article in articles]
+	return time.perf_counter() - started, results
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description="Keyword matching throughput benchmark")
+	parser.add_argument("--articles", type=int, default=20000, help="Synthetic corpus size")
+	parser.add_argument("--keyword-rate", type=float, default=0.05, help="Share of title words drawn from the keyword lists")
+	args = parser.parse_args()
+
+	articles = make_corpus(args.articles, args.keyword_rate)
+	print(f"📊 Corpus: {len(articles)} articles, {len(RULES.matcher)} distinct keywords in {len(RULES.matcher.groups)} groups")
+
+	legacy_time, legacy = bench(legacy_decisions, articles)
+	compiled_time, compiled = bench(compiled_decisions, articles)
+	assert legacy == compiled, "compiled matcher must give the same decisions"
+	kept = sum(1 for relevant, _, _ in compiled if relevant)
+	print(f"  Per-list any() scans:  {len(articles) / legacy_time:,.0f} articles/s")
+	print(f"  Compiled matcher:      {len(articles) / compiled_time:,.0f} articles/s  ({legacy_time / compiled_time:.1f}x, {kept} relevant either way)")
+
+	matches = [keyword_matches(article["title"], article["description"]) for article in articles]
+	started = time.perf_counter()
+	scalar = scalar_scores(articles, matches)
+	scalar_time = time.perf_counter() - started
+	batch = batch_scores(articles, matches)
+	assert scalar == batch, "batch scores must match the per-article functions"
+	print(f"  Scoring, per article:  {len(articles) / scalar_time:,.0f} articles/s (matches precomputed)")
+	print(f"  Scoring, NumPy batch:  {len(articles) / batch_scores.elapsed:,.0f} articles/s  ({scalar_time / batch_scores.elapsed:.1f}x)")
+
+	scalar_time, scalar = bench(lambda article: process_article(article, "Regulation"), articles)
+	started = time.perf_counter()
+	batch = process_articles(articles)
+	batch_time = time.perf_counter() - started
+	assert scalar == batch, "batch scoring must give the same report items as process_article"
+	print(f"  process_article:       {len(articles) / scalar_time:,.0f} articles/s")
+	print(f"  process_articles:      {len(articles) / batch_time:,.0f} articles/s  ({scalar_time / batch_time:.1f}x, same report items)")
+
+
+if __name__ == "__main__":
+	main()
@@ -5,12 +5,17 @@ Run with: streamlit run dashboard.py
 """
 
 import streamlit as st
-import json
-import os
 from datetime import datetime
 from pathlib import Path
 import pandas as pd
 
+from src.feedback_filter import record_feedback
+from src.feedback_store import get_feedback_store
+from src.report import importance_level
+
+# Badge per importance_level() label; lower levels are ⚪
+LEVEL_BADGES = {"Very Important": "🔴", "Important": "🟠", "Moderately Important": "🟡"}
+
 
 # Page config
 st.set_page_config(
@@ -20,25 +25,16 @@ st.set_page_config(
 )
 
 # Load feedback
-FEEDBACK_FILE = "feedback.jsonl"
+@st.cache_data
+def _latest_feedback(version):
+	return get_feedback_store().latest_by_url()
 
 def load_feedback():
-	"""Load existing feedback from JSONL file."""
-	feedback = {}
-	if os.path.exists(FEEDBACK_FILE):
-		with open(FEEDBACK_FILE, 'r') as f:
-			for line in f:
-				try:
-					entry = json.loads(line)
-					url = entry.get('article_url')
-					if url:
-						feedback[url] = entry
-				except:
-					pass
-	return feedback
+	"""Latest feedback per article URL; cached across reruns until new feedback is stored."""
+	return _latest_feedback(get_feedback_store().last_id())
 
 def save_feedback(article_url, rating, notes="", tags=None, article_title="", article_summary="", is_promo=False):
-	"""Append feedback to JSONL file with article metadata for learning."""
+	"""Store feedback with article metadata for learning."""
 	entry = {
 		"article_url": article_url,
 		"rating": rating,
@@ -49,9 +45,7 @@ def save_feedback(article_url, rating, notes="", tags=None, article_title="", ar
 		"is_promo": is_promo,  # Flag for promotional/event content (not used for topic learning)
 		"timestamp": datetime.utcnow().isoformat()
 	}
-	with open(FEEDBACK_FILE, 'a') as f:
-		f.write(json.dumps(entry) + '\n')
-	return entry
+	return record_feedback(entry)
 
 def load_latest_report():
 	"""Load the most recent markdown report."""
@@ -221,14 +215,8 @@ for i, article in enumerate(filtered_articles):
 	with st.expander(f"**{article['title']}**", expanded=i < 5):
 		# Score badge
 		score = article["score"]
-		if score >= 91:
-			st.markdown(f"🔴 **Very Important** ({score})")
-		elif score >= 75:
-			st.markdown(f"🟠 **Important** ({score})")
-		elif score >= 50:
-			st.markdown(f"🟡 **Moderately Important** ({score})")
-		else:
-			st.markdown(f"⚪ **Less Important** ({score})")
+		label = importance_level(score)
+		st.markdown(f"{LEVEL_BADGES.get(label, '⚪')} **{label}** ({score})")
 		
 		st.markdown(f"**Category:** {article['category']}")
 		
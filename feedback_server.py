@@ -5,24 +5,22 @@ Run with: python feedback_server.py
 """
 
 from flask import Flask, request, redirect, render_template_string
-import json
 from datetime import datetime
-import os
+
+from src.feedback_filter import record_feedback
+from src.feedback_store import get_feedback_store
 
 app = Flask(__name__)
-FEEDBACK_FILE = "feedback.jsonl"
 
 def save_feedback(article_url, rating, notes=""):
-	"""Append feedback to JSONL file."""
+	"""Store feedback from an email link."""
 	entry = {
 		"article_url": article_url,
 		"rating": rating,
 		"notes": notes,
 		"timestamp": datetime.utcnow().isoformat()
 	}
-	with open(FEEDBACK_FILE, 'a') as f:
-		f.write(json.dumps(entry) + '\n')
-	return entry
+	return record_feedback(entry)
 
 @app.route('/feedback')
 def feedback():
@@ -75,18 +73,10 @@ def dashboard_redirect():
 @app.route('/')
 def index():
 	"""Show feedback stats."""
-	# Load feedback
-	feedback_data = []
-	if os.path.exists(FEEDBACK_FILE):
-		with open(FEEDBACK_FILE, 'r') as f:
-			for line in f:
-				try:
-					feedback_data.append(json.loads(line))
-				except:
-					pass
-	
-	relevant_count = len([f for f in feedback_data if f.get('rating') == 'relevant'])
-	not_relevant_count = len([f for f in feedback_data if f.get('rating') == 'not_relevant'])
+	# Aggregate counters, maintained on every write (no scan of the feedback table)
+	counters = get_feedback_store().counters()
+	relevant_count = counters.get('rating:relevant', 0)
+	not_relevant_count = counters.get('rating:not_relevant', 0)
 	
 	index_html = """
 	<!DOCTYPE html>
@@ -138,7 +128,7 @@ def index():
 	
 	return render_template_string(
 		index_html, 
-		total=len(feedback_data),
+		total=counters.get('total', 0),
 		relevant=relevant_count,
 		not_relevant=not_relevant_count
 	)
@@ -9,7 +9,16 @@ from src.rss_client import RSSClient
 from src.rss_feeds import RSS_FEEDS
 from src.legislation_scraper import LegislationScraper
 from src.nlp import OpenAINLP
+from src.llm_cache import LLMCache
+from src.local_classifier import LocalClassifier, load_training_data
+from src.batch_jobs import BATCH_DIR, LocalBatchStub, OpenAIBatchRunner, run_batch
 from src.report import ReportBuilder
+from src.gates import GateStage, KeywordScan, corporate_pr_gate, duplicate_gate, fingerprint_gate, relevance_gate, url_lookup_gate
+from src.simhash_store import SimHashStore
+from src.seen_tracker import DAYS_TO_KEEP, get_seen_store, is_seen
+from src.feedback_filter import get_feedback_bloom, is_blocked
+from src.filter_stats import get_filter_stats
+from main_simple import is_corporate_pr, is_relevant, keyword_matches
 
 
 # Australian government domains for GNews site filtering
@@ -25,6 +34,14 @@ def parse_args() -> argparse.Namespace:
 	parser.add_argument("--since", required=True, help="Start date (YYYY-MM-DD). Only news after this date are considered.")
 	parser.add_argument("--max-per-category", type=int, default=None, help="Max number of articles to process per category.")
 	parser.add_argument("--output-dir", type=str, default=None, help="Output directory for the Markdown report.")
+	parser.add_argument("--batch-size", type=int, default=None, help="Classify N articles per OpenAI request (default: OPENAI_BATCH_SIZE).")
+	parser.add_argument("--batch-api", action="store_true", help="Classify everything in one offline OpenAI Batch API job (for large backfills).")
+	parser.add_argument("--batch-stub", action="store_true", help="Like --batch-api, but answer the batch with the local offline stub.")
+	parser.add_argument("--batch-dir", type=str, default=BATCH_DIR, help="Directory for Batch API request/response files.")
+	parser.add_argument("--batch-poll", type=float, default=60.0, help="Seconds between Batch API status checks.")
+	parser.add_argument("--local-threshold", type=float, default=None, help="Min local-classifier confidence to skip the LLM (default: LOCAL_CONFIDENCE_THRESHOLD).")
+	parser.add_argument("--no-local", action="store_true", help="Send every uncached item to the LLM (disable the local classifier cascade).")
+	parser.add_argument("--no-gate", action="store_true", help="Send every item to the LLM (skip keyword, seen and feedback gates; cross-source duplicates are still dropped).")
 	return parser.parse_args()
 
 
@@ -46,46 +63,87 @@ def main() -> None:
 	print("RSSClient created")
 	legislation_scraper = LegislationScraper()
 	print("LegislationScraper created")
-	nlp = OpenAINLP(api_key=settings.openai_api_key, model=settings.openai_model)
+	llm_cache = LLMCache(
+		path=settings.llm_cache_path,
+		ttl_days=settings.llm_cache_ttl_days,
+		max_entries=settings.llm_cache_max_entries,
+	)
+	local = None
+	if not args.no_local:
+		labelled, rated = load_training_data(llm_cache.examples(model=settings.openai_model))
+		local = LocalClassifier(categories=list(CATEGORIES.keys()))
+		local.train(labelled, rated)
+		print(f"Local classifier {'trained' if local.trained else 'not trained (too few examples)'}: {len(labelled)} GPT results, {len(rated)} ratings")
+	nlp = OpenAINLP(
+		api_key=settings.openai_api_key,
+		model=settings.openai_model,
+		cache=llm_cache,
+		requests_per_minute=settings.openai_rpm,
+		tokens_per_minute=settings.openai_tpm,
+		max_workers=settings.openai_concurrency,
+		batch_size=args.batch_size or settings.openai_batch_size,
+		batch_max_tokens=settings.openai_batch_max_tokens,
+		local=local,
+		local_threshold=args.local_threshold if args.local_threshold is not None else settings.local_confidence_threshold,
+	)
 	print("NLP processor created")
 	report = ReportBuilder(since=args.since)
 	print("Report builder created")
 
-	seen_links = set()
+	# Cheap gates in front of the LLM: every article they reject is a paid call saved
+	# The keyword gates share one scan per article, which the filter stats also record
+	scan = KeywordScan(keyword_matches)
+	if args.no_gate:
+		gates = GateStage([("cross-source duplicate", duplicate_gate())])
+	else:
+		fingerprints = SimHashStore(days_to_keep=DAYS_TO_KEEP)
+		print(f"Gates loaded: {get_seen_store().count()} tracked URLs, {len(fingerprints.entries)} story fingerprints, {get_feedback_bloom().count} feedback-blocked URLs")
+		gates = GateStage([
+			("seen in previous runs", url_lookup_gate(is_seen)),
+			("same story in previous runs", fingerprint_gate(fingerprints)),
+			("feedback blocklist", url_lookup_gate(is_blocked)),
+			("keyword relevance", relevance_gate(is_relevant, scan)),
+			("corporate PR", corporate_pr_gate(is_corporate_pr, scan)),
+			("cross-source duplicate", duplicate_gate()),
+		])
+	stats = get_filter_stats()
 	categorized: dict[str, list] = {k: [] for k in CATEGORIES.keys()}
+	offline_batch = args.batch_api or args.batch_stub
+	batch_jobs: list = []
+
+	def file_results(results: list, jobs: list) -> None:
+		for result, (_, default_category) in zip(results, jobs):
+			cat = result.get("category") or default_category
+			categorized.setdefault(cat, []).append(result)
+
+	def classify_items(items: list, default_category: str, label: str) -> None:
+		"""Classify items that pass the gates concurrently and file them by category.
+		In offline batch mode the items are only queued for the batch job."""
+		queued = []
+		for item in items:
+			stage = gates.rejected_by(item)
+			stats.record(item, stage, scan.matches_of(item))
+			if stage is None:
+				queued.append(item)
+		print(f"  Queueing {len(queued)}/{len(items)} {label} past the gates")
+		jobs = [(item, default_category) for item in queued]
+		if offline_batch:
+			batch_jobs.extend(jobs)
+			return
+		file_results(nlp.process_articles(jobs), jobs)
 
 	# Step 1: Federal Register of Legislation
 	print("📜 Fetching Federal Register of Legislation...")
 	legislation_items = legislation_scraper.fetch_whats_new(args.since, max_items=20)
 	print(f"  Found {len(legislation_items)} legislation items")
-	for i, item in enumerate(legislation_items):
-		title = item.get("title", "No title")
-		print(f"  Processing legislation {i+1}/{len(legislation_items)}: {title[:50]}...")
-		link = item.get("url")
-		if link and link in seen_links:
-			continue
-		result = nlp.process_article(item, default_category="Regulation")
-		cat = result.get("category") or "Regulation"
-		if link:
-			seen_links.add(link)
-		categorized.setdefault(cat, []).append(result)
+	classify_items(legislation_items, "Regulation", "legislation items")
 	print("📜 Legislation done...")
 
 	# Step 2: RSS feeds
 	print("📡 Fetching RSS feeds...")
 	rss_items = rss_client.fetch_since(args.since, max_items_per_feed=200)
 	print(f"  Found {len(rss_items)} RSS items")
-	for i, item in enumerate(rss_items):
-		title = item.get("title", "No title")
-		print(f"  Processing RSS item {i+1}/{len(rss_items)}: {title[:50]}...")
-		link = item.get("url")
-		if link and link in seen_links:
-			continue
-		result = nlp.process_article(item, default_category="Competition")
-		cat = result.get("category") or "Competition"
-		if link:
-			seen_links.add(link)
-		categorized.setdefault(cat, []).append(result)
+	classify_items(rss_items, "Competition", "RSS items")
 	print("📡 RSS done...")
 
 	# Step 3: GNews by category (TWO searches: government + general)
@@ -112,19 +170,18 @@ def main() -> None:
 		print(f"    Found {len(general_articles)} general articles")
 		
 		# Process all articles
-		all_articles = gov_articles + general_articles
-		for i, article in enumerate(all_articles):
-			title = article.get("title", "No title")
-			print(f"  Processing article {i+1}/{len(all_articles)}: {title[:50]}...")
-			link = article.get("url")
-			if link and link in seen_links:
-				continue
-			result = nlp.process_article(article, default_category=category_name)
-			cat = result.get("category") or category_name
-			if link:
-				seen_links.add(link)
-			categorized.setdefault(cat, []).append(result)
+		classify_items(gov_articles + general_articles, category_name, "articles")
 	print("🔍 GNews done...")
+	print(gates.summary())
+
+	if offline_batch:
+		print(f"📦 Classifying {len(batch_jobs)} articles via {'local batch stub' if args.batch_stub else 'OpenAI Batch API'}...")
+		runner = LocalBatchStub() if args.batch_stub else OpenAIBatchRunner(nlp, poll_interval=args.batch_poll)
+		file_results(run_batch(nlp, batch_jobs, runner, batch_dir=args.batch_dir), batch_jobs)
+	print(f"🗃️  LLM cache: {nlp.cache_hits} hits, {nlp.cache_misses} misses")
+	print(f"🧮 Cascade: {nlp.local_decisions} decided locally, {nlp.llm_decisions} sent to the LLM (threshold {nlp.local_threshold})")
+	if nlp.batch_size > 1:
+		print(f"📦 Batch mode: {nlp.batch_size} articles per request, {nlp.batch_fallbacks} single-article fallbacks")
 
 	# Add results to report by category
 	for cat_name, items in categorized.items():
@@ -133,6 +190,7 @@ def main() -> None:
 	print("🧠 Writing report...")
 	output_path = report.write_markdown(output_dir=settings.output_dir)
 	print(f"Report saved to: {output_path}")
+	print(f"🔎 Filter stats saved to: {stats.write(output_path)}")
 
 
 if __name__ == "__main__":
@@ -5,6 +5,8 @@ Best approach: curated, free, high signal-to-noise ratio.
 """
 
 import argparse
+from typing import Optional
+
 from src.config import Settings, ensure_output_dir
 from src.categories import CATEGORIES
 from src.email_parser import EmailParser
@@ -12,15 +14,22 @@ from src.rss_client import RSSClient
 from src.rss_feeds import RSS_FEEDS
 from src.report import ReportBuilder
 from src.html_report import save_html_report
-from src.deduplication import deduplicate_articles
-from src.seen_tracker import load_seen_urls, mark_as_seen, cleanup_old_entries
-from src.feedback_filter import load_not_relevant_urls
-from main_simple import is_relevant, classify_by_keywords, process_article
+from src.deduplication import cluster_articles
+from src.seen_tracker import get_seen_store, is_seen, mark_as_seen, cleanup_old_entries
+from src.feedback_filter import get_feedback_bloom, is_blocked
+from src.simhash_store import SimHashStore
+from src.filter_stats import get_filter_stats
+from main_simple import is_relevant, classify_by_keywords, process_articles
+
+
+# Seen URLs and story fingerprints from earlier runs are kept (and checked) for this many days
+SEEN_DAYS = 7
 
 
 def parse_args():
 	parser = argparse.ArgumentParser(description="AI Market Intelligence — Newsletter Mode")
 	parser.add_argument("--since-days", type=int, default=7, help="Parse emails from last N days")
+	parser.add_argument("--cached-email", action="store_true", help="Use only newsletters synced by earlier runs (no IMAP connection)")
 	parser.add_argument("--max-per-category", type=int, default=10, help="Max articles per category")
 	return parser.parse_args()
 
@@ -47,22 +56,32 @@ def main():
 	max_per_category = args.max_per_category
 	report = ReportBuilder(since=f"{args.since_days} days ago")
 
-	# Load previously seen articles AND not-relevant feedback
-	print("🔍 Loading previously seen articles...")
-	seen_links = load_seen_urls(days_to_keep=30)
-	print(f"  Found {len(seen_links)} articles from previous runs")
+	# Previously seen and not-relevant articles are checked one URL at a time (Bloom filter first)
+	print(f"🔍 {get_seen_store().count()} articles tracked from previous runs")
+	print(f"🚫 {get_feedback_bloom().count} URLs blocked by your feedback")
 	
-	print("🚫 Loading not-relevant articles from your feedback...")
-	not_relevant_urls = load_not_relevant_urls()
-	print(f"  Found {len(not_relevant_urls)} articles you rated as not relevant")
-	
-	# Skip both seen AND not-relevant
-	skip_urls = seen_links.union(not_relevant_urls)
-	print(f"  Total URLs to skip: {len(skip_urls)}")
+	# Same story under a different URL (other outlet, tracking link) is caught by fingerprint
+	fingerprints = SimHashStore(days_to_keep=SEEN_DAYS)
+	print(f"  Loaded {len(fingerprints.entries)} story fingerprints from previous runs")
 	
 	# Import normalize function for URL matching
 	from src.feedback_filter import normalize_url
 	
+	stats = get_filter_stats()
+	
+	def skip_reason(article: dict) -> Optional[str]:
+		"""Why an article is dropped before keyword filtering (same stage names as main.py's gates), or None."""
+		link = article.get("url")
+		if link:
+			# Exact or normalized URL (tracking URL variants)
+			if is_blocked(link):
+				return "feedback blocklist"
+			if is_seen(link, days_to_keep=SEEN_DAYS) or is_seen(normalize_url(link), days_to_keep=SEEN_DAYS):
+				return "seen in previous runs"
+		if fingerprints.seen(article):
+			return "same story in previous runs"
+		return None
+	
 	categorized = {k: [] for k in CATEGORIES.keys()}
 
 	# Step 1: Parse email newsletters (if configured)
@@ -76,25 +95,24 @@ def main():
 				password=settings.email_inbox_password
 			)
 			
-			email_articles = email_parser.parse_emails_since(days_ago=args.since_days)
+			email_articles = email_parser.parse_emails_since(days_ago=args.since_days, sync=not args.cached_email)
 			print(f"  Found {len(email_articles)} articles from newsletters")
 			
 			email_kept = 0
+			fresh = []
 			for article in email_articles:
-				link = article.get("url")
-				# Check both exact URL and normalized version (for tracking URL variants)
-				if link and (link in skip_urls or normalize_url(link) in skip_urls):
+				reason = skip_reason(article)
+				if reason:
+					stats.record(article, reason)
 					continue
-				
-				# Use newsletter's suggested category or classify
-				suggested_cat = article.get("_newsletter_category", "Regulation")
-				result = process_article(article, suggested_cat)
+				fresh.append(article)
+			
+			# Score all remaining newsletter links in one batch
+			for result in process_articles(fresh):
 				if result is None:
 					continue
 				
 				cat = result["category"]
-				if link:
-					seen_links.add(link)
 				categorized[cat].append(result)
 				email_kept += 1
 			
@@ -111,30 +129,24 @@ def main():
 	print(f"  Found {len(rss_items)} RSS items")
 	
 	rss_kept = 0
+	fresh = []
 	for item in rss_items:
-		link = item.get("url")
-		# Check both exact URL and normalized version (for tracking URL variants)
-		if link and (link in skip_urls or normalize_url(link) in skip_urls):
+		reason = skip_reason(item)
+		if reason:
+			stats.record(item, reason)
 			continue
-		result = process_article(item, "Regulation")
+		fresh.append(item)
+	for result in process_articles(fresh):
 		if result is None:
 			continue
 		cat = result["category"]
-		if link:
-			seen_links.add(link)
 		categorized[cat].append(result)
 		rss_kept += 1
 	print(f"  Kept {rss_kept} relevant RSS articles")
 
-	# Deduplicate
+	# Cluster the same story across all categories (one pass)
 	print("🔄 Deduplicating articles...")
-	for cat_name in categorized.keys():
-		if categorized[cat_name]:
-			original = len(categorized[cat_name])
-			categorized[cat_name] = deduplicate_articles(categorized[cat_name])
-			deduped = len(categorized[cat_name])
-			if original != deduped:
-				print(f"  {cat_name}: {original} → {deduped}")
+	categorized = cluster_articles(categorized)
 	
 	# Sort by date (newest first), then by importance
 	print("📅 Sorting articles by date (newest first)...")
@@ -158,6 +170,8 @@ def main():
 		report.add_category_results(cat_name, items_sorted[:max_per_category], since=f"{args.since_days} days ago")
 
 	output_path = report.write_markdown(output_dir=settings.output_dir)
+	print(stats.summary())
+	stats_path = stats.write(output_path)
 	
 	# Also generate HTML version
 	html_path = save_html_report(categorized, f"{args.since_days} days ago", settings.output_dir)
@@ -169,13 +183,18 @@ def main():
 			url = item.get('link')
 			if url:
 				new_urls.append(url)
+			# Same story from other outlets shouldn't come back either
+			new_urls.extend(o['link'] for o in item.get('also_covered_by') or [] if o.get('link'))
 	
 	if new_urls:
 		mark_as_seen(new_urls)
 		print(f"📝 Marked {len(new_urls)} articles as seen")
+	reported = [item for items in categorized.values() for item in items[:max_per_category]]
+	fingerprints.add(reported)
 	
 	# Cleanup old entries
-	cleanup_old_entries(days_to_keep=7)
+	cleanup_old_entries(days_to_keep=SEEN_DAYS)
+	fingerprints.cleanup()
 	
 	# Summary
 	total_in_report = sum(len(items[:max_per_category]) for items in categorized.values())
@@ -183,6 +202,7 @@ def main():
 	print(f"\n{'='*60}")
 	print(f"✅ Markdown report saved to: {output_path}")
 	print(f"✅ HTML report saved to: {html_path}")
+	print(f"🔎 Filter stats saved to: {stats_path}")
 	print(f"\n💡 Open HTML report in browser for clickable links:")
 	print(f"📊 Total articles in report: {total_in_report}")
 	for cat, items in categorized.items():
@@ -11,7 +11,8 @@ from src.rss_client import RSSClient
 from src.rss_feeds import RSS_FEEDS
 from src.site_scrapers import SiteScrapers
 from src.report import ReportBuilder
-from src.deduplication import deduplicate_articles
+from src.deduplication import cluster_articles
+from src.filter_stats import get_filter_stats
 from main_simple import is_relevant, classify_by_keywords, process_article
 
 
@@ -76,15 +77,9 @@ def main():
 		scraped_kept += 1
 	print(f"  Kept {scraped_kept} relevant scraped articles")
 
-	# Deduplicate within each category
+	# Cluster the same story across all categories (one pass)
 	print("🔄 Deduplicating articles...")
-	for cat_name in categorized.keys():
-		if categorized[cat_name]:
-			original_count = len(categorized[cat_name])
-			categorized[cat_name] = deduplicate_articles(categorized[cat_name])
-			deduped_count = len(categorized[cat_name])
-			if original_count != deduped_count:
-				print(f"  {cat_name}: {original_count} → {deduped_count}")
+	categorized = cluster_articles(categorized)
 	
 	# Add to report
 	for cat_name, items in categorized.items():
@@ -93,6 +88,9 @@ def main():
 		report.add_category_results(cat_name, items_sorted[:max_per_category], since=args.since)
 
 	output_path = report.write_markdown(output_dir=settings.output_dir)
+	stats = get_filter_stats()
+	print(stats.summary())
+	stats_path = stats.write(output_path)
 	
 	# Summary stats
 	total_collected = rss_kept + scraped_kept
@@ -100,6 +98,7 @@ def main():
 	
 	print(f"\n{'='*60}")
 	print(f"✅ Report saved to: {output_path}")
+	print(f"🔎 Filter stats saved to: {stats_path}")
 	print(f"📊 Collection summary:")
 	print(f"   RSS feeds: {rss_kept} articles")
 	print(f"   Web scrapers: {scraped_kept} articles")
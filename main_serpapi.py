@@ -11,7 +11,8 @@ from src.serpapi_client import SerpAPIClient
 from src.rss_client import RSSClient
 from src.rss_feeds import RSS_FEEDS
 from src.report import ReportBuilder
-from src.deduplication import deduplicate_articles
+from src.deduplication import cluster_articles
+from src.filter_stats import get_filter_stats
 from main_simple import is_relevant, classify_by_keywords, process_article
 
 
@@ -106,21 +107,23 @@ def main():
 			except Exception as e:
 				print(f"    Error: {e}")
 
-	# Deduplicate within each category
+	# Cluster the same story across all categories (one pass)
 	print("🔄 Deduplicating articles...")
-	for cat_name in categorized.keys():
-		if categorized[cat_name]:
-			categorized[cat_name] = deduplicate_articles(categorized[cat_name])
+	categorized = cluster_articles(categorized)
 	
 	# Add to report
 	for cat_name, items in categorized.items():
 		report.add_category_results(cat_name, items[:max_per_category], since=args.since)
 
 	output_path = report.write_markdown(output_dir=settings.output_dir)
+	stats = get_filter_stats()
+	print(stats.summary())
+	stats_path = stats.write(output_path)
 	
 	total = sum(len(items[:max_per_category]) for items in categorized.values())
 	print(f"\n{'='*60}")
 	print(f"✅ Report saved to: {output_path}")
+	print(f"🔎 Filter stats saved to: {stats_path}")
 	print(f"📊 Total articles in report: {total}")
 	for cat, items in categorized.items():
 		if items[:max_per_category]:
@@ -5,13 +5,18 @@ Fast collection, manual review in dashboard.
 """
 
 import argparse
+from typing import Dict, List, Optional, Set
+
 from src.config import Settings, ensure_output_dir
 from src.categories import CATEGORIES
 from src.gnews_client import GNewsClient
 from src.rss_client import RSSClient
 from src.rss_feeds import RSS_FEEDS
-from src.report import ReportBuilder
-from src.deduplication import deduplicate_articles
+from src.report import ReportBuilder, importance_level
+from src.batch_scoring import SOURCE_TAGS, score_articles
+from src.deduplication import cluster_articles
+from src.filter_stats import get_filter_stats
+from src.keyword_rules import get_keyword_rules
 
 
 AU_GOV_DOMAINS = [
@@ -27,199 +32,111 @@ def parse_args():
 	return parser.parse_args()
 
 
-def is_relevant(title: str, description: str) -> bool:
+def keyword_matches(title: str, description: str) -> Dict[str, Set[str]]:
+	"""Matched keywords per rule group for an article (rules from keyword_rules.json, compiled once)."""
+	return get_keyword_rules().match(title + " " + description)
+
+
+def is_relevant(title: str, description: str, matches: Optional[Dict[str, Set[str]]] = None) -> bool:
 	"""Filter out clearly irrelevant articles."""
-	text = (title + " " + description).lower()
+	if matches is None:
+		matches = keyword_matches(title, description)
 	
-	# Irrelevant topics (noise) - Updated based on user feedback
-	irrelevant_keywords = [
-		'sunscreen', 'spf', 'beauty', 'cosmetics',
-		'airline', 'flight', 'travel',
-		'iron ore', 'mining', 'bhp', 'lithium',
-		'health target', 'hospital', 'physiotherapist', 'nurse', 'medical',
-		'sport', 'rugby', 'cricket', 'athlete',
-		'fishing', 'orange roughy', 'blue cod',
-		'conservation', 'biodiversity', 'wilding',
-		'chatham islands', 'ship',
-		'homeschool', 'education',
-		'housing supply', 'housing crisis',
-		# Added from user feedback analysis - promotional/event content:
-		'webinar', 'promo', 'promotion', 'promotional',
-		'register now', 'join us', 'rsvp', 'event invitation',
-		'congress', 'conference', 'forum', 'summit', 'symposium',
-		'side events', 'networking event', 'panel discussion',
-		'whitepaper', 'white paper', 'download now', 'free report',
-		'podcast', 'bu podcast', 'enroll', 'enrollment', 'last day',
-		'deadline to register', 'market overview', 'industry overview',
-		'free guide', 'ebook', 'e-book', 'report download',
-		# Generic consumer tech (not financial services related):
-		'i tested', 'i tried', 'roku', 'sora 2', 'linux distro', 'ai video',
-		'streaming', 'tv streaming', 'zdnet', 'consumer tech', 'gadget',
-		# Geopolitical (not ANZ/financial specific):
-		'robert fico', 'slovakia', 'vetoes eu sanctions', 'russia sanctions',
-		'slovak pm', 'would-be assassin', '21-year sentence', 'shooting slovak',
-		# Auto-learned keywords disabled until learning algorithm is fixed
-		# (Previous auto-learning incorrectly blocked core relevant terms like 'banking', 'identity', 'australia')
-	]
-	
-	if any(keyword in text for keyword in irrelevant_keywords):
+	if "irrelevant" in matches:
 		return False
 	
-	# Relevant topics (signal) - Based on original brief
-	relevant_keywords = [
-		# Regulators and compliance
-		'asic', 'apra', 'accc', 'oaic', 'austrac', 'rbnz', 'fma', 'mbie',
-		'regulation', 'regulatory', 'compliance', 'enforcement', 'legislation',
-		'financial stability', 'monetary policy', 'reserve bank', 'central bank',
-		
-		# Financial services & Credit
-		'credit', 'lending', 'loan', 'debt', 'mortgage', 'borrower',
-		'bank', 'banking', 'financial services', 'credit union',
-		
-		# Competitors (from original brief)
-		'illion', 'experian', 'equifax', 'fico', 'gbg', 'creditor watch', 'centrix',
-		'bureau van dijk', 'dye & durham', 'dye and durham',
-		'credit bureau', 'credit reporting agency',
-		
-		# Credit & Risk (key topics from brief)
-		'credit reporting', 'credit score', 'credit bureau', 'credit check',
-		'risk management', 'risk assessment', 'credit risk',
-		'fraud prevention', 'fraud detection', 'anti-fraud',
-		'identity verification', 'identity check', 'digital identity',
-		'kyc', 'know your customer',
-		
-		# Data & Analytics (from brief)
-		'data analytics', 'data analysis', 'big data',
-		'data breach', 'privacy', 'data protection', 'gdpr', 'personal information',
-		'data sharing', 'data governance',
-		
-		# Technology & Emerging (from brief)
-		'open banking', 'cdr', 'consumer data right',
-		'fintech', 'regtech', 'ai', 'artificial intelligence', 'machine learning',
-		'blockchain', 'biometric', 'facial recognition',
-		
-		# AML/CTF (mentioned in brief)
-		'aml', 'anti-money laundering', 'ctf', 'counter-terrorism financing',
-		'sanctions', 'financial crime', 'money laundering',
-		
-		# Market activity
-		'acquisition', 'merger', 'm&a', 'takeover', 'ipo', 'funding', 'investment',
-		'partnership', 'collaboration', 'venture capital',
-		
-		# Consumer insights
-		'consumer behavior', 'consumer behaviour', 'consumer trend',
-		'affordability', 'cost of living', 'household finances',
-		
-		# Technology platforms
-		'api', 'platform', 'software', 'saas', 'cloud',
-		'integration', 'automation',
-	]
-	
-	if any(keyword in text for keyword in relevant_keywords):
-		return True
-	
-	# Default: not relevant
-	return False
+	# Relevant only with a signal keyword
+	return "relevant" in matches
 
 
-def classify_by_keywords(title: str, description: str) -> str:
+def classify_by_keywords(title: str, description: str, matches: Optional[Dict[str, Set[str]]] = None) -> str:
 	"""Simple keyword-based classification."""
-	text = (title + " " + description).lower()
+	if matches is None:
+		matches = keyword_matches(title, description)
 	
-	# Check each category
-	if any(word in text for word in ['illion', 'experian', 'equifax', 'fico', 'gbg', 'creditor', 'centrix', 'competitor', 'acquisition', 'merger', 'credit bureau', 'credit reporting']):
-		return "Competition"
-	
-	if any(word in text for word in ['regulation', 'regulatory', 'compliance', 'law', 'legislation', 'privacy', 'apra', 'asic', 'oaic', 'enforcement', 'data protection', 'aml', 'austrac']):
-		return "Regulation"
-	
-	if any(word in text for word in ['ai', 'artificial intelligence', 'blockchain', 'digital identity', 'open banking', 'fintech', 'technology', 'cdr', 'consumer data right']):
-		return "Disruptive Trends and Technological Advancements"
-	
-	if any(word in text for word in ['consumer', 'customer', 'household', 'spending', 'sentiment', 'behavior', 'behaviour', 'borrower', 'affordability']):
-		return "Consumer Behaviour and Insights"
-	
-	if any(word in text for word in ['market', 'industry', 'trend', 'growth', 'forecast', 'ipo', 'funding', 'investment']):
-		return "Market Trends"
+	# Checked in order; the first category with a match wins
+	for category in get_keyword_rules().categories:
+		if f"category:{category}" in matches:
+			return category
 	
 	# Default
 	return "Regulation"
 
 
-def is_corporate_pr(title: str, description: str, url: str) -> bool:
+def keyword_score(matches: Dict[str, Set[str]]) -> int:
+	"""Simple importance score: 50 plus each matched boost, capped at 100."""
+	boosts = get_keyword_rules().score_boosts
+	score = 50 + sum(boost for i, boost in enumerate(boosts) if f"boost:{i}" in matches)
+	return min(score, 100)
+
+
+def is_corporate_pr(title: str, description: str, url: str, matches: Optional[Dict[str, Set[str]]] = None) -> bool:
 	"""Detect corporate PR/product announcements (low news value)."""
-	text = (title + " " + description).lower()
-	
-	# Corporate PR patterns
-	pr_patterns = [
-		'launches', 'unveils', 'announces', 'introduces', 'releases',
-		'adds', 'upgrades', 'secures funding', 'wins', 'reaches',
-		'offers', 'provides', 'delivers', 'expands', 'partners with',
-		'integrates', 'deploys', 'implements', 'rolls out'
-	]
+	# Only Biometric Update PR is filtered; other sources never need the scan
+	if 'biometricupdate.com' not in url:
+		return False
+	if matches is None:
+		matches = keyword_matches(title, description)
 	
 	# If from Biometric Update and contains PR language, it's likely corporate PR
-	if 'biometricupdate.com' in url and any(pattern in text for pattern in pr_patterns):
+	if "pr" in matches:
 		# Exception: If it mentions ANZ-specific locations/regulators, keep it
-		anz_keywords = ['australia', 'new zealand', 'australian', 'apra', 'asic', 'rbnz']
-		if any(kw in text for kw in anz_keywords):
+		if "anz" in matches:
 			return False  # Keep ANZ-relevant PR
 		return True  # Filter out global corporate PR
 	
 	return False
 
 
+def add_source_tag_matches(article: dict, matches: Dict[str, Set[str]],
+                           tag_matches: Optional[Dict[str, Dict[str, Set[str]]]] = None) -> None:
+	"""Add the keywords of the article's "[RSS]"/"[Legislation]" title tag (pre-matched in tag_matches, if given) to its matches."""
+	source_type = article.get("_source_type")
+	if source_type in SOURCE_TAGS:
+		# The tag counts for classification and scoring (e.g. "legislation"); no keyword spans the "]"
+		found = tag_matches[source_type] if tag_matches else get_keyword_rules().match(f"[{source_type}]")
+		for group, words in found.items():
+			matches.setdefault(group, set()).update(words)
+
+
 def process_article(article: dict, default_category: str) -> dict:
 	"""Simple processing without GPT."""
 	title = article.get("title", "Untitled")
 	description = article.get("description", "")
 	url = article.get("url", "")
+	matches = keyword_matches(title, description)
+	stats = get_filter_stats()
 	
 	# Filter out irrelevant articles
-	if not is_relevant(title, description):
+	if not is_relevant(title, description, matches):
+		stats.record(article, "irrelevant keyword" if "irrelevant" in matches else "no relevant keyword", matches)
 		return None
 	
 	# Filter out low-value corporate PR (unless ANZ-specific)
-	if is_corporate_pr(title, description, url):
+	if is_corporate_pr(title, description, url, matches):
+		stats.record(article, "corporate PR", matches)
 		return None
 	
 	# Add source tag
-	source_type = article.get("_source_type")
-	if source_type in ("RSS", "Legislation"):
-		title = f"[{source_type}] {title}"
+	add_source_tag_matches(article, matches)
 	
 	# Simple keyword classification
-	category = classify_by_keywords(title, description)
+	category = classify_by_keywords(title, description, matches)
 	
 	# Simple importance scoring
-	score = 50  # Default
-	text = (title + " " + description).lower()
-	
-	# Boost for high-value keywords
-	if any(word in text for word in ['financial stability', 'reserve bank', 'rba', 'central bank', 'monetary policy']):
-		score += 30  # RBA/central bank content is very important
-	if any(word in text for word in ['asic', 'apra', 'enforcement', 'fraud', 'breach', 'investigation']):
-		score += 20
-	if any(word in text for word in ['acquisition', 'merger', 'ipo']):
-		score += 15
-	if any(word in text for word in ['privacy', 'data protection', 'compliance']):
-		score += 10
-	
-	# Cap at 100
-	score = min(score, 100)
-	
-	# Label
-	if score >= 91:
-		label = "Very Important"
-	elif score >= 75:
-		label = "Important"
-	elif score >= 50:
-		label = "Moderately Important"
-	elif score >= 25:
-		label = "Less Important"
-	else:
-		label = "Not Important"
+	score = keyword_score(matches)
+	stats.record(article, matches=matches)
 	
+	return article_result(article, category, score, importance_level(score))
+
+
+def article_result(article: dict, category: str, score: int, label: str) -> dict:
+	"""Report item for a kept article."""
+	title = article.get("title", "Untitled")
+	description = article.get("description", "")
+	source_type = article.get("_source_type")
+	if source_type in SOURCE_TAGS:
+		title = f"[{source_type}] {title}"
 	return {
 		"title": title,
 		"summary": description[:300] if description else "No summary available",
@@ -231,6 +148,36 @@ def process_article(article: dict, default_category: str) -> dict:
 	}
 
 
+def process_articles(articles: List[dict], chunk_size: int = 1000) -> List[Optional[dict]]:
+	"""process_article() for a whole batch, scored with NumPy (see src.batch_scoring); None for dropped articles."""
+	results = []
+	# Chunks keep the live keyword matches small (the garbage collector rescans them all as they grow)
+	for start in range(0, len(articles), chunk_size):
+		results.extend(_process_chunk(articles[start:start + chunk_size]))
+	return results
+
+
+def _process_chunk(articles: List[dict]) -> List[Optional[dict]]:
+	scores = score_articles(articles)
+	stats = get_filter_stats()
+	results = []
+	# Plain Python values: per-element NumPy indexing would cost more than the scoring
+	columns = zip(articles, scores.matches, scores.relevant.tolist(), scores.corporate_pr.tolist(),
+	              scores.category.tolist(), scores.score.tolist(), scores.label.tolist())
+	for article, matches, relevant, corporate_pr, category, score, label in columns:
+		if not relevant:
+			stats.record(article, "irrelevant keyword" if "irrelevant" in matches else "no relevant keyword", matches)
+			results.append(None)
+		elif corporate_pr:
+			stats.record(article, "corporate PR", matches)
+			results.append(None)
+		else:
+			add_source_tag_matches(article, matches, scores.tag_matches)
+			stats.record(article, matches=matches)
+			results.append(article_result(article, category, score, label))
+	return results
+
+
 def main():
 	print("✅ Starting simple collection mode (no GPT)...")
 	args = parse_args()
@@ -295,21 +242,23 @@ def main():
 		except Exception as e:
 			print(f"    Error: {e}")
 
-	# Deduplicate within each category
+	# Cluster the same story across all categories (one pass)
 	print("🔄 Deduplicating articles...")
-	for cat_name in categorized.keys():
-		if categorized[cat_name]:
-			categorized[cat_name] = deduplicate_articles(categorized[cat_name])
+	categorized = cluster_articles(categorized)
 	
 	# Add to report
 	for cat_name, items in categorized.items():
 		report.add_category_results(cat_name, items[:max_per_category], since=args.since)
 
 	output_path = report.write_markdown(output_dir=settings.output_dir)
+	stats = get_filter_stats()
+	print(stats.summary())
+	stats_path = stats.write(output_path)
 	
 	total = sum(len(items[:max_per_category]) for items in categorized.values())
 	print(f"\n{'='*60}")
 	print(f"✅ Report saved to: {output_path}")
+	print(f"🔎 Filter stats saved to: {stats_path}")
 	print(f"📊 Total articles in report: {total}")
 	for cat, items in categorized.items():
 		if items:
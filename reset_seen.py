@@ -2,13 +2,14 @@
 """
 Reset the seen articles tracker to get a fresh batch.
 Use this when you want to re-run and see more articles.
+Story fingerprints are trimmed to the same window, so stories reported earlier
+under another URL come back too.
 """
 
 import os
-import json
-from datetime import datetime, timedelta
 
-SEEN_FILE = "seen_articles.jsonl"
+from src.seen_tracker import SEEN_DB, SeenStore
+from src.simhash_store import FINGERPRINT_FILE, SimHashStore
 
 
 def reset_seen(keep_days: int = 0):
@@ -20,46 +21,32 @@ def reset_seen(keep_days: int = 0):
 		           7 = keep last week
 		           30 = keep last month
 	"""
-	if not os.path.exists(SEEN_FILE):
-		print("No seen articles file found - nothing to reset")
+	if not os.path.exists(SEEN_DB) and not os.path.exists(FINGERPRINT_FILE):
+		print("No seen articles database or story fingerprints found - nothing to reset")
 		return
 	
-	# Count current entries
-	with open(SEEN_FILE, 'r') as f:
-		total_before = sum(1 for _ in f)
+	store = SeenStore(legacy_path=None)
+	total_before = store.count()
+	# Loading with the window drops older fingerprints; cleanup() rewrites the file without them
+	fingerprints = SimHashStore(days_to_keep=keep_days if keep_days else -1)
+	fingerprints.cleanup()
 	
 	if keep_days == 0:
 		# Full reset
-		os.remove(SEEN_FILE)
+		store.cleanup(days_to_keep=-1)
+		store.rebuild_bloom()
 		print(f"✅ Reset complete!")
-		print(f"   Removed {total_before} seen articles")
+		print(f"   Removed {total_before} seen articles and all story fingerprints")
 		print(f"   Next run will show ALL articles as new")
 	else:
 		# Partial reset - keep recent entries
-		cutoff = datetime.now() - timedelta(days=keep_days)
-		kept = []
+		store.cleanup(days_to_keep=keep_days)
+		store.rebuild_bloom()
+		kept = store.count()
 		
-		with open(SEEN_FILE, 'r') as f:
-			for line in f:
-				try:
-					entry = json.loads(line)
-					timestamp = entry.get('timestamp')
-					if timestamp:
-						entry_date = datetime.fromisoformat(timestamp)
-						if entry_date >= cutoff:
-							kept.append(line)
-				except:
-					pass
-		
-		# Rewrite file
-		with open(SEEN_FILE, 'w') as f:
-			for line in kept:
-				f.write(line)
-		
-		removed = total_before - len(kept)
 		print(f"✅ Partial reset complete!")
-		print(f"   Kept {len(kept)} articles from last {keep_days} days")
-		print(f"   Removed {removed} older articles")
+		print(f"   Kept {kept} articles and {len(fingerprints.entries)} story fingerprints from last {keep_days} days")
+		print(f"   Removed {total_before - kept} older articles")
 		print(f"   Next run will show articles older than {keep_days} days as new")
 
 
@@ -0,0 +1,204 @@
+"""
+Offline bulk classification through the OpenAI Batch API file format.
+Every pending article becomes one /v1/chat/completions line in a JSONL request
+file; the file is submitted, polled until the batch finishes, and the response
+file is merged back into classification results.
+LocalBatchStub answers request files locally so the whole flow runs offline.
+"""
+
+import json
+import os
+import re
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from src.nlp import MAX_RESPONSE_TOKENS, OpenAINLP
+
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_DIR = "batches"
+TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+
+def build_requests(nlp: OpenAINLP, jobs: List[Tuple[Dict, str]]) -> List[Dict]:
+	"""One Batch API request line per (article, default_category) job, custom_id = job index."""
+	return [
+		{
+			"custom_id": f"item-{i}",
+			"method": "POST",
+			"url": BATCH_ENDPOINT,
+			"body": {
+				"model": nlp.model,
+				"messages": nlp.messages_for(article, default_category),
+				"temperature": 0.2,
+				"max_tokens": MAX_RESPONSE_TOKENS,
+			},
+		}
+		for i, (article, default_category) in enumerate(jobs)
+	]
+
+
+def write_jsonl(path: str, lines: List[Dict]) -> None:
+	with open(path, "w", encoding="utf-8") as f:
+		for line in lines:
+			f.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+
+def read_jsonl(path: str) -> List[Dict]:
+	with open(path, "r", encoding="utf-8") as f:
+		return [json.loads(line) for line in f if line.strip()]
+
+
+def read_responses(path: str) -> Dict[str, str]:
+	"""Map custom_id -> completion text for every successful line of a response file."""
+	texts: Dict[str, str] = {}
+	for line in read_jsonl(path):
+		response = line.get("response") or {}
+		if line.get("error") or response.get("status_code") != 200:
+			continue
+		try:
+			texts[line["custom_id"]] = response["body"]["choices"][0]["message"]["content"] or "{}"
+		except (KeyError, IndexError, TypeError):
+			continue
+	return texts
+
+
+class OpenAIBatchRunner:
+	"""Submits request files to the OpenAI Batch API and downloads the results."""
+
+	cache_results = True
+
+	def __init__(self, nlp: OpenAINLP, poll_interval: float = 60.0) -> None:
+		self.client = nlp.client
+		self.poll_interval = poll_interval
+
+	def submit(self, request_path: str) -> str:
+		with open(request_path, "rb") as f:
+			uploaded = self.client.files.create(file=f, purpose="batch")
+		batch = self.client.batches.create(
+			input_file_id=uploaded.id,
+			endpoint=BATCH_ENDPOINT,
+			completion_window="24h",
+		)
+		return batch.id
+
+	def wait(self, batch_id: str, response_path: str) -> Optional[str]:
+		"""Poll until the batch is done; write its output file to response_path (None if it produced none)."""
+		while True:
+			batch = self.client.batches.retrieve(batch_id)
+			counts = batch.request_counts
+			done = f"{counts.completed + counts.failed}/{counts.total}" if counts else "?"
+			print(f"    Batch {batch_id}: {batch.status} ({done})")
+			if batch.status in TERMINAL_STATUSES:
+				break
+			time.sleep(self.poll_interval)
+		if not batch.output_file_id:
+			return None
+		content = self.client.files.content(batch.output_file_id)
+		with open(response_path, "wb") as f:
+			f.write(content.read())
+		return response_path
+
+
+class LocalBatchStub:
+	"""
+	Offline stand-in for OpenAIBatchRunner.
+	Answers each request line with a Batch API response line whose completion echoes
+	the article's title and description at a moderate score in its default category.
+	Its answers are never written to the LLM cache.
+	"""
+
+	cache_results = False
+
+	def __init__(self) -> None:
+		self._requests: Dict[str, str] = {}
+
+	def submit(self, request_path: str) -> str:
+		batch_id = f"batch_local_{uuid.uuid4().hex[:12]}"
+		self._requests[batch_id] = request_path
+		return batch_id
+
+	def _complete(self, body: Dict) -> str:
+		prompt = body["messages"][-1]["content"]
+
+		def field(name: str) -> str:
+			match = re.search(rf"^{name}: (.*)$", prompt, re.MULTILINE)
+			return match.group(1).strip() if match else ""
+
+		category = re.search(r"Default category: (.*?)\. Return only JSON", prompt)
+		return json.dumps({
+			"title": field("Title") or "Untitled",
+			"summary": field("Desc"),
+			"importance_score": 50,
+			"importance_label": "Moderately Important",
+			"category": category.group(1) if category else "",
+			"link": field("URL"),
+		})
+
+	def wait(self, batch_id: str, response_path: str) -> Optional[str]:
+		lines = []
+		for request in read_jsonl(self._requests.pop(batch_id)):
+			lines.append({
+				"id": f"batch_req_{uuid.uuid4().hex[:12]}",
+				"custom_id": request["custom_id"],
+				"response": {
+					"status_code": 200,
+					"request_id": uuid.uuid4().hex,
+					"body": {
+						"object": "chat.completion",
+						"model": request["body"]["model"],
+						"choices": [{
+							"index": 0,
+							"message": {"role": "assistant", "content": self._complete(request["body"])},
+							"finish_reason": "stop",
+						}],
+					},
+				},
+				"error": None,
+			})
+		write_jsonl(response_path, lines)
+		print(f"    Batch {batch_id}: completed ({len(lines)}/{len(lines)}) [local stub]")
+		return response_path
+
+
+def run_batch(nlp: OpenAINLP, jobs: List[Tuple[Dict, str]], runner, batch_dir: str = BATCH_DIR) -> List[Dict]:
+	"""
+	Classify (article, default_category) pairs through a batch runner; results keep input order.
+	Cache hits and confident local decisions are resolved first; only the rest are written to the request file.
+	Items missing from the response file get the same fallback object as process_article.
+	"""
+	results: List[Optional[Dict]] = [None] * len(jobs)
+	misses: List[int] = []
+	for i, (article, default_category) in enumerate(jobs):
+		resolved = nlp.resolve_locally(article, default_category)
+		if resolved is not None:
+			results[i] = nlp.finalize_result(resolved, article)
+		else:
+			misses.append(i)
+	if not misses:
+		return results
+
+	os.makedirs(batch_dir, exist_ok=True)
+	stamp = time.strftime("%Y%m%d-%H%M%S")
+	request_path = os.path.join(batch_dir, f"requests-{stamp}.jsonl")
+	response_path = os.path.join(batch_dir, f"responses-{stamp}.jsonl")
+	pending = [jobs[i] for i in misses]
+	write_jsonl(request_path, build_requests(nlp, pending))
+	print(f"  Wrote {len(pending)} requests to {request_path}")
+
+	batch_id = runner.submit(request_path)
+	print(f"  Submitted batch {batch_id}")
+	output = runner.wait(batch_id, response_path)
+	texts = read_responses(output) if output else {}
+	print(f"  Merging {len(texts)}/{len(pending)} responses")
+
+	for j, i in enumerate(misses):
+		article, default_category = jobs[i]
+		text = texts.get(f"item-{j}")
+		if text is None:
+			obj = nlp.fallback_result(article, default_category)
+		else:
+			obj = nlp.parse_result(text, article, default_category, store=runner.cache_results)
+		results[i] = nlp.finalize_result(obj, article)
+	return results
@@ -0,0 +1,109 @@
+"""
+Batch keyword scoring: relevance, corporate-PR filter, category, importance
+score and label for a whole run's articles at once.
+Each article is scanned once by the compiled keyword matcher. The hits become a
+document-by-rule-group matrix (one boolean column per group of
+KeywordRules.groups()), and every decision is a NumPy operation over its
+columns. The results are the same as main_simple's per-article functions.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+from src.keyword_rules import KeywordRules, get_keyword_rules
+from src.report import IMPORTANCE_LEVELS, NOT_IMPORTANT
+
+
+BASE_SCORE = 50
+MAX_SCORE = 100
+DEFAULT_CATEGORY = "Regulation"
+# Corporate PR is only filtered from this site
+PR_DOMAIN = "biometricupdate.com"
+# _source_type values whose "[tag]" title prefix counts for category and score
+SOURCE_TAGS = ("RSS", "Legislation")
+
+
+@dataclass
+class BatchScores:
+	"""Per-article results, aligned with the input articles."""
+	matches: List[Dict[str, Set[str]]]  # matched keywords per group, before source tags
+	tag_matches: Dict[str, Dict[str, Set[str]]]  # matched keywords per group of each "[tag]" in SOURCE_TAGS
+	relevant: np.ndarray  # bool: passes is_relevant()
+	corporate_pr: np.ndarray  # bool: is_corporate_pr()
+	category: np.ndarray  # classify_by_keywords(), with the source tag
+	score: np.ndarray  # keyword_score(), with the source tag
+	label: np.ndarray  # importance_level() of score
+
+	@property
+	def kept(self) -> np.ndarray:
+		"""Articles process_article() would keep."""
+		return self.relevant & ~self.corporate_pr
+
+
+def match_matrix(matches: Sequence[Dict[str, Set[str]]], columns: Sequence[str]) -> np.ndarray:
+	"""Boolean (articles x columns) matrix, True where the article matched the group."""
+	index = {group: i for i, group in enumerate(columns)}
+	rows = [row for row, found in enumerate(matches) for _ in found]
+	cols = [index[group] for found in matches for group in found]
+	matrix = np.zeros((len(matches), len(columns)), dtype=bool)
+	matrix[rows, cols] = True
+	return matrix
+
+
+def importance_labels(scores: np.ndarray) -> np.ndarray:
+	"""importance_level() of every score."""
+	minimums = np.array([minimum for minimum, _ in reversed(IMPORTANCE_LEVELS)])
+	labels = np.array([NOT_IMPORTANT] + [label for _, label in reversed(IMPORTANCE_LEVELS)], dtype=object)
+	return labels[np.searchsorted(minimums, scores, side="right")]
+
+
+def score_articles(articles: Sequence[Dict], rules: Optional[KeywordRules] = None,
+                   matches: Optional[List[Dict[str, Set[str]]]] = None) -> BatchScores:
+	"""
+	Score articles (dicts with title, description, url and optional _source_type) in one batch.
+	matches, if given, are the articles' keyword_matches() from an earlier scan.
+	"""
+	rules = rules or get_keyword_rules()
+	if matches is None:
+		matches = [rules.match(article.get("title", "Untitled") + " " + article.get("description", ""))
+		           for article in articles]
+	columns = list(rules.groups())
+	column = {group: i for i, group in enumerate(columns)}
+	hits = match_matrix(matches, columns)
+
+	relevant = ~hits[:, column["irrelevant"]] & hits[:, column["relevant"]]
+	urls = np.array([article.get("url", "") for article in articles], dtype=str)
+	on_pr_site = np.char.find(urls, PR_DOMAIN) >= 0
+	corporate_pr = on_pr_site & hits[:, column["pr"]] & ~hits[:, column["anz"]]
+
+	# Category and score also see the "[RSS]"/"[Legislation]" tag added to the title
+	tags = np.array([article.get("_source_type") or "" for article in articles], dtype=object)
+	tag_matches = {tag: rules.match(f"[{tag}]") for tag in SOURCE_TAGS}
+	for tag, found in tag_matches.items():
+		if found:
+			hits[tags == tag] |= match_matrix([found], columns)[0]
+
+	categories = rules.categories
+	category = np.full(len(articles), DEFAULT_CATEGORY, dtype=object)
+	if categories:
+		in_category = hits[:, [column[f"category:{name}"] for name in categories]]
+		# argmax picks the first matching category, as the in-order checks do
+		first = in_category.argmax(axis=1)
+		found = in_category.any(axis=1)
+		category[found] = np.array(categories, dtype=object)[first[found]]
+
+	boosts = np.array(rules.score_boosts, dtype=np.int64)
+	boost_hits = hits[:, [column[f"boost:{i}"] for i in range(len(boosts))]]
+	score = np.minimum(BASE_SCORE + boost_hits.astype(np.int64) @ boosts, MAX_SCORE)
+
+	return BatchScores(
+		matches=matches,
+		tag_matches=tag_matches,
+		relevant=relevant,
+		corporate_pr=corporate_pr,
+		category=category,
+		score=score,
+		label=importance_labels(score),
+	)
@@ -0,0 +1,85 @@
+"""
+Persisted, memory-mapped Bloom filter for URL membership checks.
+A miss means "definitely not present", so callers only consult the exact store
+(SQLite, feedback file) on possible hits. The bit array lives in a file and is
+mmapped, so opening it costs the same no matter how many URLs it holds.
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Iterable
+
+
+MAGIC = b"BLM1"
+# magic, bit count, hash count, capacity, items added
+HEADER = struct.Struct("<4sQIQQ")
+
+
+class BloomFilter:
+	def __init__(self, path: str, capacity: int = 500000, error_rate: float = 0.001) -> None:
+		self.path = path
+		self._lock = threading.Lock()
+		if not os.path.exists(path):
+			self._create(capacity, error_rate)
+		self._file = open(path, "r+b")
+		self._mm = mmap.mmap(self._file.fileno(), 0)
+		magic, self.num_bits, self.num_hashes, self.capacity, _ = HEADER.unpack_from(self._mm, 0)
+		if magic != MAGIC:
+			raise ValueError(f"{path} is not a Bloom filter file")
+
+	def _create(self, capacity: int, error_rate: float) -> None:
+		num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+		num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+		with open(self.path, "wb") as f:
+			f.write(HEADER.pack(MAGIC, num_bits, num_hashes, capacity, 0))
+			f.truncate(HEADER.size + (num_bits + 7) // 8)
+
+	@property
+	def count(self) -> int:
+		"""Items added since the filter was created or cleared."""
+		return HEADER.unpack_from(self._mm, 0)[4]
+
+	@property
+	def saturated(self) -> bool:
+		"""More items than the filter was sized for; false positives climb past error_rate."""
+		return self.count > self.capacity
+
+	def _positions(self, key: str):
+		digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+		h1, h2 = struct.unpack("<QQ", digest)
+		# Double hashing: k positions from two independent 64-bit hashes
+		for i in range(self.num_hashes):
+			yield (h1 + i * h2) % self.num_bits
+
+	def __contains__(self, key: str) -> bool:
+		mm = self._mm
+		return all(mm[HEADER.size + (bit >> 3)] & (1 << (bit & 7)) for bit in self._positions(key))
+
+	def add(self, keys: Iterable[str]) -> None:
+		with self._lock:
+			mm = self._mm
+			added = 0
+			for key in keys:
+				for bit in self._positions(key):
+					offset = HEADER.size + (bit >> 3)
+					mm[offset] |= 1 << (bit & 7)
+				added += 1
+			magic, num_bits, num_hashes, capacity, count = HEADER.unpack_from(mm, 0)
+			HEADER.pack_into(mm, 0, magic, num_bits, num_hashes, capacity, count + added)
+			mm.flush()
+
+	def clear(self) -> None:
+		"""Reset every bit (e.g. before rebuilding from the exact store after expiry)."""
+		with self._lock:
+			size = (self.num_bits + 7) // 8
+			self._mm[HEADER.size:HEADER.size + size] = bytes(size)
+			HEADER.pack_into(self._mm, 0, MAGIC, self.num_bits, self.num_hashes, self.capacity, 0)
+			self._mm.flush()
+
+	def close(self) -> None:
+		self._mm.close()
+		self._file.close()
@@ -10,12 +10,26 @@ load_dotenv()
 class Settings:
 	openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
 	openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+	# OpenAI account limits (defaults match the free tier) and parallel request workers
+	openai_rpm: float = float(os.getenv("OPENAI_RPM", "3"))
+	openai_tpm: float = float(os.getenv("OPENAI_TPM", "40000"))
+	openai_concurrency: int = int(os.getenv("OPENAI_CONCURRENCY", "4"))
+	# Articles per chat completion (1 = one request per article) and the response budget per batch
+	openai_batch_size: int = int(os.getenv("OPENAI_BATCH_SIZE", "1"))
+	openai_batch_max_tokens: int = int(os.getenv("OPENAI_BATCH_MAX_TOKENS", "4000"))
 	newsapi_api_key: str = os.getenv("NEWSAPI_API_KEY", "")
 	gnews_api_key: str = os.getenv("GNEWS_API_KEY", "")
 	serpapi_key: str = os.getenv("SERPAPI_KEY", "")
 	max_articles_per_category: int = int(os.getenv("MAX_ARTICLES_PER_CATEGORY", "10"))
 	output_dir: str = os.getenv("OUTPUT_DIR", "reports")
 	
+	# LLM result cache (skips re-classifying articles seen in earlier runs)
+	llm_cache_path: str = os.getenv("LLM_CACHE_PATH", "llm_cache.db")
+	llm_cache_ttl_days: int = int(os.getenv("LLM_CACHE_TTL_DAYS", "30"))
+	llm_cache_max_entries: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "20000"))
+	# Local classifier cascade: predictions at least this confident skip the LLM
+	local_confidence_threshold: float = float(os.getenv("LOCAL_CONFIDENCE_THRESHOLD", "0.85"))
+	
 	# Email settings (optional)
 	email_enabled: bool = os.getenv("EMAIL_ENABLED", "false").lower() == "true"
 	email_to: str = os.getenv("EMAIL_TO", "")
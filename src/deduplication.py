@@ -3,10 +3,14 @@ Smart deduplication: Remove duplicate articles by content similarity, not just U
 Keep the best article for each topic.
 """
 
-from typing import List, Dict
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import List, Dict, Set
 import re
 from difflib import SequenceMatcher
 
+from src.minhash import LSHIndex, MinHasher
+
 
 def normalize_title(title: str) -> str:
 	"""Normalize title for comparison."""
@@ -60,79 +64,255 @@ def topics_similar(article1: Dict, article2: Dict, threshold: int = 3) -> bool:
 	return len(common) >= threshold
 
 
-def choose_best_article(articles: List[Dict]) -> Dict:
-	"""Choose the best article from duplicates."""
+PREMIUM_SOURCES = ['australian financial review', 'bloomberg', 'reuters', 'financial times']
+QUALITY_SOURCES = ['abc', 'sydney morning herald', 'the guardian', 'the age']
+
+
+def article_quality(article: Dict) -> float:
+	"""Score used to pick the best article among duplicates."""
 	# Preference order:
 	# 1. Higher importance score
 	# 2. Longer/better summary
 	# 3. Better source (AFR, Bloomberg, Reuters > ABC, SMH > Others)
+	score = article.get('importance_score', 50)
 	
-	premium_sources = ['australian financial review', 'bloomberg', 'reuters', 'financial times']
-	quality_sources = ['abc', 'sydney morning herald', 'the guardian', 'the age']
+	# Boost for better sources
+	source = (article.get('source') or '').lower()
+	if any(ps in source for ps in PREMIUM_SOURCES):
+		score += 20
+	elif any(qs in source for qs in QUALITY_SOURCES):
+		score += 10
 	
-	def score_article(article: Dict) -> float:
-		score = article.get('importance_score', 50)
-		
-		# Boost for better sources
-		source = (article.get('source') or '').lower()
-		if any(ps in source for ps in premium_sources):
-			score += 20
-		elif any(qs in source for qs in quality_sources):
-			score += 10
-		
-		# Boost for longer summaries (more detail)
-		summary_len = len(article.get('summary', '') or article.get('description', ''))
-		score += min(summary_len / 50, 10)  # Up to +10 for long summaries
-		
-		# Boost for [RSS] or [Legislation] tags (direct from source)
-		if article.get('title', '').startswith('['):
-			score += 5
-		
-		return score
+	# Boost for longer summaries (more detail)
+	summary_len = len(article.get('summary', '') or article.get('description', ''))
+	score += min(summary_len / 50, 10)  # Up to +10 for long summaries
+	
+	# Boost for [RSS] or [Legislation] tags (direct from source)
+	if article.get('title', '').startswith('['):
+		score += 5
 	
-	return max(articles, key=score_article)
+	return score
+
+
+def choose_best_article(articles: List[Dict]) -> Dict:
+	"""Choose the best article from duplicates."""
+	return max(articles, key=article_quality)
+
+
+@dataclass(frozen=True)
+class DedupFeatures:
+	"""Everything the dedup pass compares, computed once per article."""
+	title: str  # normalize_title() of the title
+	terms: frozenset  # extract_key_terms() of title + summary
+	quality: float  # article_quality()
+
+
+def article_features(article: Dict) -> DedupFeatures:
+	return DedupFeatures(
+		title=normalize_title(article.get('title', '')),
+		terms=frozenset(extract_key_terms(
+			article.get('title', ''),
+			article.get('summary', '') or article.get('description', '')
+		)),
+		quality=article_quality(article),
+	)
+
+
+def features_titles_similar(f1: DedupFeatures, f2: DedupFeatures, threshold: float = 0.7) -> bool:
+	"""titles_similar() on precomputed normalized titles."""
+	matcher = SequenceMatcher(None, f1.title, f2.title)
+	# The quick ratios are upper bounds of ratio(), so they only reject pairs ratio() would reject
+	return (matcher.real_quick_ratio() >= threshold
+	        and matcher.quick_ratio() >= threshold
+	        and matcher.ratio() >= threshold)
+
+
+def titles_match(f1: DedupFeatures, f2: DedupFeatures, threshold: float = 0.7) -> bool:
+	"""features_titles_similar() with the titles in a fixed order (SequenceMatcher is not symmetric)."""
+	if f2.title < f1.title:
+		f1, f2 = f2, f1
+	return features_titles_similar(f1, f2, threshold)
+
+
+def features_topics_similar(f1: DedupFeatures, f2: DedupFeatures, threshold: int = 3) -> bool:
+	"""topics_similar() on precomputed term sets."""
+	return len(f1.terms & f2.terms) >= threshold
+
 
+def feature_shingles(features: DedupFeatures) -> set:
+	"""Shingles for MinHash: character 4-grams of the normalized title plus key terms."""
+	title = features.title
+	shingles = {"c:" + title[i:i + 4] for i in range(max(1, len(title) - 3))}
+	shingles.update("t:" + term for term in features.terms)
+	return shingles
 
-def deduplicate_articles(articles: List[Dict], similarity_threshold: float = 0.7) -> List[Dict]:
+
+class TermIndex:
+	"""Inverted index from key term to kept-article slots, for exact topic candidates."""
+
+	def __init__(self) -> None:
+		self._postings: Dict[str, Set[int]] = {}
+
+	def add(self, slot: int, terms: frozenset) -> None:
+		for term in terms:
+			self._postings.setdefault(term, set()).add(slot)
+
+	def remove(self, slot: int, terms: frozenset) -> None:
+		for term in terms:
+			postings = self._postings.get(term)
+			if postings is not None:
+				postings.discard(slot)
+				if not postings:
+					del self._postings[term]
+
+	def matches(self, terms: frozenset, threshold: int) -> Set[int]:
+		"""Slots sharing at least `threshold` terms, i.e. every slot features_topics_similar() accepts."""
+		counts = Counter()
+		for term in terms:
+			counts.update(self._postings.get(term, ()))
+		return {slot for slot, count in counts.items() if count >= threshold}
+
+
+def deduplicate_articles(articles: List[Dict], similarity_threshold: float = 0.7, topic_threshold: int = 3,
+                         num_perm: int = 64, bands: int = 16) -> List[Dict]:
 	"""
 	Remove duplicate articles by content similarity.
 	Keeps the best article for each topic.
+	Title candidates come from MinHash/LSH bucket collisions (num_perm hashes in `bands` bands)
+	and only those get the exact title check; topic matches come straight from an inverted term index.
 	"""
 	if not articles:
 		return []
 	
 	unique_articles = []
-	seen_topics = []
+	seen_topics: List[DedupFeatures] = []
+	hasher = MinHasher(num_perm)
+	index = LSHIndex(num_perm, bands)
+	terms_index = TermIndex()
 	
 	for article in articles:
-		# Check if this article is similar to any we've already added
+		features = article_features(article)
+		signature = hasher.signature(feature_shingles(features))
+		# Check if this article is similar to any we've already added (in the order they were added)
 		is_duplicate = False
+		topic_matches = terms_index.matches(features.terms, topic_threshold)
 		
-		for i, existing in enumerate(seen_topics):
-			# Check title similarity
-			if titles_similar(article.get('title', ''), existing.get('title', ''), similarity_threshold):
+		for i in sorted(index.query(signature) | topic_matches):
+			existing = seen_topics[i]
+			# Similar title, or same topic (different angle)
+			if i in topic_matches or features_titles_similar(features, existing, similarity_threshold):
 				is_duplicate = True
-				# Replace with better article if current one is better
-				if choose_best_article([article, existing]) == article:
+				# Replace with better article if current one is better (ties go to the newcomer, as before)
+				if features.quality >= existing.quality:
 					unique_articles[i] = article
-					seen_topics[i] = article
-				break
-			
-			# Check topic similarity (same topic, different angle)
-			if topics_similar(article, existing):
-				is_duplicate = True
-				# Keep the better one
-				if choose_best_article([article, existing]) == article:
-					unique_articles[i] = article
-					seen_topics[i] = article
+					seen_topics[i] = features
+					# The slot now also answers to the replacement's buckets, and only to its terms
+					index.add(i, signature)
+					terms_index.remove(i, existing.terms)
+					terms_index.add(i, features.terms)
 				break
 		
 		if not is_duplicate:
+			index.add(len(unique_articles), signature)
+			terms_index.add(len(unique_articles), features.terms)
 			unique_articles.append(article)
-			seen_topics.append(article)
+			seen_topics.append(features)
 	
 	print(f"    Deduplication: {len(articles)} → {len(unique_articles)} articles (removed {len(articles) - len(unique_articles)} duplicates)")
 	
 	return unique_articles
 
 
+class UnionFind:
+	def __init__(self, size: int) -> None:
+		self.parent = list(range(size))
+
+	def find(self, x: int) -> int:
+		while self.parent[x] != x:
+			self.parent[x] = self.parent[self.parent[x]]
+			x = self.parent[x]
+		return x
+
+	def union(self, a: int, b: int) -> None:
+		root_a, root_b = self.find(a), self.find(b)
+		if root_a != root_b:
+			self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def cluster_articles(categorized: Dict[str, List[Dict]], similarity_threshold: float = 0.7, topic_threshold: int = 3,
+                     num_perm: int = 64, bands: int = 16) -> Dict[str, List[Dict]]:
+	"""
+	Cluster the same story across all categories in one pass; the clusters do not depend on input order.
+	1. Similar titles (LSH candidates, checked exactly) are merged with union-find in any category.
+	2. Those title groups are then merged on topic (3+ shared key terms of their best articles) only
+	   within the same category and only with complete linkage: a group joins a topic cluster if it
+	   matches every group already in it, so shared domain vocabulary never chains stories together.
+	   Groups are visited best first (quality, then title and link), not in input order.
+	Each cluster keeps its best article (in its own category and position) with the other members
+	listed under "also_covered_by", best first.
+	"""
+	flat = [(category, article) for category, items in categorized.items() for article in items]
+	features = [article_features(article) for _, article in flat]
+	# Best first; title, link and category break quality ties without looking at positions
+	rank = {i: r for r, i in enumerate(sorted(range(len(flat)), key=lambda i: (
+		-features[i].quality, features[i].title, flat[i][1].get("link") or flat[i][1].get("url") or "", flat[i][0]
+	)))}
+	hasher = MinHasher(num_perm)
+	index = LSHIndex(num_perm, bands)
+	titles = UnionFind(len(flat))
+	
+	for i, f in enumerate(features):
+		signature = hasher.signature(feature_shingles(f))
+		for j in index.query(signature):
+			if titles.find(i) != titles.find(j) and titles_match(f, features[j], similarity_threshold):
+				titles.union(i, j)
+		index.add(i, signature)
+	
+	groups: Dict[int, List[int]] = defaultdict(list)
+	for i in range(len(flat)):
+		groups[titles.find(i)].append(i)
+	
+	# Complete-link topic merge over each title group's best article
+	best_of = sorted((min(group, key=rank.__getitem__) for group in groups.values()), key=rank.__getitem__)
+	topic_of: Dict[int, int] = {}  # title group's best article -> its topic cluster's best article
+	topic_members: Dict[int, List[int]] = defaultdict(list)
+	terms_index = TermIndex()
+	for i in best_of:
+		category = flat[i][0]
+		matched = {j for j in terms_index.matches(features[i].terms, topic_threshold) if flat[j][0] == category}
+		topic_of[i] = i
+		for j in sorted({topic_of[j] for j in matched}, key=rank.__getitem__):
+			if all(m in matched for m in topic_members[j]):
+				topic_of[i] = j
+				break
+		topic_members[topic_of[i]].append(i)
+		terms_index.add(i, features[i].terms)
+	
+	members: Dict[int, List[int]] = defaultdict(list)
+	for group in groups.values():
+		members[topic_of[min(group, key=rank.__getitem__)]].extend(group)
+	
+	representatives: Dict[int, Dict] = {}
+	for group in members.values():
+		group.sort(key=rank.__getitem__)
+		best = group[0]
+		article = flat[best][1]
+		if len(group) > 1:
+			article = dict(article, also_covered_by=[
+				{
+					"title": flat[i][1].get("title"),
+					"source": flat[i][1].get("source"),
+					"link": flat[i][1].get("link") or flat[i][1].get("url"),
+				}
+				for i in group if i != best
+			])
+		representatives[best] = article
+	
+	result: Dict[str, List[Dict]] = {category: [] for category in categorized}
+	for i, (category, _) in enumerate(flat):
+		if i in representatives:
+			result[category].append(representatives[i])
+	
+	print(f"    Clustering: {len(flat)} → {len(representatives)} stories across {len(categorized)} categories (merged {len(flat) - len(representatives)} duplicates)")
+	
+	return result
@@ -0,0 +1,122 @@
+"""
+Local sync state and parsed-article cache for newsletter mailboxes.
+For each mailbox folder it keeps the folder's UIDVALIDITY, the highest message
+UID processed and the earliest date synced, so EmailParser only fetches
+messages with a higher UID. Articles parsed from each message are cached by
+UID. Re-runs over the same window are answered from here without downloading
+or parsing the messages again. When the server's UIDVALIDITY changes, the old
+UIDs mean nothing: the folder's cache is dropped and rebuilt from a date search.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+EMAIL_CACHE_FILE = "email_cache.db"
+
+
+class FolderState(NamedTuple):
+	uidvalidity: int
+	last_uid: int
+	synced_since: float  # epoch seconds: messages from here on are all cached
+
+
+class EmailCache:
+	def __init__(self, path: str = EMAIL_CACHE_FILE, days_to_keep: int = 30) -> None:
+		self.path = path
+		self.days_to_keep = days_to_keep
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(path, check_same_thread=False)
+		self._conn.execute("PRAGMA journal_mode=WAL")
+		self._conn.execute(
+			"CREATE TABLE IF NOT EXISTS folders ("
+			" folder TEXT PRIMARY KEY,"
+			" uidvalidity INTEGER NOT NULL,"
+			" last_uid INTEGER NOT NULL,"
+			" synced_since REAL NOT NULL)"
+		)
+		self._conn.execute(
+			"CREATE TABLE IF NOT EXISTS messages ("
+			" folder TEXT NOT NULL,"
+			" uid INTEGER NOT NULL,"
+			" received REAL NOT NULL,"
+			" articles TEXT NOT NULL,"
+			" PRIMARY KEY (folder, uid))"
+		)
+		self._conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_received ON messages(folder, received)")
+		self._conn.commit()
+
+	def state(self, folder: str) -> Optional[FolderState]:
+		with self._lock:
+			row = self._conn.execute(
+				"SELECT uidvalidity, last_uid, synced_since FROM folders WHERE folder = ?", (folder,)
+			).fetchone()
+		return FolderState(*row) if row else None
+
+	def reset(self, folder: str, uidvalidity: int) -> None:
+		"""Forget the folder's messages and start over under a new UIDVALIDITY (nothing synced yet)."""
+		with self._lock:
+			self._conn.execute("DELETE FROM messages WHERE folder = ?", (folder,))
+			self._conn.execute(
+				"INSERT OR REPLACE INTO folders (folder, uidvalidity, last_uid, synced_since) VALUES (?, ?, 0, ?)",
+				(folder, uidvalidity, time.time()),
+			)
+			self._conn.commit()
+
+	def cached_uids(self, folder: str) -> Set[int]:
+		with self._lock:
+			rows = self._conn.execute("SELECT uid FROM messages WHERE folder = ?", (folder,)).fetchall()
+		return {row[0] for row in rows}
+
+	def add(self, folder: str, messages: Iterable[Tuple[int, float, List[Dict]]],
+	        synced_since: Optional[float] = None) -> None:
+		"""Cache (uid, received, articles) per message and advance the folder's watermark past them."""
+		rows = [(folder, uid, received, json.dumps(articles)) for uid, received, articles in messages]
+		with self._lock:
+			# Messages and watermark commit together, so a crash never skips unparsed mail
+			self._conn.executemany(
+				"INSERT OR REPLACE INTO messages (folder, uid, received, articles) VALUES (?, ?, ?, ?)", rows
+			)
+			last_uid = max((row[1] for row in rows), default=0)
+			self._conn.execute(
+				"UPDATE folders SET last_uid = MAX(last_uid, ?), synced_since = MIN(synced_since, COALESCE(?, synced_since))"
+				" WHERE folder = ?",
+				(last_uid, synced_since, folder),
+			)
+			self._conn.commit()
+
+	def articles_since(self, folder: str, since: float) -> Tuple[int, List[Dict]]:
+		"""(messages, articles) received at or after since, in UID order."""
+		with self._lock:
+			rows = self._conn.execute(
+				"SELECT articles FROM messages WHERE folder = ? AND received >= ? ORDER BY uid", (folder, since)
+			).fetchall()
+		return len(rows), [article for row in rows for article in json.loads(row[0])]
+
+	def cleanup(self, keep_since: Optional[float] = None) -> int:
+		"""
+		Drop cached messages older than days_to_keep; the synced range shrinks to match.
+		Messages received at or after keep_since (a window being read) are kept even when older.
+		"""
+		cutoff = time.time() - self.days_to_keep * 86400
+		if keep_since is not None:
+			cutoff = min(cutoff, keep_since)
+		with self._lock:
+			deleted = self._conn.execute("DELETE FROM messages WHERE received < ?", (cutoff,)).rowcount
+			self._conn.execute("UPDATE folders SET synced_since = MAX(synced_since, ?)", (cutoff,))
+			self._conn.commit()
+		return deleted
+
+
+_shared_cache: Optional[EmailCache] = None
+
+
+def get_email_cache() -> EmailCache:
+	"""Process-wide cache used by EmailParser."""
+	global _shared_cache
+	if _shared_cache is None:
+		_shared_cache = EmailCache()
+	return _shared_cache
@@ -1,16 +1,25 @@
 """
 Email newsletter parser for market intelligence.
 Connects to inbox, reads newsletters, extracts article links and summaries.
+Syncs incrementally: only messages above the last processed UID are downloaded,
+and parsed articles are cached per message (see src/email_cache.py).
 """
 
 import imaplib
 import email
+import time
 from email.header import decode_header
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 import re
 
+from src.email_cache import EmailCache, get_email_cache
+
+
+# Messages per UID FETCH request
+FETCH_BATCH = 50
+
 
 # Map email sources to categories
 SOURCE_CATEGORY_MAP = {
@@ -43,11 +52,12 @@ SOURCE_CATEGORY_MAP = {
 
 
 class EmailParser:
-	def __init__(self, host: str, port: int, username: str, password: str):
+	def __init__(self, host: str, port: int, username: str, password: str, cache: Optional[EmailCache] = None):
 		self.host = host
 		self.port = port
 		self.username = username
 		self.password = password
+		self.cache = cache or get_email_cache()
 	
 	def connect(self) -> imaplib.IMAP4_SSL:
 		"""Connect to email inbox."""
@@ -55,41 +65,88 @@ class EmailParser:
 		mail.login(self.username, self.password)
 		return mail
 	
-	def parse_emails_since(self, days_ago: int = 7, folder: str = 'INBOX') -> List[Dict]:
+	def parse_emails_since(self, days_ago: int = 7, folder: str = 'INBOX', sync: bool = True) -> List[Dict]:
 		"""
 		Parse newsletter emails from the last N days.
 		Returns list of article dictionaries.
+		New messages are downloaded first unless sync is False (cache only, no connection).
 		"""
+		# IMAP SINCE matches whole days
+		since_day = (datetime.now() - timedelta(days=days_ago)).replace(hour=0, minute=0, second=0, microsecond=0)
+		key = self._folder_key(folder)
+		downloaded = 0
+		if sync:
+			try:
+				downloaded = self._sync(folder, since_day)
+			except Exception as e:
+				print(f"  Error syncing emails: {e}")
+				print(f"  Using cached emails only...")
+		
+		emails, articles = self.cache.articles_since(key, since_day.timestamp())
+		print(f"  Parsed {len(articles)} articles from {emails} emails ({downloaded} downloaded, the rest cached)")
+		return articles
+	
+	def _folder_key(self, folder: str) -> str:
+		return f"{self.username}@{self.host}/{folder}"
+	
+	def _sync(self, folder: str, since_day: datetime) -> int:
+		"""Download and cache messages not cached yet; returns how many were downloaded."""
+		key = self._folder_key(folder)
+		since = since_day.timestamp()
+		mail = self.connect()
 		try:
-			mail = self.connect()
 			mail.select(folder)
+			_, validity = mail.response('UIDVALIDITY')
+			uidvalidity = int(validity[0]) if validity and validity[0] else 0
+			date_search = f'(SINCE {since_day.strftime("%d-%b-%Y")})'
 			
-			# Search for emails since date
-			date_since = (datetime.now() - timedelta(days=days_ago)).strftime("%d-%b-%Y")
-			_, message_ids = mail.search(None, f'(SINCE {date_since})')
+			state = self.cache.state(key)
+			if state is None or state.uidvalidity != uidvalidity:
+				# First sync, or the server renumbered the folder: cached UIDs are meaningless
+				self.cache.reset(key, uidvalidity)
+				state = self.cache.state(key)
 			
-			articles = []
+			# The synced range only grows once every batch is cached, so an interrupted sync is redone
+			synced_since = None
+			if since < state.synced_since:
+				# Window reaches back before the cached range
+				uids = self._search(mail, date_search)
+				synced_since = since
+			else:
+				# "n:*" always returns the highest UID, even when it is below n
+				uids = [uid for uid in self._search(mail, f'(UID {state.last_uid + 1}:*)') if uid > state.last_uid]
 			
-			for msg_id in message_ids[0].split():
-				_, msg_data = mail.fetch(msg_id, '(RFC822)')
-				
-				for response_part in msg_data:
-					if isinstance(response_part, tuple):
-						msg = email.message_from_bytes(response_part[1])
-						
-						# Parse email
-						article_batch = self._parse_email(msg)
-						articles.extend(article_batch)
+			new_uids = sorted(set(uids) - self.cache.cached_uids(key))
+			batches = [new_uids[i:i + FETCH_BATCH] for i in range(0, len(new_uids), FETCH_BATCH)] or [[]]
+			for i, batch in enumerate(batches):
+				messages = self._fetch(mail, batch) if batch else []
+				self.cache.add(key, messages, synced_since if i == len(batches) - 1 else None)
+			self.cache.cleanup(keep_since=since)
 			
 			mail.close()
+			return len(new_uids)
+		finally:
 			mail.logout()
-			
-			print(f"  Parsed {len(articles)} articles from {len(message_ids[0].split())} emails")
-			return articles
-			
-		except Exception as e:
-			print(f"  Error parsing emails: {e}")
-			return []
+	
+	def _search(self, mail: imaplib.IMAP4_SSL, criteria: str) -> List[int]:
+		_, data = mail.uid('search', None, criteria)
+		return [int(uid) for uid in data[0].split()] if data and data[0] else []
+	
+	def _fetch(self, mail: imaplib.IMAP4_SSL, uids: List[int]) -> List[Tuple[int, float, List[Dict]]]:
+		"""(uid, received time, parsed articles) for each message."""
+		_, msg_data = mail.uid('fetch', ','.join(str(uid) for uid in uids), '(INTERNALDATE RFC822)')
+		messages = []
+		for response_part in msg_data:
+			if isinstance(response_part, tuple):
+				uid = re.search(rb'UID (\d+)', response_part[0])
+				if not uid:
+					continue
+				received = imaplib.Internaldate2tuple(response_part[0])
+				msg = email.message_from_bytes(response_part[1])
+				
+				# Parse email
+				messages.append((int(uid.group(1)), time.mktime(received) if received else time.time(), self._parse_email(msg)))
+		return messages
 	
 	def _parse_email(self, msg) -> List[Dict]:
 		"""Parse a single email to extract article links."""
@@ -1,14 +1,21 @@
 """
 Load feedback and filter out articles the user has rated as not relevant.
 This prevents showing the same irrelevant articles multiple times.
+A memory-mapped Bloom filter of blocked URLs answers most lookups without
+touching the feedback store; possible hits are settled by a FeedbackIndex that
+loads the store once and then only reads new rows. The filter records the last
+feedback row it covers and catches up on newer rows (imports included) when
+opened and after each write in this process.
 """
 
-import json
 import os
-from typing import Set
+from typing import Dict, List, Optional, Set
 
+from src.bloom import BloomFilter
+from src.feedback_store import FeedbackStore, get_feedback_store, rating_level
 
-FEEDBACK_FILE = "feedback.jsonl"
+
+FEEDBACK_BLOOM = "feedback_blocked.bloom"
 
 
 def normalize_url(url: str) -> str:
@@ -23,45 +30,123 @@ def normalize_url(url: str) -> str:
 	return url
 
 
+def blocked_urls(entry: Dict) -> List[str]:
+	"""URLs (raw and normalized) a feedback entry blocks; empty if it blocks nothing."""
+	url = entry.get('article_url')
+	if not url:
+		return []
+	rating = entry.get('rating')
+	# Filter out: 'not_relevant', numeric ratings 1-2, or promo-flagged
+	if rating_level(entry) in (1, 2) or entry.get('is_promo') == True:
+		return [url, normalize_url(url)]
+	# Also block ANY article that's already been rated (to prevent RSS duplicates)
+	# Only if it's from an RSS feed (title starts with [RSS])
+	if rating is not None and (entry.get('article_title') or '').startswith('[RSS]'):
+		return [url]
+	return []
+
+
+class FeedbackIndex:
+	"""
+	Blocked URLs (raw and normalized) from the feedback store, loaded once.
+	Each lookup reads only rows added since the last one (by row id), so new
+	feedback from the dashboard or email links is picked up without a reload.
+	"""
+
+	def __init__(self, store: Optional[FeedbackStore] = None) -> None:
+		self.store = store
+		self._blocked: Set[str] = set()
+		self._last_id = 0
+
+	def refresh(self) -> None:
+		store = self.store or get_feedback_store()
+		for row_id, entry in store.entries_after(self._last_id):
+			self._blocked.update(blocked_urls(entry))
+			self._last_id = row_id
+
+	def add(self, entry: Dict) -> None:
+		"""Block an entry's URLs right away, ahead of the next refresh."""
+		self._blocked.update(blocked_urls(entry))
+
+	def is_blocked(self, url: str) -> bool:
+		if not url:
+			return False
+		self.refresh()
+		return url in self._blocked or normalize_url(url) in self._blocked
+
+	def urls(self) -> Set[str]:
+		self.refresh()
+		return set(self._blocked)
+
+
+_bloom: Optional[BloomFilter] = None
+_bloom_writes = -1
+_index: Optional[FeedbackIndex] = None
+
+
+def get_feedback_index() -> FeedbackIndex:
+	"""Process-wide index behind is_blocked."""
+	global _index
+	if _index is None:
+		_index = FeedbackIndex()
+	return _index
+
+
 def load_not_relevant_urls() -> Set[str]:
 	"""Load URLs of articles user rated as 'not_relevant', low ratings (1-2 stars), or already rated."""
-	not_relevant = set()
-	normalized_urls = set()  # Store normalized versions for better matching
-	
-	if not os.path.exists(FEEDBACK_FILE):
-		return not_relevant
-	
-	with open(FEEDBACK_FILE, 'r') as f:
-		for line in f:
-			try:
-				entry = json.loads(line)
-				rating = entry.get('rating')
-				url = entry.get('article_url')
-				if not url:
-					continue
-				
-				# Filter out: 'not_relevant', numeric ratings 1-2, or promo-flagged
-				if (rating == 'not_relevant' or 
-				    rating == 1 or 
-				    rating == 2 or 
-				    entry.get('is_promo') == True):
-					not_relevant.add(url)
-					# Also store normalized version for tracking URL variants
-					normalized_urls.add(normalize_url(url))
-				
-				# Also block ANY article that's already been rated (to prevent RSS duplicates)
-				# Only if it's from an RSS feed (title starts with [RSS])
-				elif rating is not None and entry.get('article_title', '').startswith('[RSS]'):
-					not_relevant.add(url)
-			except:
-				pass
-	
-	# Store both raw and normalized URLs for checking
-	not_relevant.update(normalized_urls)
-	return not_relevant
+	return get_feedback_index().urls()
+
+
+def _sync_bloom(bloom: BloomFilter, store: FeedbackStore, fresh: bool) -> None:
+	"""Add blocked URLs of feedback rows newer than the last one the filter covers."""
+	marker = f"{FEEDBACK_BLOOM}.last_id"
+	last_id = 0
+	if not fresh and os.path.exists(marker):
+		with open(marker) as f:
+			last_id = int(f.read().strip() or 0)
+	rows = store.entries_after(last_id)
+	if not rows:
+		return
+	bloom.add(url for _, entry in rows for url in blocked_urls(entry))
+	with open(marker, 'w') as f:
+		f.write(str(rows[-1][0]))
+
+
+def get_feedback_bloom() -> BloomFilter:
+	"""Bloom filter of blocked URLs, kept up to date with every row of the feedback store."""
+	global _bloom, _bloom_writes
+	store = get_feedback_store()
+	if _bloom is None:
+		fresh = not os.path.exists(FEEDBACK_BLOOM)
+		_bloom = BloomFilter(FEEDBACK_BLOOM, capacity=200000)
+		_sync_bloom(_bloom, store, fresh)
+		_bloom_writes = store.writes
+	elif store.writes != _bloom_writes:
+		_bloom_writes = store.writes
+		_sync_bloom(_bloom, store, fresh=False)
+	return _bloom
+
+
+def record_feedback(entry: Dict) -> Dict:
+	"""Store a feedback entry and block its URLs from now on."""
+	get_feedback_store().add(entry)
+	urls = blocked_urls(entry)
+	if urls:
+		get_feedback_bloom().add(urls)
+		get_feedback_index().add(entry)
+	return entry
+
+
+def is_blocked(url: str) -> bool:
+	"""Whether feedback blocks url (raw or normalized); Bloom misses skip the feedback store entirely."""
+	if not url:
+		return False
+	bloom = get_feedback_bloom()
+	if url not in bloom and normalize_url(url) not in bloom:
+		return False
+	return get_feedback_index().is_blocked(url)
 
 
 def should_skip_article(url: str) -> bool:
 	"""Check if article should be skipped based on user feedback."""
-	not_relevant_urls = load_not_relevant_urls()
-	return url in not_relevant_urls
+	return is_blocked(url)
@@ -0,0 +1,213 @@
+"""
+Single feedback repository shared by the dashboard, the email feedback server,
+the feedback filter, the analysis script and the auto-learners.
+Backed by SQLite (WAL mode, so the dashboard and the Flask server can write
+concurrently) with indexes on URL, rating and timestamp. Aggregate counters
+are kept up to date on every write, so stats pages never scan the table.
+Each entry is also stored whole as JSON, so fields the dashboard adds later
+survive. The legacy feedback.jsonl log is imported when the database is first
+created and can be exported again for tools that still read it.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+
+FEEDBACK_DB = "feedback.db"
+# Legacy JSONL log, imported once when the database is first created
+FEEDBACK_FILE = "feedback.jsonl"
+
+LEGACY_RATINGS = {"not_relevant": 1, "relevant": 4}
+
+
+def rating_level(entry: Dict) -> Optional[int]:
+	"""
+	1-5 relevance level of a feedback entry, or None if it has none (e.g. 'unrated').
+	Accepts dashboard ints, numeric strings from email links and legacy binary ratings.
+	"""
+	rating = entry.get("rating")
+	if isinstance(rating, str):
+		rating = LEGACY_RATINGS.get(rating, rating)
+		try:
+			rating = int(rating)
+		except ValueError:
+			return None
+	if isinstance(rating, int) and not isinstance(rating, bool) and 1 <= rating <= 5:
+		return rating
+	return None
+
+
+class FeedbackStore:
+	def __init__(self, path: str = FEEDBACK_DB, legacy_path: Optional[str] = FEEDBACK_FILE) -> None:
+		self.path = path
+		# Entries written through this instance, so in-process caches notice writes without a query
+		self.writes = 0
+		created = not os.path.exists(path)
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(path, check_same_thread=False)
+		self._conn.execute("PRAGMA journal_mode=WAL")
+		# rating has no declared type so ints and strings ('not_relevant', '4') keep their type
+		self._conn.execute(
+			"CREATE TABLE IF NOT EXISTS feedback ("
+			" id INTEGER PRIMARY KEY AUTOINCREMENT,"
+			" url TEXT,"
+			" rating,"
+			" is_promo INTEGER NOT NULL DEFAULT 0,"
+			" timestamp TEXT,"
+			" entry TEXT NOT NULL)"
+		)
+		self._conn.execute("CREATE INDEX IF NOT EXISTS idx_feedback_url ON feedback(url)")
+		self._conn.execute("CREATE INDEX IF NOT EXISTS idx_feedback_rating ON feedback(rating)")
+		self._conn.execute("CREATE INDEX IF NOT EXISTS idx_feedback_timestamp ON feedback(timestamp)")
+		self._conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+		self._conn.commit()
+		if created and legacy_path and os.path.exists(legacy_path):
+			imported = self.import_jsonl(legacy_path)
+			print(f"  Imported {imported} feedback entries from {legacy_path}")
+
+	@staticmethod
+	def _counter_names(entry: Dict) -> List[str]:
+		names = ["total", f"rating:{entry.get('rating')}"]
+		if entry.get("is_promo"):
+			names.append("promo")
+		return names
+
+	def _insert(self, entries: Iterable[Dict]) -> int:
+		rows, counts = [], {}
+		for entry in entries:
+			rows.append((
+				entry.get("article_url"),
+				entry.get("rating"),
+				1 if entry.get("is_promo") else 0,
+				entry.get("timestamp"),
+				json.dumps(entry),
+			))
+			for name in self._counter_names(entry):
+				counts[name] = counts.get(name, 0) + 1
+		with self._lock:
+			# Rows and counters commit together, so counters never drift from the table
+			self._conn.executemany(
+				"INSERT INTO feedback (url, rating, is_promo, timestamp, entry) VALUES (?, ?, ?, ?, ?)", rows
+			)
+			self._conn.executemany(
+				"INSERT INTO counters (name, value) VALUES (?, ?)"
+				" ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+				counts.items(),
+			)
+			self._conn.commit()
+			self.writes += len(rows)
+		return len(rows)
+
+	def add(self, entry: Dict) -> Dict:
+		"""Store one feedback entry (timestamped now if it has no timestamp)."""
+		entry.setdefault("timestamp", datetime.utcnow().isoformat())
+		self._insert([entry])
+		return entry
+
+	def _select(self, where: str = "", params: tuple = ()) -> List[Dict]:
+		with self._lock:
+			rows = self._conn.execute(f"SELECT entry FROM feedback {where} ORDER BY id", params).fetchall()
+		return [json.loads(row[0]) for row in rows]
+
+	def entries(self, since: Optional[str] = None) -> List[Dict]:
+		"""All entries in the order they were given, optionally only those timestamped at or after since."""
+		if since:
+			return self._select("WHERE timestamp >= ?", (since,))
+		return self._select()
+
+	def entries_after(self, last_id: int) -> List[tuple]:
+		"""(id, entry) pairs added after row last_id, for incremental readers."""
+		with self._lock:
+			rows = self._conn.execute("SELECT id, entry FROM feedback WHERE id > ? ORDER BY id", (last_id,)).fetchall()
+		return [(row_id, json.loads(entry)) for row_id, entry in rows]
+
+	def by_rating(self, *ratings) -> List[Dict]:
+		"""Entries whose stored rating is one of ratings (exact values, e.g. 1, '1', 'not_relevant')."""
+		placeholders = ", ".join("?" for _ in ratings)
+		return self._select(f"WHERE rating IN ({placeholders})", ratings)
+
+	def for_url(self, url: str) -> List[Dict]:
+		return self._select("WHERE url = ?", (url,))
+
+	def latest_by_url(self) -> Dict[str, Dict]:
+		"""The most recent entry for each rated URL."""
+		where = "WHERE id IN (SELECT MAX(id) FROM feedback WHERE url IS NOT NULL GROUP BY url)"
+		return {entry["article_url"]: entry for entry in self._select(where)}
+
+	def last_id(self) -> int:
+		"""Id of the newest entry (0 when empty); changes whenever feedback is added."""
+		with self._lock:
+			return self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM feedback").fetchone()[0]
+
+	def counters(self) -> Dict[str, int]:
+		"""Aggregate counts: 'total', 'promo' and 'rating:<value>' per stored rating value."""
+		with self._lock:
+			return dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+
+	def count(self, rating=None) -> int:
+		name = "total" if rating is None else f"rating:{rating}"
+		return self.counters().get(name, 0)
+
+	def import_jsonl(self, path: str = FEEDBACK_FILE) -> int:
+		"""
+		Import a feedback.jsonl log; returns entries imported.
+		Entries already stored (same URL and timestamp) are skipped, so importing twice adds nothing.
+		"""
+		with self._lock:
+			known = set(self._conn.execute("SELECT url, timestamp FROM feedback").fetchall())
+		entries = []
+		with open(path, 'r') as f:
+			for line in f:
+				try:
+					entry = json.loads(line)
+				except ValueError:
+					continue
+				if not isinstance(entry, dict):
+					continue
+				key = (entry.get("article_url"), entry.get("timestamp"))
+				if key in known:
+					continue
+				known.add(key)
+				entries.append(entry)
+		return self._insert(entries)
+
+	def export_jsonl(self, path: str = FEEDBACK_FILE) -> int:
+		"""Write every entry to a feedback.jsonl log (the pre-database format); returns entries written."""
+		entries = self.entries()
+		with open(path, 'w') as f:
+			for entry in entries:
+				f.write(json.dumps(entry) + '\n')
+		return len(entries)
+
+
+_shared_store: Optional[FeedbackStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_feedback_store() -> FeedbackStore:
+	"""Process-wide store used by the dashboard, feedback server, filters and learners."""
+	global _shared_store
+	with _shared_lock:
+		if _shared_store is None:
+			_shared_store = FeedbackStore()
+		return _shared_store
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Import or export feedback between feedback.jsonl and the SQLite feedback store")
+	parser.add_argument("--import-jsonl", metavar="PATH", help="JSONL log to import")
+	parser.add_argument("--export-jsonl", metavar="PATH", help="Write all feedback to a JSONL log")
+	args = parser.parse_args()
+
+	store = FeedbackStore(legacy_path=None)
+	if args.import_jsonl:
+		print(f"✅ Imported {store.import_jsonl(args.import_jsonl)} entries into {store.path}")
+	if args.export_jsonl:
+		print(f"✅ Exported {store.export_jsonl(args.export_jsonl)} entries to {args.export_jsonl}")
+	print(f"📊 {store.count()} feedback entries in {store.path}")
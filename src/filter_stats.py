@@ -0,0 +1,162 @@
+"""
+Per-run instrumentation for the keyword filter pipeline.
+Records which keyword rules fired (per rule group), where articles were dropped
+(per stage) and how many articles from each source made it through. Each run
+writes a JSON sidecar next to its report and appends the same numbers to
+filter_stats.jsonl, which `python -m src.filter_stats` aggregates over time.
+The aggregate lists rules that never fired, which are candidates for pruning
+from keyword_rules.json.
+"""
+
+import json
+import os
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+
+STATS_HISTORY = "filter_stats.jsonl"
+PASSED = "passed"
+
+
+def article_source(article: Dict) -> str:
+	return article.get("source") or article.get("_source_type") or "unknown"
+
+
+class FilterStats:
+	def __init__(self) -> None:
+		self.articles = 0
+		self.passed = 0
+		# Articles scanned by the keyword matcher (rule hits only cover these)
+		self.scanned = 0
+		self.stage_drops: Counter = Counter()
+		self.sources: Dict[str, Counter] = {}
+		# group -> keyword -> articles it matched
+		self.rule_hits: Dict[str, Counter] = {}
+
+	def record(self, article: Dict, stage: Optional[str] = None, matches: Optional[Dict[str, Set[str]]] = None) -> None:
+		"""Count one article: dropped at stage, or passed when stage is None; matches are its keyword hits."""
+		self.articles += 1
+		name = article_source(article)
+		source = self.sources.get(name)
+		if source is None:
+			source = self.sources[name] = Counter()
+		source["seen"] += 1
+		if stage:
+			self.stage_drops[stage] += 1
+		else:
+			self.passed += 1
+			source[PASSED] += 1
+		if matches is not None:
+			self.scanned += 1
+			for group, keywords in matches.items():
+				hits = self.rule_hits.get(group)
+				if hits is None:
+					hits = self.rule_hits[group] = Counter()
+				for keyword in keywords:
+					hits[keyword] += 1
+
+	def to_dict(self) -> Dict:
+		return {
+			"timestamp": datetime.now().isoformat(timespec="seconds"),
+			"articles": self.articles,
+			"passed": self.passed,
+			"scanned": self.scanned,
+			"stage_drops": dict(self.stage_drops.most_common()),
+			"sources": {name: {"seen": c["seen"], "passed": c[PASSED]} for name, c in sorted(self.sources.items())},
+			"rule_hits": {group: dict(hits.most_common()) for group, hits in sorted(self.rule_hits.items())},
+		}
+
+	def write(self, report_path: str, history_path: Optional[str] = STATS_HISTORY) -> str:
+		"""Write <report>.filters.json next to the report and append to the history; returns the sidecar path."""
+		data = self.to_dict()
+		data["report"] = os.path.basename(report_path)
+		sidecar = f"{os.path.splitext(report_path)[0]}.filters.json"
+		with open(sidecar, "w") as f:
+			json.dump(data, f, indent=2)
+		if history_path:
+			with open(history_path, "a") as f:
+				f.write(json.dumps(data) + "\n")
+		return sidecar
+
+	def summary(self) -> str:
+		lines = [f"🔎 Filters: {self.passed}/{self.articles} articles passed"]
+		for stage, count in self.stage_drops.most_common():
+			lines.append(f"   - {stage}: {count}")
+		return "\n".join(lines)
+
+
+def aggregate(history_path: str = STATS_HISTORY) -> Dict:
+	"""Sum every run in the history file (same shape as a single run, plus 'runs')."""
+	total = {"runs": 0, "articles": 0, "passed": 0, "scanned": 0, "stage_drops": Counter(), "sources": {}, "rule_hits": {}}
+	if not os.path.exists(history_path):
+		return total
+	with open(history_path, "r") as f:
+		for line in f:
+			try:
+				run = json.loads(line)
+			except ValueError:
+				continue
+			total["runs"] += 1
+			for key in ("articles", "passed", "scanned"):
+				total[key] += run.get(key, 0)
+			total["stage_drops"].update(run.get("stage_drops", {}))
+			for name, counts in run.get("sources", {}).items():
+				total["sources"].setdefault(name, Counter()).update(counts)
+			for group, hits in run.get("rule_hits", {}).items():
+				total["rule_hits"].setdefault(group, Counter()).update(hits)
+	return total
+
+
+def never_hit(rule_hits: Dict[str, Counter], groups: Dict[str, Iterable[str]]) -> Dict[str, List[str]]:
+	"""Keywords per group that never matched an article."""
+	dead = {}
+	for group, keywords in groups.items():
+		hits = rule_hits.get(group, {})
+		missing = [kw for kw in keywords if not hits.get(kw.lower())]
+		if missing:
+			dead[group] = missing
+	return dead
+
+
+_shared_stats: Optional[FilterStats] = None
+
+
+def get_filter_stats() -> FilterStats:
+	"""Process-wide stats for the current run, filled in by process_article and the gates."""
+	global _shared_stats
+	if _shared_stats is None:
+		_shared_stats = FilterStats()
+	return _shared_stats
+
+
+if __name__ == "__main__":
+	import argparse
+
+	from src.keyword_rules import get_keyword_rules
+
+	parser = argparse.ArgumentParser(description="Aggregate keyword filter stats over all recorded runs")
+	parser.add_argument("--history", default=STATS_HISTORY, help="Stats history file")
+	parser.add_argument("--top", type=int, default=15, help="Rules to show per group")
+	args = parser.parse_args()
+
+	total = aggregate(args.history)
+	if not total["runs"]:
+		print(f"❌ No runs recorded in {args.history}")
+		raise SystemExit(1)
+
+	print(f"📊 {total['runs']} runs, {total['articles']} articles, {total['passed']} passed")
+	print("\nDropped by stage:")
+	for stage, count in total["stage_drops"].most_common():
+		print(f"  {stage}: {count}")
+	print("\nPass rate by source:")
+	for name, counts in sorted(total["sources"].items(), key=lambda item: -item[1]["seen"]):
+		print(f"  {name}: {counts[PASSED]}/{counts['seen']} ({counts[PASSED] / counts['seen']:.0%})")
+	print("\nTop rules:")
+	for group, hits in sorted(total["rule_hits"].items()):
+		print(f"  {group}: " + ", ".join(f"{kw} ({n})" for kw, n in hits.most_common(args.top)))
+	if total["scanned"]:
+		dead = never_hit(total["rule_hits"], get_keyword_rules().groups())
+		print(f"\nNever matched in {total['scanned']} scanned articles ({sum(len(v) for v in dead.values())} rules):")
+		for group, keywords in dead.items():
+			print(f"  {group}: {', '.join(keywords)}")
@@ -0,0 +1,125 @@
+"""
+Cheap pre-classification gates run before any LLM call.
+Each gate is a named predicate that returns True to let an article through;
+the stage counts how many articles each gate rejected (i.e. LLM calls saved).
+"""
+
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.deduplication import normalize_title
+from src.feedback_filter import normalize_url
+from src.simhash_store import SimHashStore
+
+
+Gate = Callable[[Dict], bool]
+
+
+class GateStage:
+	def __init__(self, gates: List[Tuple[str, Gate]]) -> None:
+		self.gates = gates
+		self.passed = 0
+		self.rejected: Dict[str, int] = {name: 0 for name, _ in gates}
+
+	def rejected_by(self, article: Dict) -> Optional[str]:
+		"""Run gates in order; the first one that rejects the article is charged for it and named (None if admitted)."""
+		for name, gate in self.gates:
+			if not gate(article):
+				self.rejected[name] += 1
+				return name
+		self.passed += 1
+		return None
+
+	def admit(self, article: Dict) -> bool:
+		return self.rejected_by(article) is None
+
+	def filter(self, articles: List[Dict]) -> List[Dict]:
+		return [article for article in articles if self.admit(article)]
+
+	@property
+	def saved(self) -> int:
+		return sum(self.rejected.values())
+
+	def summary(self) -> str:
+		lines = [f"🚧 Gates: {self.passed} passed to the LLM, {self.saved} calls saved"]
+		for name, count in self.rejected.items():
+			lines.append(f"   - {name}: {count}")
+		return "\n".join(lines)
+
+
+def url_lookup_gate(contains: Callable[[str], bool]) -> Gate:
+	"""
+	Reject articles whose URL (raw or normalized) a point-lookup store knows,
+	e.g. seen_tracker.is_seen or feedback_filter.is_blocked.
+	"""
+	def gate(article: Dict) -> bool:
+		link = article.get("url")
+		return not (link and (contains(link) or contains(normalize_url(link))))
+	return gate
+
+
+def fingerprint_gate(store: SimHashStore) -> Gate:
+	"""Reject articles whose SimHash is within the store's distance of one reported in an earlier run."""
+	def gate(article: Dict) -> bool:
+		return not store.seen(article)
+	return gate
+
+
+class KeywordScan:
+	"""
+	Keyword matches of the article being gated (e.g. main_simple.keyword_matches), computed once
+	and shared by the keyword gates and the filter stats.
+	"""
+
+	def __init__(self, keyword_matches: Callable[[str, str], Dict[str, Set[str]]]) -> None:
+		self.keyword_matches = keyword_matches
+		self._article: Optional[Dict] = None
+		self._matches: Optional[Dict[str, Set[str]]] = None
+
+	def __call__(self, article: Dict) -> Dict[str, Set[str]]:
+		if article is not self._article:
+			self._article = article
+			self._matches = self.keyword_matches(article.get("title") or "", article.get("description") or "")
+		return self._matches
+
+	def matches_of(self, article: Dict) -> Optional[Dict[str, Set[str]]]:
+		"""The article's matches, or None if it was rejected before any keyword gate scanned it."""
+		return self._matches if article is self._article else None
+
+
+def relevance_gate(is_relevant: Callable[..., bool], scan: Optional[KeywordScan] = None) -> Gate:
+	"""Reject articles a keyword filter such as main_simple.is_relevant would drop (on scan's matches, if given)."""
+	def gate(article: Dict) -> bool:
+		title, description = article.get("title") or "", article.get("description") or ""
+		if scan:
+			return is_relevant(title, description, scan(article))
+		return is_relevant(title, description)
+	return gate
+
+
+def corporate_pr_gate(is_corporate_pr: Callable[..., bool], scan: Optional[KeywordScan] = None) -> Gate:
+	"""Reject articles a PR detector such as main_simple.is_corporate_pr flags (on scan's matches, if given)."""
+	def gate(article: Dict) -> bool:
+		title, description, url = article.get("title") or "", article.get("description") or "", article.get("url") or ""
+		if scan:
+			return not is_corporate_pr(title, description, url, scan(article))
+		return not is_corporate_pr(title, description, url)
+	return gate
+
+
+def duplicate_gate() -> Gate:
+	"""Reject articles already admitted this run from any source (same URL or same normalized title)."""
+	seen_urls: Set[str] = set()
+	seen_titles: Set[str] = set()
+
+	def gate(article: Dict) -> bool:
+		link = article.get("url")
+		key = normalize_url(link) if link else None
+		title = normalize_title(article.get("title") or "")
+		if (key and key in seen_urls) or (title and title in seen_titles):
+			return False
+		if key:
+			seen_urls.add(key)
+		if title:
+			seen_titles.add(title)
+		return True
+	return gate
@@ -2,10 +2,13 @@ from typing import Dict, List, Optional
 import requests
 from datetime import datetime
 
+from src.http_transport import HTTPTransport, get_transport
+
 
 class GNewsClient:
-	def __init__(self, api_key: str) -> None:
+	def __init__(self, api_key: str, transport: Optional[HTTPTransport] = None) -> None:
 		self.api_key = api_key
+		self.transport = transport or get_transport()
 		self.search_url = "https://gnews.io/api/v4/search"
 		self.headlines_url = "https://gnews.io/api/v4/top-headlines"
 
@@ -30,7 +33,7 @@ class GNewsClient:
 		#     params["from"] = f"{since}T00:00:00Z"
 		
 		try:
-			resp = requests.get(self.search_url, params=params, timeout=30)
+			resp = self.transport.get(self.search_url, source="gnews", params=params)
 			resp.raise_for_status()
 			data = resp.json() or {}
 			
@@ -78,7 +81,7 @@ class GNewsClient:
 		}
 		
 		try:
-			resp = requests.get(self.headlines_url, params=params, timeout=30)
+			resp = self.transport.get(self.headlines_url, source="gnews", params=params)
 			resp.raise_for_status()
 			data = resp.json() or {}
 			
@@ -149,6 +149,11 @@ def generate_html_report(categories: Dict[str, List[Dict]], since: str) -> str:
 			
 			tags_html = ''.join([f'<span class="tag">{tag}</span>' for tag in tags])
 			
+			# Other outlets that ran the same story (from cluster_articles)
+			also = [f'<a href="{o["link"]}" target="_blank">{o.get("source") or o.get("title") or "link"}</a>'
+			        for o in item.get('also_covered_by') or [] if o.get('link')]
+			also_html = f'<div class="article-meta">Also covered by: {", ".join(also)}</div>' if also else ''
+			
 			html += f'''
 	<div class="article">
 		<div class="article-title">{title}</div>
@@ -158,6 +163,7 @@ def generate_html_report(categories: Dict[str, List[Dict]], since: str) -> str:
 		</div>
 		<div class="article-summary">{summary}</div>
 		<a href="{link}" target="_blank" class="article-link">🔗 Read Full Article</a>
+		{also_html}
 	</div>
 '''
 	
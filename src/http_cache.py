@@ -0,0 +1,118 @@
+"""
+Persistent conditional-GET cache for RSS feeds and scraper listing pages.
+Remembers each page's ETag / Last-Modified validators together with the parsed
+result, so an unchanged page (HTTP 304) skips both the download and the parsing.
+Changes are kept in memory and written once, by flush() or at interpreter exit.
+"""
+
+import atexit
+import copy
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from src.http_transport import HTTPTransport, get_transport
+
+HTTP_CACHE_FILE = "http_cache.json"
+
+
+class ConditionalCache:
+	def __init__(self, path: str = HTTP_CACHE_FILE, transport: Optional[HTTPTransport] = None) -> None:
+		self.path = path
+		self.transport = transport or get_transport()
+		self._lock = threading.Lock()
+		self._entries: Dict[str, Dict] = self._load()
+		self._dirty = False
+		atexit.register(self.flush)
+
+	def _load(self) -> Dict[str, Dict]:
+		if not os.path.exists(self.path):
+			return {}
+		try:
+			with open(self.path, 'r') as f:
+				return json.load(f)
+		except Exception:
+			return {}
+
+	def flush(self) -> None:
+		"""Write the cache atomically if anything changed since the last write."""
+		with self._lock:
+			if not self._dirty:
+				return
+			tmp_path = f"{self.path}.tmp"
+			with open(tmp_path, 'w') as f:
+				json.dump(self._entries, f)
+			os.replace(tmp_path, self.path)
+			self._dirty = False
+
+	def conditional_headers(self, key: str) -> Dict[str, str]:
+		"""Validator headers to send for a cached page (empty if not cached)."""
+		with self._lock:
+			entry = self._entries.get(key)
+		if not entry:
+			return {}
+		headers = {}
+		if entry.get('etag'):
+			headers['If-None-Match'] = entry['etag']
+		if entry.get('last_modified'):
+			headers['If-Modified-Since'] = entry['last_modified']
+		return headers
+
+	def fetch(self, url: str, parse: Callable[[requests.Response], Any], key: Optional[str] = None,
+	          headers: Optional[Dict[str, str]] = None, source: str = "default",
+	          timeout: Optional[float] = None) -> Any:
+		"""
+		GET url with conditional headers and return parse(response).
+		On 304 Not Modified the previously parsed payload is returned without parsing.
+		`key` distinguishes different parses of the same URL (defaults to the URL);
+		`source` selects the transport's timeout when `timeout` is not given.
+		"""
+		key = key or url
+		request_headers = dict(headers or {})
+		request_headers.update(self.conditional_headers(key))
+
+		resp = self.transport.get(url, source=source, headers=request_headers, timeout=timeout)
+		if resp.status_code == 304:
+			with self._lock:
+				entry = self._entries.get(key)
+			if entry is not None:
+				print(f"    Not modified since last run: {url}")
+				return copy.deepcopy(entry['payload'])
+			# Validators without a payload should never happen; refetch in full
+			resp = self.transport.get(url, source=source, headers=headers, timeout=timeout)
+		resp.raise_for_status()
+		payload = parse(resp)
+
+		etag = resp.headers.get('ETag')
+		last_modified = resp.headers.get('Last-Modified')
+		with self._lock:
+			if etag or last_modified:
+				self._entries[key] = {
+					'etag': etag,
+					'last_modified': last_modified,
+					'payload': copy.deepcopy(payload),
+					'fetched_at': datetime.now().isoformat(),
+				}
+				self._dirty = True
+			elif key in self._entries:
+				# Server stopped sending validators; drop the stale entry
+				del self._entries[key]
+				self._dirty = True
+		return payload
+
+
+_shared_cache: Optional[ConditionalCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_cache() -> ConditionalCache:
+	"""Process-wide cache instance shared by all clients (one writer per file)."""
+	global _shared_cache
+	with _shared_lock:
+		if _shared_cache is None:
+			_shared_cache = ConditionalCache()
+		return _shared_cache
@@ -0,0 +1,107 @@
+"""
+Shared HTTP transport used by every source client.
+One keep-alive requests.Session with a sized connection pool per host, common
+default headers, per-source timeouts, and retry with exponential backoff plus
+jitter on 429/5xx responses.
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; AI Market Intelligence Bot)"
+
+# Seconds to wait for each source before giving up on a request
+SOURCE_TIMEOUTS = {
+	"default": 15,
+	"rss": 10,
+	"scraper": 15,
+	"regulator": 15,
+	"legislation": 15,
+	"gnews": 30,
+	"newsapi": 30,
+	"serpapi": 30,
+}
+
+# Responses worth retrying: rate limited or transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HTTPTransport:
+	def __init__(self, pool_connections: int = 20, pool_maxsize: int = 10, max_retries: int = 3,
+	             backoff_base: float = 1.0, backoff_max: float = 30.0,
+	             headers: Optional[Dict[str, str]] = None) -> None:
+		self.max_retries = max_retries
+		self.backoff_base = backoff_base
+		self.backoff_max = backoff_max
+
+		self.session = requests.Session()
+		# pool_connections = number of hosts kept warm, pool_maxsize = sockets per host
+		adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+		self.session.mount("http://", adapter)
+		self.session.mount("https://", adapter)
+		self.session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+		if headers:
+			self.session.headers.update(headers)
+
+	def timeout_for(self, source: str) -> float:
+		return SOURCE_TIMEOUTS.get(source, SOURCE_TIMEOUTS["default"])
+
+	def _backoff(self, attempt: int) -> float:
+		"""Exponential backoff with full jitter."""
+		return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+	def _retry_after(self, resp: requests.Response) -> Optional[float]:
+		"""Honour a numeric Retry-After header if the server sent one."""
+		value = resp.headers.get("Retry-After")
+		if not value:
+			return None
+		try:
+			return min(self.backoff_max, max(0.0, float(value)))
+		except ValueError:
+			return None
+
+	def get(self, url: str, source: str = "default", params: Optional[Dict] = None,
+	        headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> requests.Response:
+		"""GET through the pooled session, retrying 429/5xx and dropped connections."""
+		timeout = timeout or self.timeout_for(source)
+		host = urlparse(url).netloc
+		for attempt in range(self.max_retries + 1):
+			try:
+				resp = self.session.get(url, params=params, headers=headers, timeout=timeout)
+			except requests.exceptions.ConnectionError as e:
+				if attempt >= self.max_retries:
+					raise
+				delay = self._backoff(attempt)
+				print(f"    Connection error from {host} ({e.__class__.__name__}); retrying in {delay:.1f}s...")
+				time.sleep(delay)
+				continue
+
+			if resp.status_code in RETRY_STATUSES and attempt < self.max_retries:
+				delay = self._retry_after(resp)
+				if delay is None:
+					delay = self._backoff(attempt)
+				print(f"    HTTP {resp.status_code} from {host}; retrying in {delay:.1f}s...")
+				resp.close()
+				time.sleep(delay)
+				continue
+			return resp
+
+
+_shared_transport: Optional[HTTPTransport] = None
+_shared_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+	"""Process-wide transport so every client reuses the same warm connections."""
+	global _shared_transport
+	with _shared_lock:
+		if _shared_transport is None:
+			_shared_transport = HTTPTransport()
+		return _shared_transport
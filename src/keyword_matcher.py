@@ -0,0 +1,69 @@
+"""
+Compiled multi-keyword matcher: many named keyword groups, one scan per text.
+Every keyword of every group goes into a single Aho-Corasick automaton
+(pyahocorasick), built once. One pass over the text reports all occurrences,
+overlapping ones included, so each group's answer is the same as
+`any(keyword in text for keyword in group)` without a separate substring scan
+per keyword.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+import ahocorasick
+
+
+def _is_word_char(ch: str) -> bool:
+	return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+	def __init__(self, groups: Dict[str, Iterable[str]], whole_word: Iterable[str] = ()) -> None:
+		"""
+		groups maps a group name to its keywords (matched case-insensitively, as substrings).
+		Groups named in whole_word only match where the keyword is not part of a longer word.
+		"""
+		whole_word = set(whole_word)
+		self.groups = list(groups)
+		# keyword -> (groups matched anywhere, groups matched as whole words only)
+		self._rules: Dict[str, Tuple[List[str], List[str]]] = {}
+		for group, keywords in groups.items():
+			for keyword in keywords:
+				keyword = keyword.lower()
+				if keyword:
+					substring, whole = self._rules.setdefault(keyword, ([], []))
+					(whole if group in whole_word else substring).append(group)
+		self._check_words = any(whole for _, whole in self._rules.values())
+
+		self._automaton = ahocorasick.Automaton()
+		for keyword in self._rules:
+			self._automaton.add_word(keyword, keyword)
+		if self._rules:
+			self._automaton.make_automaton()
+
+	def __len__(self) -> int:
+		return len(self._rules)
+
+	@staticmethod
+	def _bounded(text: str, end: int, keyword: str) -> bool:
+		"""Whether the occurrence of keyword ending at index end stands as whole word(s)."""
+		start = end - len(keyword) + 1
+		return ((start == 0 or not _is_word_char(text[start - 1])) and
+		        (end + 1 == len(text) or not _is_word_char(text[end + 1])))
+
+	def match(self, text: str) -> Dict[str, Set[str]]:
+		"""Matched keywords per group, from a single scan of text (groups without a match are absent)."""
+		found: Dict[str, Set[str]] = {}
+		if not self._rules:
+			return found
+		text = text.lower()
+		occurrences: List[Tuple[int, str]] = list(self._automaton.iter(text))
+		for keyword in {keyword for _, keyword in occurrences}:
+			for group in self._rules[keyword][0]:
+				found.setdefault(group, set()).add(keyword)
+		if self._check_words:
+			for end, keyword in occurrences:
+				whole = self._rules[keyword][1]
+				if whole and self._bounded(text, end, keyword):
+					for group in whole:
+						found.setdefault(group, set()).add(keyword)
+		return found
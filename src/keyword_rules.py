@@ -0,0 +1,153 @@
+"""
+Keyword rule sets for the no-GPT filters (relevance, category, score boosts,
+corporate PR), kept in a versioned data file instead of in main_simple.py.
+keyword_rules.json is the source of truth. The auto-learners add and remove
+keywords through this module, and every write bumps the version. The
+matcher (an Aho-Corasick automaton over every group) is compiled from the JSON
+on load; it takes under a millisecond, so nothing is cached on disk. Lookups
+check the JSON at most once per check_interval and recompile when it has changed.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.keyword_matcher import KeywordMatcher
+
+
+RULES_FILE = "keyword_rules.json"
+
+# Lists the learners may edit: each maps section name -> keywords
+SECTIONED_LISTS = ("irrelevant", "relevant")
+LEARNED_SECTION = "Auto-learned"
+
+
+class KeywordRules:
+	def __init__(self, path: str = RULES_FILE, check_interval: float = 1.0) -> None:
+		self.path = path
+		# Seconds between checks of the rules file during lookups
+		self.check_interval = check_interval
+		self.data: Dict = {}
+		self.matcher: Optional[KeywordMatcher] = None
+		self._stat: Optional[Tuple[float, int]] = None
+		self._checked = 0.0
+		self.refresh()
+
+	@property
+	def version(self) -> int:
+		return self.data.get("version", 0)
+
+	def refresh(self) -> None:
+		"""Reload and recompile when the rules file changed since the last load."""
+		self._checked = time.monotonic()
+		stat = os.stat(self.path)
+		if (stat.st_mtime, stat.st_size) == self._stat:
+			return
+		with open(self.path, "r") as f:
+			self.data = json.load(f)
+		self.matcher = KeywordMatcher(self.groups())
+		self._stat = (stat.st_mtime, stat.st_size)
+
+	def keywords(self, name: str) -> List[str]:
+		"""Flat keyword list of a top-level list (sectioned or plain)."""
+		value = self.data.get(name, [])
+		if isinstance(value, dict):
+			return [kw for section in value.values() for kw in section]
+		return list(value)
+
+	@property
+	def categories(self) -> List[str]:
+		"""Category names in the order they are checked (the first match wins)."""
+		return [entry["category"] for entry in self.data.get("categories", [])]
+
+	@property
+	def score_boosts(self) -> List[int]:
+		return [entry["boost"] for entry in self.data.get("score_boosts", [])]
+
+	def groups(self) -> Dict[str, List[str]]:
+		"""Matcher groups: irrelevant, relevant, category:<name>, boost:<index>, pr, anz."""
+		groups = {
+			"irrelevant": self.keywords("irrelevant"),
+			"relevant": self.keywords("relevant"),
+		}
+		for entry in self.data.get("categories", []):
+			groups[f"category:{entry['category']}"] = entry["keywords"]
+		for i, entry in enumerate(self.data.get("score_boosts", [])):
+			groups[f"boost:{i}"] = entry["keywords"]
+		groups["pr"] = self.keywords("pr_patterns")
+		groups["anz"] = self.keywords("anz_keywords")
+		return groups
+
+	def match(self, text: str) -> Dict[str, Set[str]]:
+		"""Matched keywords per group (see groups()), picking up edits to the rules file."""
+		if time.monotonic() - self._checked >= self.check_interval:
+			self.refresh()
+		return self.matcher.match(text)
+
+	def _save(self) -> None:
+		self.data["version"] = self.version + 1
+		self.data["updated"] = datetime.now().isoformat(timespec="seconds")
+		tmp = f"{self.path}.tmp"
+		with open(tmp, "w") as f:
+			json.dump(self.data, f, indent="\t")
+			f.write("\n")
+		os.replace(tmp, self.path)
+		self.refresh()
+
+	def add_keywords(self, name: str, keywords: Iterable[str], section: str = LEARNED_SECTION) -> List[str]:
+		"""Add keywords to an irrelevant/relevant section; returns those that were new."""
+		if name not in SECTIONED_LISTS:
+			raise ValueError(f"Unknown keyword list: {name}")
+		self.refresh()
+		existing = set(self.keywords(name))
+		added = [kw.lower() for kw in keywords if kw.lower() not in existing]
+		if added:
+			self.data.setdefault(name, {}).setdefault(section, []).extend(added)
+			self._save()
+		return added
+
+	def remove_keywords(self, name: str, keywords: Iterable[str]) -> List[str]:
+		"""Remove keywords from every section of an irrelevant/relevant list; returns those removed."""
+		if name not in SECTIONED_LISTS:
+			raise ValueError(f"Unknown keyword list: {name}")
+		self.refresh()
+		drop = {kw.lower() for kw in keywords}
+		removed = []
+		sections = self.data.get(name, {})
+		for section, words in list(sections.items()):
+			removed += [kw for kw in words if kw in drop]
+			sections[section] = [kw for kw in words if kw not in drop]
+			if not sections[section]:
+				del sections[section]
+		if removed:
+			self._save()
+		return removed
+
+
+_shared_rules: Optional[KeywordRules] = None
+
+
+def get_keyword_rules() -> KeywordRules:
+	"""Process-wide rules behind main_simple's filters."""
+	global _shared_rules
+	if _shared_rules is None:
+		_shared_rules = KeywordRules()
+	return _shared_rules
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Edit keyword_rules.json")
+	parser.add_argument("--add", nargs="+", metavar=("LIST", "KEYWORD"), help="Add keywords to the irrelevant or relevant list")
+	parser.add_argument("--remove", nargs="+", metavar=("LIST", "KEYWORD"), help="Remove keywords from the irrelevant or relevant list")
+	args = parser.parse_args()
+
+	rules = KeywordRules()
+	if args.add:
+		print(f"✅ Added to {args.add[0]}: {rules.add_keywords(args.add[0], args.add[1:], section='Manual') or 'nothing new'}")
+	if args.remove:
+		print(f"✅ Removed from {args.remove[0]}: {rules.remove_keywords(args.remove[0], args.remove[1:]) or 'nothing'}")
+	print(f"📊 {rules.path} v{rules.version}: {len(rules.matcher)} distinct keywords")
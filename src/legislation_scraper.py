@@ -1,13 +1,62 @@
-from typing import Dict, List
-import requests
+from typing import Dict, List, Optional
 from datetime import datetime, timezone
 from dateutil import parser as dateparser
 from bs4 import BeautifulSoup
 
+from src.http_cache import ConditionalCache, get_http_cache
+
 
 class LegislationScraper:
-	def __init__(self) -> None:
+	def __init__(self, cache: Optional[ConditionalCache] = None) -> None:
 		self.base_url = "https://www.legislation.gov.au"
+		self.cache = cache or get_http_cache()
+	
+	def _parse_category_page(self, html: str, max_items: int) -> List[Dict]:
+		"""Parse one "What's new" category page into items (unfiltered by date)."""
+		soup = BeautifulSoup(html, 'html.parser')
+		results: List[Dict] = []
+		
+		# Find all legislation items (typical structure: div.item or li with links)
+		items = soup.find_all(['div', 'li', 'article'], class_=lambda x: x and ('item' in x.lower() or 'result' in x.lower()))[:max_items]
+		
+		for item in items:
+			# Extract title and link
+			link_tag = item.find('a')
+			if not link_tag:
+				continue
+			
+			title = link_tag.get_text(strip=True)
+			href = link_tag.get('href', '')
+			if href and not href.startswith('http'):
+				href = f"{self.base_url}{href}"
+			
+			# Try to extract date
+			date_tag = item.find(['time', 'span'], class_=lambda x: x and 'date' in x.lower() if x else False)
+			pub_date = None
+			if date_tag:
+				date_str = date_tag.get('datetime') or date_tag.get_text(strip=True)
+				try:
+					pub_date = dateparser.parse(date_str)
+					if not pub_date.tzinfo:
+						pub_date = pub_date.replace(tzinfo=timezone.utc)
+				except:
+					pass
+			
+			# Extract description if available
+			desc_tag = item.find(['p', 'div'], class_=lambda x: x and ('desc' in x.lower() or 'summary' in x.lower()) if x else False)
+			description = desc_tag.get_text(strip=True) if desc_tag else title
+			
+			results.append({
+				"title": title,
+				"description": description,
+				"content": description,
+				"url": href,
+				"source": "Federal Register of Legislation",
+				"publishedAt": pub_date.isoformat() if pub_date else None,
+				"_source_type": "Legislation",
+			})
+		
+		return results
 		
 	def fetch_whats_new(self, since: str, max_items: int = 50) -> List[Dict]:
 		"""
@@ -33,55 +82,21 @@ class LegislationScraper:
 			print(f"    Fetching legislation: {url}")
 			
 			try:
-				resp = requests.get(url, timeout=15, headers={
-					"User-Agent": "Mozilla/5.0 (compatible; AI Market Intelligence Bot)"
-				})
-				resp.raise_for_status()
-				soup = BeautifulSoup(resp.text, 'html.parser')
-				
-				# Find all legislation items (typical structure: div.item or li with links)
-				items = soup.find_all(['div', 'li', 'article'], class_=lambda x: x and ('item' in x.lower() or 'result' in x.lower()))[:max_items]
+				# Conditional GET: an unchanged page reuses last run's parse
+				items = self.cache.fetch(
+					url,
+					lambda resp: self._parse_category_page(resp.text, max_items),
+					key=f"{url}#max={max_items}",
+					source="legislation",
+				)
 				
 				for item in items:
-					# Extract title and link
-					link_tag = item.find('a')
-					if not link_tag:
-						continue
-					
-					title = link_tag.get_text(strip=True)
-					href = link_tag.get('href', '')
-					if href and not href.startswith('http'):
-						href = f"{self.base_url}{href}"
-					
-					# Try to extract date
-					date_tag = item.find(['time', 'span'], class_=lambda x: x and 'date' in x.lower() if x else False)
-					pub_date = None
-					if date_tag:
-						date_str = date_tag.get('datetime') or date_tag.get_text(strip=True)
-						try:
-							pub_date = dateparser.parse(date_str)
-							if not pub_date.tzinfo:
-								pub_date = pub_date.replace(tzinfo=timezone.utc)
-						except:
-							pass
-					
 					# Filter by date if available
-					if pub_date and pub_date <= since_dt:
+					pub_date = item["publishedAt"]
+					if pub_date and datetime.fromisoformat(pub_date) <= since_dt:
 						continue
 					
-					# Extract description if available
-					desc_tag = item.find(['p', 'div'], class_=lambda x: x and ('desc' in x.lower() or 'summary' in x.lower()) if x else False)
-					description = desc_tag.get_text(strip=True) if desc_tag else title
-					
-					results.append({
-						"title": title,
-						"description": description,
-						"content": description,
-						"url": href,
-						"source": "Federal Register of Legislation",
-						"publishedAt": pub_date.isoformat() if pub_date else None,
-						"_source_type": "Legislation",
-					})
+					results.append(item)
 					
 					if len(results) >= max_items:
 						break
@@ -0,0 +1,113 @@
+"""
+Persistent, content-addressed cache of LLM classification results.
+Keyed by a hash of the truncated article text, the model and the prompt version,
+so re-runs over overlapping date windows don't re-classify the same articles.
+Each result also keeps the article text it was classified from, so the local
+classifier trains on the same input it later scores, not on GPT's rewrite.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+LLM_CACHE_FILE = "llm_cache.db"
+
+
+class LLMCache:
+	def __init__(self, path: str = LLM_CACHE_FILE, ttl_days: int = 30, max_entries: int = 20000) -> None:
+		self.path = path
+		self.ttl_seconds = ttl_days * 86400
+		self.max_entries = max_entries
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(path, check_same_thread=False)
+		self._conn.execute("PRAGMA journal_mode=WAL")
+		self._conn.execute(
+			"CREATE TABLE IF NOT EXISTS llm_results ("
+			" key TEXT PRIMARY KEY,"
+			" model TEXT NOT NULL,"
+			" result TEXT NOT NULL,"
+			" created_at REAL NOT NULL,"
+			" last_used REAL NOT NULL,"
+			" input TEXT)"
+		)
+		# Caches created before inputs were stored: their rows keep a NULL input
+		columns = {row[1] for row in self._conn.execute("PRAGMA table_info(llm_results)")}
+		if "input" not in columns:
+			self._conn.execute("ALTER TABLE llm_results ADD COLUMN input TEXT")
+		self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_results_created ON llm_results(created_at)")
+		self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_results_last_used ON llm_results(last_used)")
+		self._conn.commit()
+		self.evict()
+
+	@staticmethod
+	def make_key(title: str, description: str, content: str, model: str, prompt_version: str, default_category: str) -> str:
+		"""Stable key for one classification request."""
+		parts = [title, description, content, model, prompt_version, default_category]
+		return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+	def get(self, key: str) -> Optional[Dict]:
+		"""Return the cached result for key, or None if missing or expired."""
+		now = time.time()
+		with self._lock:
+			row = self._conn.execute(
+				"SELECT result FROM llm_results WHERE key = ? AND created_at >= ?",
+				(key, now - self.ttl_seconds),
+			).fetchone()
+			if row is None:
+				return None
+			self._conn.execute("UPDATE llm_results SET last_used = ? WHERE key = ?", (now, key))
+			self._conn.commit()
+		return json.loads(row[0])
+
+	def put(self, key: str, model: str, result: Dict, input_text: Optional[str] = None) -> None:
+		"""Store a result, with the article text it was classified from if given."""
+		now = time.time()
+		with self._lock:
+			self._conn.execute(
+				"INSERT OR REPLACE INTO llm_results (key, model, result, created_at, last_used, input)"
+				" VALUES (?, ?, ?, ?, ?, ?)",
+				(key, model, json.dumps(result), now, now, input_text),
+			)
+			self._conn.commit()
+
+	def results(self, model: Optional[str] = None) -> List[Dict]:
+		"""All unexpired cached results (optionally for one model), e.g. as training data."""
+		query = "SELECT result FROM llm_results WHERE created_at >= ?"
+		params: list = [time.time() - self.ttl_seconds]
+		if model:
+			query += " AND model = ?"
+			params.append(model)
+		with self._lock:
+			rows = self._conn.execute(query, params).fetchall()
+		return [json.loads(row[0]) for row in rows]
+
+	def examples(self, model: Optional[str] = None) -> List[Tuple[str, Dict]]:
+		"""(input text, result) of unexpired results that stored their input, as classifier training data."""
+		query = "SELECT input, result FROM llm_results WHERE created_at >= ? AND input IS NOT NULL"
+		params: list = [time.time() - self.ttl_seconds]
+		if model:
+			query += " AND model = ?"
+			params.append(model)
+		with self._lock:
+			rows = self._conn.execute(query, params).fetchall()
+		return [(text, json.loads(result)) for text, result in rows]
+
+	def evict(self) -> int:
+		"""Drop expired entries, then the least recently used beyond max_entries."""
+		with self._lock:
+			removed = self._conn.execute(
+				"DELETE FROM llm_results WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+			).rowcount
+			count = self._conn.execute("SELECT COUNT(*) FROM llm_results").fetchone()[0]
+			if count > self.max_entries:
+				removed += self._conn.execute(
+					"DELETE FROM llm_results WHERE key IN ("
+					" SELECT key FROM llm_results ORDER BY last_used ASC LIMIT ?)",
+					(count - self.max_entries,),
+				).rowcount
+			self._conn.commit()
+		return removed
@@ -0,0 +1,177 @@
+"""
+Cheap local classifier used as the first stage of the model cascade.
+Hashed bag-of-words (unigrams + bigrams) with a softmax category model and a
+linear importance-score model, trained in NumPy from past GPT labels (LLM cache)
+and user ratings (feedback store). Training uses the article text GPT was given,
+the same text decide() scores, never GPT's rewritten title and summary. Only
+confident predictions are used; the rest escalate to the LLM.
+"""
+
+import re
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.feedback_store import FeedbackStore, get_feedback_store, rating_level
+from src.report import importance_level
+
+
+N_FEATURES = 2 ** 14
+# Importance targets by rating_level (legacy binary ratings map to 1 and 4)
+RATING_SCORES = {1: 10, 2: 30, 3: 55, 4: 80, 5: 95}
+
+_TOKEN_RE = re.compile(r"[a-z0-9&]+")
+
+
+def hash_features(text: str, n_features: int = N_FEATURES) -> Tuple[np.ndarray, np.ndarray]:
+	"""Sparse (indices, values) for a text: log term counts, L2-normalised."""
+	words = _TOKEN_RE.findall(text.lower())
+	tokens = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+	if not tokens:
+		return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+	# crc32 is stable across runs, unlike hash()
+	indices, counts = np.unique(
+		np.array([zlib.crc32(t.encode("utf-8")) % n_features for t in tokens], dtype=np.int64),
+		return_counts=True,
+	)
+	values = np.log1p(counts).astype(np.float32)
+	return indices, values / np.linalg.norm(values)
+
+
+def _stack(rows: List[Tuple[np.ndarray, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+	"""Concatenate sparse rows into (row ids, feature indices, values)."""
+	row_ids = np.repeat(np.arange(len(rows)), [len(indices) for indices, _ in rows])
+	if not rows:
+		return row_ids, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+	return row_ids, np.concatenate([indices for indices, _ in rows]), np.concatenate([values for _, values in rows])
+
+
+def _matmul(rows: Tuple[np.ndarray, np.ndarray, np.ndarray], n_rows: int, W: np.ndarray) -> np.ndarray:
+	"""Sparse rows @ W without materialising the dense feature matrix."""
+	row_ids, indices, values = rows
+	out = np.zeros((n_rows,) + W.shape[1:], dtype=np.float32)
+	np.add.at(out, row_ids, W[indices] * (values[:, None] if W.ndim == 2 else values))
+	return out
+
+
+def _gradient(rows: Tuple[np.ndarray, np.ndarray, np.ndarray], delta: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+	"""Sparse rows.T @ delta."""
+	row_ids, indices, values = rows
+	grad = np.zeros(shape, dtype=np.float32)
+	np.add.at(grad, indices, delta[row_ids] * (values[:, None] if delta.ndim == 2 else values))
+	return grad
+
+
+def article_text(article: Dict) -> str:
+	return f"{article.get('title') or ''} {article.get('description') or article.get('summary') or ''}"
+
+
+def load_training_data(examples: List[Tuple[str, Dict]], feedback: Optional[FeedbackStore] = None) -> Tuple[List[Tuple[str, str, float]], List[Tuple[str, float]]]:
+	"""
+	Category examples (text, category, score) from past GPT results, given as
+	(input text, result) pairs (LLMCache.examples()), and score-only examples
+	(text, score) from user ratings. A rated article GPT has classified is
+	represented by its input text too; others fall back to the rated title and summary.
+	"""
+	labelled = []
+	inputs = {}
+	for text, obj in examples:
+		if obj.get("link"):
+			inputs[obj["link"]] = text
+		category = obj.get("category")
+		try:
+			score = float(obj.get("importance_score"))
+		except (TypeError, ValueError):
+			continue
+		if category:
+			labelled.append((text, category, score))
+
+	rated = []
+	for entry in (feedback or get_feedback_store()).entries():
+		score = RATING_SCORES.get(rating_level(entry))
+		text = inputs.get(entry.get("article_url")) or f"{entry.get('article_title') or ''} {entry.get('article_summary') or ''}".strip()
+		if score is not None and text:
+			rated.append((text, float(score)))
+	return labelled, rated
+
+
+class LocalClassifier:
+	def __init__(self, categories: List[str], n_features: int = N_FEATURES) -> None:
+		self.categories = list(categories)
+		self.n_features = n_features
+		self.W = np.zeros((n_features, len(self.categories)), dtype=np.float32)
+		self.b = np.zeros(len(self.categories), dtype=np.float32)
+		# Score model works on a 0-1 scale so the same learning rate suits both heads
+		self.score_w = np.zeros(n_features, dtype=np.float32)
+		self.score_b = 0.5
+		self.trained = False
+
+	def train(self, labelled: List[Tuple[str, str, float]], rated: List[Tuple[str, float]],
+	          epochs: int = 30, lr: float = 0.5, l2: float = 1e-4, batch_size: int = 32, seed: int = 0,
+	          min_examples: int = 50, max_steps: int = 3000) -> None:
+		"""
+		Mini-batch gradient descent: softmax regression for category, least squares for score.
+		With fewer than min_examples category examples the model stays untrained and decides nothing.
+		Large training sets get fewer epochs so training stays within about max_steps updates.
+		"""
+		index = {c: i for i, c in enumerate(self.categories)}
+		labelled = [ex for ex in labelled if ex[1] in index]
+		cat_rows = [hash_features(text, self.n_features) for text, _, _ in labelled]
+		y = np.array([index[c] for _, c, _ in labelled], dtype=np.int64)
+		score_rows = cat_rows + [hash_features(text, self.n_features) for text, _ in rated]
+		targets = np.array([s for _, _, s in labelled] + [s for _, s in rated], dtype=np.float32) / 100.0
+		if len(cat_rows) < min_examples:
+			return
+
+		rng = np.random.default_rng(seed)
+		self.score_b = float(targets.mean())
+		epochs = max(1, min(epochs, max_steps * batch_size // len(score_rows)))
+		for _ in range(epochs):
+			order = rng.permutation(len(cat_rows))
+			for start in range(0, len(order), batch_size):
+				batch = order[start:start + batch_size]
+				X = _stack([cat_rows[i] for i in batch])
+				probs = self._softmax(_matmul(X, len(batch), self.W) + self.b)
+				probs[np.arange(len(batch)), y[batch]] -= 1.0
+				self.W -= lr * (_gradient(X, probs, self.W.shape) / len(batch) + l2 * self.W)
+				self.b -= lr * probs.mean(axis=0)
+
+			order = rng.permutation(len(score_rows))
+			for start in range(0, len(order), batch_size):
+				batch = order[start:start + batch_size]
+				X = _stack([score_rows[i] for i in batch])
+				error = _matmul(X, len(batch), self.score_w) + self.score_b - targets[batch]
+				self.score_w -= lr * (_gradient(X, error, self.score_w.shape) / len(batch) + l2 * self.score_w)
+		self.trained = True
+
+	@staticmethod
+	def _softmax(logits: np.ndarray) -> np.ndarray:
+		logits = logits - logits.max(axis=1, keepdims=True)
+		exp = np.exp(logits)
+		return exp / exp.sum(axis=1, keepdims=True)
+
+	def predict(self, texts: List[str]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+		"""(category, confidence, importance score) for each text."""
+		X = _stack([hash_features(text, self.n_features) for text in texts])
+		probs = self._softmax(_matmul(X, len(texts), self.W) + self.b)
+		best = probs.argmax(axis=1)
+		scores = np.clip((_matmul(X, len(texts), self.score_w) + self.score_b) * 100.0, 0, 100)
+		return [self.categories[i] for i in best], probs[np.arange(len(texts)), best], scores
+
+	def decide(self, article: Dict, threshold: float) -> Optional[Dict]:
+		"""Result object for a confident prediction, or None if the article should go to the LLM."""
+		if not self.trained:
+			return None
+		categories, confidence, scores = self.predict([article_text(article)])
+		if confidence[0] < threshold:
+			return None
+		score = int(round(float(scores[0])))
+		return {
+			"title": article.get("title") or "Untitled",
+			"summary": (article.get("description") or "")[:300],
+			"importance_score": score,
+			"importance_label": importance_level(score),
+			"category": categories[0],
+			"link": article.get("url"),
+		}
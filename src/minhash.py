@@ -0,0 +1,61 @@
+"""
+MinHash signatures and an LSH banding index for near-duplicate candidate search.
+Items whose signatures collide in at least one band become candidates; callers
+still run their exact similarity checks on those candidates only.
+"""
+
+import zlib
+from typing import Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+
+
+# Mersenne prime for the universal hash family; inputs stay below it so a*x fits in uint64
+_PRIME = (1 << 31) - 1
+
+
+class MinHasher:
+	def __init__(self, num_perm: int = 64, seed: int = 1) -> None:
+		rng = np.random.default_rng(seed)
+		self.num_perm = num_perm
+		self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+		self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+	def signature(self, shingles: Iterable[str]) -> np.ndarray:
+		"""num_perm minimum hash values over the shingle set (all max values for an empty set)."""
+		hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) % _PRIME for s in set(shingles)), dtype=np.uint64)
+		if hashes.size == 0:
+			return np.full(self.num_perm, _PRIME, dtype=np.uint64)
+		return ((np.outer(hashes, self._a) + self._b) % _PRIME).min(axis=0)
+
+
+def estimate_jaccard(sig1: np.ndarray, sig2: np.ndarray) -> float:
+	return float(np.mean(sig1 == sig2))
+
+
+class LSHIndex:
+	"""
+	Banded LSH over MinHash signatures: `bands` bands of num_perm // bands rows each.
+	Pairs with Jaccard similarity around (1 / bands) ** (1 / rows) or above are likely to collide.
+	"""
+
+	def __init__(self, num_perm: int = 64, bands: int = 16) -> None:
+		if num_perm % bands:
+			raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+		self.bands = bands
+		self.rows = num_perm // bands
+		self._buckets: List[Dict[bytes, Set[int]]] = [{} for _ in range(bands)]
+
+	def _keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+		return [(band, signature[band * self.rows:(band + 1) * self.rows].tobytes()) for band in range(self.bands)]
+
+	def add(self, item_id: int, signature: np.ndarray) -> None:
+		for band, key in self._keys(signature):
+			self._buckets[band].setdefault(key, set()).add(item_id)
+
+	def query(self, signature: np.ndarray) -> Set[int]:
+		"""Ids sharing at least one band bucket with signature."""
+		candidates: Set[int] = set()
+		for band, key in self._keys(signature):
+			candidates.update(self._buckets[band].get(key, ()))
+		return candidates
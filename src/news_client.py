@@ -1,11 +1,14 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 import requests
 from datetime import datetime
 
+from src.http_transport import HTTPTransport, get_transport
+
 
 class NewsClient:
-	def __init__(self, api_key: str) -> None:
+	def __init__(self, api_key: str, transport: Optional[HTTPTransport] = None) -> None:
 		self.api_key = api_key
+		self.transport = transport or get_transport()
 		self.base_url = "https://newsapi.org/v2/everything"
 
 	def search(self, query: str, since: str, page_size: int = 10) -> List[Dict]:
@@ -19,7 +22,7 @@ class NewsClient:
 		}
 		headers = {"X-Api-Key": self.api_key}
 		try:
-			resp = requests.get(self.base_url, params=params, headers=headers, timeout=30)
+			resp = self.transport.get(self.base_url, source="newsapi", params=params, headers=headers)
 			resp.raise_for_status()
 		except requests.exceptions.HTTPError as e:
 			if e.response.status_code == 426:  # Upgrade Required
@@ -30,7 +33,7 @@ class NewsClient:
 					"q": "Australia",  # Very simple query for testing
 					"pageSize": max(1, min(page_size, 100)),
 				}
-				resp = requests.get(top_headlines_url, params=params, headers=headers, timeout=30)
+				resp = self.transport.get(top_headlines_url, source="newsapi", params=params, headers=headers)
 				resp.raise_for_status()
 			else:
 				raise
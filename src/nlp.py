@@ -1,65 +1,167 @@
-from typing import Dict
-import time
-from openai import OpenAI
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
+import re
+import threading
+from openai import OpenAI, RateLimitError
 
+from src.llm_cache import LLMCache
+from src.local_classifier import LocalClassifier, article_text
+from src.rate_limiter import RateLimiter
 
-PROMPT_TEMPLATE = (
-	"Analyze this news item and return JSON with: title (concise headline), summary (1-3 sentences, facts only), "
+
+SYSTEM_PROMPT = "Concise market intelligence analyst. Output JSON only."
+
+ANALYSIS_FIELDS = (
+	"title (concise headline), summary (1-3 sentences, facts only), "
 	"importance_score (0-100: 91-100=Very Important, 75-90=Important, 50-74=Moderately Important, 25-49=Less Important, 0-24=Not Important), "
 	"importance_label (Very Important|Important|Moderately Important|Less Important|Not Important), "
 	"category (Competition|Regulation|Disruptive Trends and Technological Advancements|Consumer Behaviour and Insights|Market Trends), "
-	"link (original url). Default category: {default_category}. Return only JSON."
+	"link (original url)."
+)
+
+PROMPT_TEMPLATE = (
+	"Analyze this news item and return JSON with: " + ANALYSIS_FIELDS + " Default category: {default_category}. Return only JSON."
+)
+
+BATCH_PROMPT_TEMPLATE = (
+	"Analyze each numbered news item above. Return a JSON object {\"items\": [...]} with one element per item, "
+	"each containing index (the item number) and: " + ANALYSIS_FIELDS + " "
+	"If an item's category is unclear use its Default category. Return only JSON."
 )
 
+# Changes whenever the prompts change, so cached results from an older prompt are not reused
+PROMPT_VERSION = hashlib.sha256((SYSTEM_PROMPT + PROMPT_TEMPLATE + BATCH_PROMPT_TEMPLATE).encode("utf-8")).hexdigest()[:12]
+
+MAX_RESPONSE_TOKENS = 300
+# Typical response size per item in batch mode (used to size batches against max_tokens)
+BATCH_TOKENS_PER_ITEM = 160
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+	"""Parse OpenAI reset durations such as '20ms', '1s' or '6m0s' into seconds."""
+	if not value:
+		return None
+	try:
+		return float(value)
+	except ValueError:
+		pass
+	units = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+	parts = re.findall(r"([\d.]+)(ms|h|m|s)", value)
+	if not parts:
+		return None
+	return sum(float(number) * units[unit] for number, unit in parts)
+
 
 class OpenAINLP:
-	def __init__(self, api_key: str, model: str) -> None:
+	def __init__(self, api_key: str, model: str, cache: Optional[LLMCache] = None,
+	             requests_per_minute: float = 3, tokens_per_minute: float = 40000,
+	             max_workers: int = 4, max_retries: int = 5,
+	             batch_size: int = 1, batch_max_tokens: int = 4000,
+	             local: Optional[LocalClassifier] = None, local_threshold: float = 0.85) -> None:
 		self.client = OpenAI(api_key=api_key)
 		self.model = model
-		self.last_request_time = 0
+		self.cache = cache or LLMCache()
+		self.limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+		self.max_workers = max_workers
+		self.max_retries = max_retries
+		# Items per batched request, capped so the expected response fits batch_max_tokens
+		self.batch_size = max(1, min(batch_size, batch_max_tokens // BATCH_TOKENS_PER_ITEM))
+		self.batch_max_tokens = batch_max_tokens
+		self.cache_hits = 0
+		self.cache_misses = 0
+		self.batch_fallbacks = 0
+		# Cascade: confident local-classifier decisions skip the LLM
+		self.local = local
+		self.local_threshold = local_threshold
+		self.local_decisions = 0
+		self._stats_lock = threading.Lock()
+
+	def process_articles(self, jobs: List[Tuple[Dict, str]]) -> List[Dict]:
+		"""Process (article, default_category) pairs concurrently; results keep input order."""
+		if not jobs:
+			return []
+		if self.batch_size <= 1:
+			workers = max(1, min(self.max_workers, len(jobs)))
+			with ThreadPoolExecutor(max_workers=workers) as pool:
+				return list(pool.map(lambda job: self.process_article(*job), jobs))
+
+		# Batch mode: resolve cache hits and confident local decisions first, then send the misses N at a time
+		results: List[Optional[Dict]] = [None] * len(jobs)
+		misses: List[int] = []
+		for i, (article, default_category) in enumerate(jobs):
+			resolved = self.resolve_locally(article, default_category)
+			if resolved is not None:
+				results[i] = self.finalize_result(resolved, article)
+			else:
+				misses.append(i)
+
+		chunks = [misses[i:i + self.batch_size] for i in range(0, len(misses), self.batch_size)]
+		if chunks:
+			workers = max(1, min(self.max_workers, len(chunks)))
+			with ThreadPoolExecutor(max_workers=workers) as pool:
+				for chunk, objs in zip(chunks, pool.map(lambda chunk: self._classify_batch([jobs[i] for i in chunk]), chunks)):
+					for i, obj in zip(chunk, objs):
+						results[i] = self.finalize_result(obj, jobs[i][0])
+		return results
 
 	def process_article(self, article: Dict, default_category: str) -> Dict:
-		# Rate limiting: wait 25 seconds between requests (3 requests per minute)
-		current_time = time.time()
-		time_since_last = current_time - self.last_request_time
-		if time_since_last < 25:
-			wait_time = 25 - time_since_last
-			print(f"    Rate limiting: waiting {wait_time:.1f} seconds...")
-			time.sleep(wait_time)
-		self.last_request_time = time.time()
-		
+		# Cache hits and confident local decisions skip the rate limiter and the API call entirely
+		obj = self.resolve_locally(article, default_category)
+		if obj is None:
+			obj = self._classify(article, default_category)
+		return self.finalize_result(obj, article)
+
+	def _truncate(self, article: Dict) -> Tuple[str, str, str]:
 		# Truncate content to reduce token usage (keep first 500 chars)
 		title = (article.get("title") or "")[:200]
 		description = (article.get("description") or "")[:300]
 		content = (article.get("content") or "")[:500]
-		
-		# Simplified payload - only essential fields
-		payload = f"Title: {title}\nDesc: {description}\nContent: {content}\nURL: {article.get('url')}"
-		
-		prompt = PROMPT_TEMPLATE.format(default_category=default_category)
-		messages = [
-			{"role": "system", "content": "Concise market intelligence analyst. Output JSON only."},
-			{"role": "user", "content": f"{payload}\n\n{prompt}"},
-		]
-		completion = self.client.chat.completions.create(
-			model=self.model, 
-			messages=messages, 
-			temperature=0.2,
-			max_tokens=300  # Limit response tokens
-		)
-		text = completion.choices[0].message.content or "{}"
-		try:
-			import json
-			obj = json.loads(text)
-		except Exception:
-			obj = {
-				"title": article.get("title") or "Untitled",
-				"summary": article.get("description") or "",
-				"importance_score": 0,
-				"importance_label": "Not Important",
-				"category": default_category,
-				"link": article.get("url"),
-			}
+		return title, description, content
+
+	def _cache_key(self, article: Dict, default_category: str) -> str:
+		title, description, content = self._truncate(article)
+		return LLMCache.make_key(title, description, content, self.model, PROMPT_VERSION, default_category)
+
+	def cached_result(self, article: Dict, default_category: str) -> Optional[Dict]:
+		"""Cached result for this article (link updated to the article's URL), or None."""
+		obj = self.cache.get(self._cache_key(article, default_category))
+		with self._stats_lock:
+			if obj is not None:
+				self.cache_hits += 1
+			else:
+				self.cache_misses += 1
+		if obj is not None and article.get("url"):
+			obj["link"] = article.get("url")
+		return obj
+
+	def resolve_locally(self, article: Dict, default_category: str) -> Optional[Dict]:
+		"""Cached LLM result or a confident local-classifier decision; None means the LLM is needed."""
+		obj = self.cached_result(article, default_category)
+		if obj is None and self.local is not None:
+			obj = self.local.decide(article, self.local_threshold)
+			if obj is not None:
+				with self._stats_lock:
+					self.local_decisions += 1
+		return obj
+
+	@property
+	def llm_decisions(self) -> int:
+		"""Articles that needed the LLM (cache misses the local classifier was unsure about)."""
+		return self.cache_misses - self.local_decisions
+
+	def fallback_result(self, article: Dict, default_category: str) -> Dict:
+		return {
+			"title": article.get("title") or "Untitled",
+			"summary": article.get("description") or "",
+			"importance_score": 0,
+			"importance_label": "Not Important",
+			"category": default_category,
+			"link": article.get("url"),
+		}
+
+	def finalize_result(self, obj: Dict, article: Dict) -> Dict:
 		# If this came from RSS or Legislation, prefix the title
 		source_type = article.get("_source_type")
 		if source_type in ("RSS", "Legislation"):
@@ -68,3 +170,121 @@ class OpenAINLP:
 			if not title.startswith(tag):
 				obj["title"] = f"{tag} {title}"
 		return obj
+
+	def _payload(self, article: Dict) -> str:
+		# Simplified payload - only essential fields
+		title, description, content = self._truncate(article)
+		return f"Title: {title}\nDesc: {description}\nContent: {content}\nURL: {article.get('url')}"
+
+	def _complete(self, messages: List[Dict], max_tokens: int) -> str:
+		"""Chat completion under the rate limiter, backing off on 429 and exhausted quotas."""
+		estimated_tokens = sum(len(m["content"]) for m in messages) // 4 + max_tokens
+		for attempt in range(self.max_retries + 1):
+			waited = self.limiter.acquire(estimated_tokens)
+			if waited > 1:
+				print(f"    Rate limiting: waited {waited:.1f} seconds...")
+			try:
+				raw = self.client.chat.completions.with_raw_response.create(
+					model=self.model,
+					messages=messages,
+					temperature=0.2,
+					max_tokens=max_tokens  # Limit response tokens
+				)
+			except RateLimitError as e:
+				if attempt >= self.max_retries:
+					raise
+				headers = e.response.headers if e.response is not None else {}
+				delay = (
+					_parse_reset(headers.get("retry-after"))
+					or _parse_reset(headers.get("x-ratelimit-reset-requests"))
+					or min(60.0, 2.0 ** (attempt + 1))
+				)
+				print(f"    OpenAI rate limit hit; backing off {delay:.1f} seconds...")
+				self.limiter.pause(delay)
+				continue
+
+			# Pre-emptively pause when the account reports no headroom left
+			for remaining_key, reset_key in (("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests"),
+			                                 ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens")):
+				remaining = raw.headers.get(remaining_key)
+				if remaining is not None and remaining.isdigit() and int(remaining) == 0:
+					reset = _parse_reset(raw.headers.get(reset_key))
+					if reset:
+						self.limiter.pause(reset)
+			completion = raw.parse()
+			return completion.choices[0].message.content or "{}"
+
+	def messages_for(self, article: Dict, default_category: str) -> List[Dict]:
+		"""Chat messages for classifying one article."""
+		prompt = PROMPT_TEMPLATE.format(default_category=default_category)
+		return [
+			{"role": "system", "content": SYSTEM_PROMPT},
+			{"role": "user", "content": f"{self._payload(article)}\n\n{prompt}"},
+		]
+
+	def parse_result(self, text: str, article: Dict, default_category: str, store: bool = True) -> Dict:
+		"""Parse a single-article response; cache it (if store), or return the fallback object."""
+		try:
+			obj = json.loads(text)
+			# Only successful parses are cached; fallbacks get retried next run
+			if store:
+				self.store_result(article, default_category, obj)
+		except Exception:
+			obj = self.fallback_result(article, default_category)
+		return obj
+
+	def store_result(self, article: Dict, default_category: str, obj: Dict) -> None:
+		# The article's own text, as LocalClassifier.decide() sees it, is its training input
+		self.cache.put(self._cache_key(article, default_category), self.model, obj, input_text=article_text(article))
+
+	def _classify(self, article: Dict, default_category: str) -> Dict:
+		text = self._complete(self.messages_for(article, default_category), MAX_RESPONSE_TOKENS)
+		return self.parse_result(text, article, default_category)
+
+	def _parse_batch_response(self, text: str, count: int) -> Dict[int, Dict]:
+		"""Map item index -> result object; unparseable or missing items are left out."""
+		try:
+			data = json.loads(text)
+		except Exception:
+			return {}
+		if isinstance(data, dict):
+			data = data.get("items") or next((v for v in data.values() if isinstance(v, list)), [])
+		parsed: Dict[int, Dict] = {}
+		for item in data if isinstance(data, list) else []:
+			if not isinstance(item, dict):
+				continue
+			try:
+				index = int(item.pop("index"))
+			except (KeyError, TypeError, ValueError):
+				continue
+			if 0 <= index < count and item.get("category"):
+				parsed[index] = item
+		return parsed
+
+	def _classify_batch(self, jobs: List[Tuple[Dict, str]]) -> List[Dict]:
+		"""Classify several articles in one request; items that fail fall back to the single-article path."""
+		if len(jobs) == 1:
+			return [self._classify(*jobs[0])]
+
+		blocks = [
+			f"[{i}] {self._payload(article)}\nDefault category: {default_category}"
+			for i, (article, default_category) in enumerate(jobs)
+		]
+		messages = [
+			{"role": "system", "content": SYSTEM_PROMPT},
+			{"role": "user", "content": "\n\n".join(blocks) + "\n\n" + BATCH_PROMPT_TEMPLATE},
+		]
+		max_tokens = min(self.batch_max_tokens, BATCH_TOKENS_PER_ITEM * len(jobs))
+		parsed = self._parse_batch_response(self._complete(messages, max_tokens), len(jobs))
+
+		results: List[Dict] = []
+		for i, (article, default_category) in enumerate(jobs):
+			obj = parsed.get(i)
+			if obj is None:
+				with self._stats_lock:
+					self.batch_fallbacks += 1
+				obj = self._classify(article, default_category)
+			else:
+				self.store_result(article, default_category, obj)
+			results.append(obj)
+		return results
@@ -0,0 +1,64 @@
+"""
+Thread-safe token-bucket rate limiter for API calls.
+Enforces requests-per-minute and tokens-per-minute budgets at the same time,
+and can be paused for a while when the API answers 429 or reports no headroom.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+	"""Bucket refilled continuously at `rate_per_minute`, holding at most `capacity`."""
+
+	def __init__(self, rate_per_minute: float, capacity: Optional[float] = None) -> None:
+		self.rate = rate_per_minute / 60.0
+		self.capacity = capacity if capacity is not None else rate_per_minute
+		self.level = self.capacity
+		self.updated = time.monotonic()
+
+	def refill(self, now: float) -> None:
+		self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+		self.updated = now
+
+	def wait_time(self, amount: float) -> float:
+		"""Seconds until `amount` is available (0 if available now)."""
+		# Requests larger than the bucket only have to wait for a full bucket
+		amount = min(amount, self.capacity)
+		if self.level >= amount:
+			return 0.0
+		return (amount - self.level) / self.rate
+
+
+class RateLimiter:
+	def __init__(self, requests_per_minute: float, tokens_per_minute: float, request_burst: float = 1) -> None:
+		self.requests = TokenBucket(requests_per_minute, capacity=request_burst)
+		self.tokens = TokenBucket(tokens_per_minute)
+		self._paused_until = 0.0
+		self._lock = threading.Lock()
+
+	def acquire(self, tokens: int) -> float:
+		"""Block until one request and `tokens` tokens fit the budget; returns seconds waited."""
+		waited = 0.0
+		while True:
+			with self._lock:
+				now = time.monotonic()
+				self.requests.refill(now)
+				self.tokens.refill(now)
+				wait = max(
+					self._paused_until - now,
+					self.requests.wait_time(1),
+					self.tokens.wait_time(tokens),
+				)
+				if wait <= 0:
+					self.requests.level -= 1
+					self.tokens.level -= min(tokens, self.tokens.capacity)
+					return waited
+			time.sleep(wait)
+			waited += wait
+
+	def pause(self, seconds: float) -> None:
+		"""Hold back every caller for `seconds` (e.g. after a 429 or exhausted quota)."""
+		with self._lock:
+			self._paused_until = max(self._paused_until, time.monotonic() + seconds)
@@ -3,17 +3,68 @@ Web scrapers for Australian and NZ financial regulators.
 Targets media releases and news pages directly since RSS feeds are broken.
 """
 
-from typing import List, Dict
-import requests
+from typing import Callable, List, Dict, Optional
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone
 from dateutil import parser as dateparser
 
+from src.http_cache import ConditionalCache, get_http_cache
+
 
 class RegulatorScrapers:
-	def __init__(self):
-		self.timeout = 15
-		self.headers = {"User-Agent": "Mozilla/5.0 (compatible; AI Market Intelligence Bot)"}
+	def __init__(self, cache: Optional[ConditionalCache] = None):
+		self.cache = cache or get_http_cache()
+	
+	def _fetch_page(self, url: str, parse_page: Callable[[str, int], List[Dict]], max_items: int) -> List[Dict]:
+		"""Fetch a listing page (conditional GET) and parse it; 304 reuses the cached parse."""
+		return self.cache.fetch(
+			url,
+			lambda resp: parse_page(resp.text, max_items),
+			key=f"{url}#max={max_items}",
+			source="regulator",
+		)
+	
+	def _parse_asic_page(self, html: str, max_items: int) -> List[Dict]:
+		"""Parse ASIC media release items (unfiltered by date)."""
+		soup = BeautifulSoup(html, 'html.parser')
+		results = []
+		
+		# Find media release items (typical structure)
+		items = soup.find_all(['article', 'div', 'li'], class_=lambda x: x and ('release' in x.lower() or 'item' in x.lower() or 'result' in x.lower()) if x else False)
+		
+		for item in items[:max_items]:
+			link_tag = item.find('a')
+			if not link_tag:
+				continue
+			
+			title = link_tag.get_text(strip=True)
+			href = link_tag.get('href', '')
+			if href and not href.startswith('http'):
+				href = f"https://asic.gov.au{href}"
+			
+			# Try to extract date
+			date_tag = item.find(['time', 'span'], class_=lambda x: x and 'date' in x.lower() if x else False)
+			pub_date = None
+			if date_tag:
+				date_str = date_tag.get('datetime') or date_tag.get_text(strip=True)
+				try:
+					pub_date = dateparser.parse(date_str)
+					if pub_date and not pub_date.tzinfo:
+						pub_date = pub_date.replace(tzinfo=timezone.utc)
+				except:
+					pass
+			
+			results.append({
+				"title": title,
+				"description": title,  # No description from listing page
+				"content": title,
+				"url": href,
+				"source": "ASIC",
+				"publishedAt": pub_date.isoformat() if pub_date else None,
+				"_source_type": "Regulator",
+			})
+		
+		return results
 	
 	def scrape_asic(self, since: str, max_items: int = 20) -> List[Dict]:
 		"""Scrape ASIC media releases."""
@@ -26,48 +77,12 @@ class RegulatorScrapers:
 		
 		try:
 			print(f"    Scraping ASIC: {url}")
-			resp = requests.get(url, timeout=self.timeout, headers=self.headers)
-			resp.raise_for_status()
-			soup = BeautifulSoup(resp.text, 'html.parser')
-			
-			# Find media release items (typical structure)
-			items = soup.find_all(['article', 'div', 'li'], class_=lambda x: x and ('release' in x.lower() or 'item' in x.lower() or 'result' in x.lower()) if x else False)
-			
-			for item in items[:max_items]:
-				link_tag = item.find('a')
-				if not link_tag:
-					continue
-				
-				title = link_tag.get_text(strip=True)
-				href = link_tag.get('href', '')
-				if href and not href.startswith('http'):
-					href = f"https://asic.gov.au{href}"
-				
-				# Try to extract date
-				date_tag = item.find(['time', 'span'], class_=lambda x: x and 'date' in x.lower() if x else False)
-				pub_date = None
-				if date_tag:
-					date_str = date_tag.get('datetime') or date_tag.get_text(strip=True)
-					try:
-						pub_date = dateparser.parse(date_str)
-						if pub_date and not pub_date.tzinfo:
-							pub_date = pub_date.replace(tzinfo=timezone.utc)
-					except:
-						pass
-				
+			for item in self._fetch_page(url, self._parse_asic_page, max_items):
 				# Filter by date
-				if pub_date and pub_date <= since_dt:
+				pub_date = item["publishedAt"]
+				if pub_date and datetime.fromisoformat(pub_date) <= since_dt:
 					continue
-				
-				results.append({
-					"title": title,
-					"description": title,  # No description from listing page
-					"content": title,
-					"url": href,
-					"source": "ASIC",
-					"publishedAt": pub_date.isoformat() if pub_date else None,
-					"_source_type": "Regulator",
-				})
+				results.append(item)
 			
 			print(f"    Found {len(results)} ASIC items")
 		except Exception as e:
@@ -75,6 +90,35 @@ class RegulatorScrapers:
 		
 		return results
 	
+	def _parse_apra_page(self, html: str, max_items: int) -> List[Dict]:
+		"""Parse APRA news and publications items."""
+		soup = BeautifulSoup(html, 'html.parser')
+		results = []
+		
+		items = soup.find_all(['article', 'div', 'li'], class_=lambda x: x and ('news' in x.lower() or 'item' in x.lower()) if x else False)
+		
+		for item in items[:max_items]:
+			link_tag = item.find('a')
+			if not link_tag:
+				continue
+			
+			title = link_tag.get_text(strip=True)
+			href = link_tag.get('href', '')
+			if href and not href.startswith('http'):
+				href = f"https://www.apra.gov.au{href}"
+			
+			results.append({
+				"title": title,
+				"description": title,
+				"content": title,
+				"url": href,
+				"source": "APRA",
+				"publishedAt": None,
+				"_source_type": "Regulator",
+			})
+		
+		return results
+	
 	def scrape_apra(self, since: str, max_items: int = 20) -> List[Dict]:
 		"""Scrape APRA news and publications."""
 		since_dt = dateparser.parse(since)
@@ -86,32 +130,7 @@ class RegulatorScrapers:
 		
 		try:
 			print(f"    Scraping APRA: {url}")
-			resp = requests.get(url, timeout=self.timeout, headers=self.headers)
-			resp.raise_for_status()
-			soup = BeautifulSoup(resp.text, 'html.parser')
-			
-			items = soup.find_all(['article', 'div', 'li'], class_=lambda x: x and ('news' in x.lower() or 'item' in x.lower()) if x else False)
-			
-			for item in items[:max_items]:
-				link_tag = item.find('a')
-				if not link_tag:
-					continue
-				
-				title = link_tag.get_text(strip=True)
-				href = link_tag.get('href', '')
-				if href and not href.startswith('http'):
-					href = f"https://www.apra.gov.au{href}"
-				
-				results.append({
-					"title": title,
-					"description": title,
-					"content": title,
-					"url": href,
-					"source": "APRA",
-					"publishedAt": None,
-					"_source_type": "Regulator",
-				})
-			
+			results = self._fetch_page(url, self._parse_apra_page, max_items)
 			print(f"    Found {len(results)} APRA items")
 		except Exception as e:
 			print(f"    Error scraping APRA: {e}")
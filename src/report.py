@@ -4,16 +4,21 @@ import os
 import re
 
 
+# (minimum score, label), highest first; anything lower is NOT_IMPORTANT
+IMPORTANCE_LEVELS = [
+	(91, "Very Important"),
+	(75, "Important"),
+	(50, "Moderately Important"),
+	(25, "Less Important"),
+]
+NOT_IMPORTANT = "Not Important"
+
+
 def importance_level(score: int) -> str:
-	if score >= 91:
-		return "Very Important"
-	if score >= 75:
-		return "Important"
-	if score >= 50:
-		return "Moderately Important"
-	if score >= 25:
-		return "Less Important"
-	return "Not Important"
+	for minimum, label in IMPORTANCE_LEVELS:
+		if score >= minimum:
+			return label
+	return NOT_IMPORTANT
 
 
 def clean_summary(summary: str, max_length: int = 350, title: str = "") -> str:
@@ -119,6 +124,11 @@ class ReportBuilder:
 			else:
 				link_text = ""
 			
+			# Other outlets that ran the same story (from cluster_articles)
+			also = [f"[{o.get('source') or o.get('title') or 'link'}]({o['link']})" for o in it.get("also_covered_by") or [] if o.get("link")]
+			if also:
+				link_text += f" | Also covered by: {', '.join(also)}"
+			
 			# If no summary after cleaning, just show title and link
 			if not summary:
 				lines.append(f"- **{title}** | Score: **{score}** ({label}) | {link_text}")
@@ -1,12 +1,24 @@
 from typing import Dict, List, Set, Optional
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import threading
 from dateutil import parser as dateparser
 import feedparser
 
+from src.http_cache import ConditionalCache, get_http_cache
+
 
 class RSSClient:
-	def __init__(self, feeds: List[str]) -> None:
+	def __init__(self, feeds: List[str], max_workers: int = 8, max_per_host: int = 2, timeout: float = 10,
+	             cache: Optional[ConditionalCache] = None) -> None:
 		self.feeds = feeds
+		self.cache = cache or get_http_cache()
+		self.max_workers = max_workers
+		self.max_per_host = max_per_host
+		self.timeout = timeout
+		self._host_slots: Dict[str, threading.Semaphore] = {}
+		self._host_lock = threading.Lock()
 
 	def _parse_date(self, entry) -> Optional[datetime]:
 		# Try multiple fields commonly present in RSS/Atom
@@ -22,41 +34,88 @@ class RSSClient:
 					continue
 		return None
 
+	def _host_slot(self, url: str) -> threading.Semaphore:
+		"""Semaphore capping concurrent requests to one host."""
+		host = urlparse(url).netloc.lower()
+		with self._host_lock:
+			if host not in self._host_slots:
+				self._host_slots[host] = threading.Semaphore(self.max_per_host)
+			return self._host_slots[host]
+
+	def _parse_feed(self, resp) -> Dict:
+		"""Reduce a feed response to the JSON-friendly fields fetch_since needs."""
+		parsed = feedparser.parse(resp.content, response_headers=dict(resp.headers))
+		entries = []
+		for entry in parsed.entries:
+			pub_dt = self._parse_date(entry)
+			entries.append({
+				"link": entry.get("link") or entry.get("id") or entry.get("guid"),
+				"title": entry.get("title"),
+				"summary": entry.get("summary") or entry.get("description"),
+				"publishedAt": pub_dt.isoformat() if pub_dt else None,
+			})
+		return {
+			"source": parsed.feed.get("title") if parsed and parsed.get("feed") else None,
+			"entries": entries,
+		}
+
+	def _fetch_feed(self, url: str) -> Dict:
+		"""Download one feed (conditional GET, per-request timeout) and parse it."""
+		with self._host_slot(url):
+			return self.cache.fetch(url, self._parse_feed, source="rss", timeout=self.timeout)
+
+	def _fetch_all(self, urls: List[str]) -> List[Dict]:
+		"""Fetch feeds concurrently; returns one outcome per URL, in input order."""
+		def fetch(url: str) -> Dict:
+			try:
+				return {"parsed": self._fetch_feed(url), "error": None}
+			except Exception as e:
+				return {"parsed": None, "error": e}
+
+		if not urls:
+			return []
+		workers = max(1, min(self.max_workers, len(urls)))
+		with ThreadPoolExecutor(max_workers=workers) as pool:
+			outcomes = list(pool.map(fetch, urls))
+		# One cache write for the whole fan-out
+		self.cache.flush()
+		return outcomes
+
 	def fetch_since(self, since_iso_date: str, max_items_per_feed: int = 100) -> List[Dict]:
 		"""Fetch and normalize entries newer than since_iso_date across all feeds."""
 		since_dt = dateparser.parse(since_iso_date)
 		if not since_dt.tzinfo:
 			since_dt = since_dt.replace(tzinfo=timezone.utc)
 
+		print(f"    Fetching {len(self.feeds)} RSS feeds ({self.max_workers} workers, {self.max_per_host} per host)...")
+		outcomes = self._fetch_all(self.feeds)
+
+		# Merge sequentially so ordering and cross-feed dedup match the feed list
 		seen: Set[str] = set()
 		results: List[Dict] = []
-		for i, url in enumerate(self.feeds):
-			print(f"    Fetching RSS feed {i+1}/{len(self.feeds)}: {url}")
-			try:
-				# Add timeout to prevent hanging
-				import socket
-				socket.setdefaulttimeout(10)
-				parsed = feedparser.parse(url)
-				print(f"    Found {len(parsed.entries)} entries in feed")
-			except Exception as e:
-				print(f"    Error fetching {url}: {e}")
+		for i, (url, outcome) in enumerate(zip(self.feeds, outcomes)):
+			print(f"    RSS feed {i+1}/{len(self.feeds)}: {url}")
+			if outcome["error"] is not None:
+				print(f"    Error fetching {url}: {outcome['error']}")
 				continue
-			for entry in parsed.entries[:max_items_per_feed]:
-				link = entry.get("link") or entry.get("id") or entry.get("guid")
+			parsed = outcome["parsed"]
+			print(f"    Found {len(parsed['entries'])} entries in feed")
+			for entry in parsed["entries"][:max_items_per_feed]:
+				link = entry["link"]
 				if not link or link in seen:
 					continue
-				pub_dt = self._parse_date(entry)
+				pub_dt = datetime.fromisoformat(entry["publishedAt"]) if entry["publishedAt"] else None
 				if pub_dt and pub_dt <= since_dt:
 					continue
 
 				seen.add(link)
 				normalized = {
-					"title": entry.get("title"),
-					"description": entry.get("summary") or entry.get("description"),
-					"content": entry.get("summary") or entry.get("description"),
+					"title": entry["title"],
+					"description": entry["summary"],
+					"content": entry["summary"],
 					"url": link,
-					"source": parsed.feed.get("title") if parsed and parsed.get("feed") else None,
-					"publishedAt": pub_dt.isoformat() if pub_dt else None,
+					"source": parsed["source"],
+					"publishedAt": entry["publishedAt"],
 					"_source_type": "RSS",
 				}
 				results.append(normalized)
@@ -1,76 +1,247 @@
 """
 Track articles that have already been reported to avoid duplicates across runs.
+Backed by SQLite (WAL mode) with one table per day (seen_YYYYMMDD, URL primary
+key), so a window is "the last N day tables" and expiry drops whole tables
+instead of deleting rows. A URL marked again on a later day is also in that
+day's table, so it survives until its latest day expires. A memory-mapped Bloom
+filter in front answers "definitely not seen" without touching the database,
+and each loaded window is cached as a sorted array of 64-bit URL hashes for
+lookups without SQL.
 """
+import hashlib
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Set
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set
 
+import numpy as np
 
+from src.bloom import BloomFilter
+
+
+SEEN_DB = "seen_articles.db"
+SEEN_BLOOM = "seen_articles.bloom"
+# Legacy JSONL log, imported once when the database is first created
 SEEN_FILE = "seen_articles.jsonl"
+# Default window for seen URLs; story fingerprints (src/simhash_store.py) use the same one
+DAYS_TO_KEEP = 30
+
+
+class SeenStore:
+	def __init__(self, path: str = SEEN_DB, legacy_path: Optional[str] = SEEN_FILE,
+	             bloom_path: str = SEEN_BLOOM) -> None:
+		self.path = path
+		created = not os.path.exists(path)
+		bloom_missing = not os.path.exists(bloom_path)
+		self.bloom = BloomFilter(bloom_path)
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(path, check_same_thread=False)
+		self._conn.execute("PRAGMA journal_mode=WAL")
+		# Day partitions present in the database ("YYYY-MM-DD")
+		self._days: Set[str] = set()
+		for (name,) in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB 'seen_[0-9]*'"):
+			digits = name[len("seen_"):]
+			self._days.add(f"{digits[:4]}-{digits[4:6]}-{digits[6:]}")
+		self._migrate_single_table()
+		# days_to_keep -> sorted uint64 URL hashes of that window
+		self._windows: Dict[int, np.ndarray] = {}
+		if bloom_missing and not created:
+			self.rebuild_bloom()
+		if created and legacy_path and os.path.exists(legacy_path):
+			imported = self.import_jsonl(legacy_path)
+			print(f"  Imported {imported} seen articles from {legacy_path}")
+
+	@staticmethod
+	def _table(day: str) -> str:
+		return "seen_" + day.replace("-", "")
+
+	def _migrate_single_table(self) -> None:
+		"""Move rows of the single `seen` table (databases from before day tables) into day tables."""
+		exists = self._conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'seen'").fetchone()
+		if not exists:
+			return
+		columns = {row[1] for row in self._conn.execute("PRAGMA table_info(seen)")}
+		day = "day" if "day" in columns else "date(seen_at, 'unixepoch', 'localtime')"
+		rows = self._conn.execute(f"SELECT url, seen_at, {day} FROM seen").fetchall()
+		self._insert(rows)
+		self._conn.execute("DROP TABLE seen")
+		self._conn.commit()
+
+	def _partitions(self, days_to_keep: Optional[int] = None) -> List[str]:
+		"""Day partitions inside the window (all of them when days_to_keep is None), oldest first."""
+		first = self._first_day(days_to_keep) if days_to_keep is not None else ""
+		return sorted(day for day in self._days if day >= first)
+
+	def _select_urls(self, days_to_keep: Optional[int] = None) -> Iterable[str]:
+		"""URLs of every partition in the window (a URL repeats if marked on several days); caller holds the lock."""
+		for day in self._partitions(days_to_keep):
+			cursor = self._conn.execute(f"SELECT url FROM {self._table(day)}")
+			while True:
+				rows = cursor.fetchmany(10000)
+				if not rows:
+					break
+				for row in rows:
+					yield row[0]
+
+	def rebuild_bloom(self) -> None:
+		"""Refill the Bloom filter from the database (drops bits of expired URLs)."""
+		self.bloom.clear()
+		with self._lock:
+			self.bloom.add(self._select_urls())
+
+	@staticmethod
+	def _first_day(days_to_keep: int) -> str:
+		"""Oldest day partition inside a days_to_keep window."""
+		return (date.today() - timedelta(days=days_to_keep)).isoformat()
+
+	@staticmethod
+	def _hash(url: str) -> int:
+		return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "little")
+
+	def _insert(self, rows: List[tuple]) -> None:
+		"""Write (url, seen_at, day) rows into their day tables, keeping the latest timestamp per URL and day."""
+		by_day: Dict[str, List[tuple]] = {}
+		for url, seen_at, day in rows:
+			by_day.setdefault(day, []).append((url, seen_at))
+		for day, day_rows in by_day.items():
+			table = self._table(day)
+			if day not in self._days:
+				self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (url TEXT PRIMARY KEY, seen_at REAL NOT NULL)")
+				self._days.add(day)
+			self._conn.executemany(
+				f"INSERT INTO {table} (url, seen_at) VALUES (?, ?)"
+				" ON CONFLICT(url) DO UPDATE SET seen_at = MAX(seen_at, excluded.seen_at)",
+				day_rows,
+			)
+
+	def _upsert(self, rows: List[tuple]) -> None:
+		"""Insert (url, seen_at, day) rows and merge them into the cached windows."""
+		with self._lock:
+			self._insert(rows)
+			self._conn.commit()
+			# Every cached window includes today, so new URLs join all of them
+			if self._windows:
+				added = np.array([self._hash(url) for url, _, _ in rows], dtype=np.uint64)
+				for days, window in self._windows.items():
+					self._windows[days] = np.union1d(window, added)
+
+	def window(self, days_to_keep: int = DAYS_TO_KEEP) -> np.ndarray:
+		"""Sorted 64-bit hashes of URLs in the last days_to_keep day partitions (loaded once, then cached)."""
+		window = self._windows.get(days_to_keep)
+		if window is None:
+			with self._lock:
+				hashes = [self._hash(url) for url in self._select_urls(days_to_keep)]
+			window = np.unique(np.array(hashes, dtype=np.uint64))
+			self._windows[days_to_keep] = window
+		return window
+
+	def is_seen(self, url: str, days_to_keep: int = DAYS_TO_KEEP) -> bool:
+		# Bloom miss = never marked; possible hits are settled by binary search in the cached window
+		if url not in self.bloom:
+			return False
+		window = self.window(days_to_keep)
+		h = np.uint64(self._hash(url))
+		i = np.searchsorted(window, h)
+		return bool(i < len(window) and window[i] == h)
+
+	def urls(self, days_to_keep: int = DAYS_TO_KEEP) -> Set[str]:
+		with self._lock:
+			return set(self._select_urls(days_to_keep))
+
+	def mark(self, urls: Iterable[str], seen_at: Optional[float] = None) -> None:
+		seen_at = seen_at or time.time()
+		day = datetime.fromtimestamp(seen_at).date().isoformat()
+		urls = list(urls)
+		self.bloom.add(urls)
+		self._upsert([(url, seen_at, day) for url in urls])
+
+	def cleanup(self, days_to_keep: int = DAYS_TO_KEEP) -> int:
+		"""Drop the day tables older than days_to_keep (no row-by-row deletes); returns partitions dropped."""
+		first_day = self._first_day(days_to_keep)
+		with self._lock:
+			expired = [day for day in self._days if day < first_day]
+			for day in expired:
+				self._conn.execute(f"DROP TABLE IF EXISTS {self._table(day)}")
+				self._days.discard(day)
+			self._conn.commit()
+			removed = len(expired)
+			if removed:
+				self._windows.clear()
+		# Bloom filters can't delete; rebuild once expired URLs have pushed it past capacity
+		if removed and self.bloom.saturated:
+			self.rebuild_bloom()
+		return removed
 
+	def count(self) -> int:
+		"""
+		Rows across all day tables, for log lines: a URL marked on several days counts once per day.
+		Each table's COUNT(*) walks its primary key index; no URLs are loaded.
+		"""
+		with self._lock:
+			return sum(self._conn.execute(f"SELECT COUNT(*) FROM {self._table(day)}").fetchone()[0]
+			           for day in self._partitions())
 
-def load_seen_urls(days_to_keep: int = 30) -> Set[str]:
+	def import_jsonl(self, path: str = SEEN_FILE) -> int:
+		"""One-shot import of a seen_articles.jsonl log; returns entries imported."""
+		rows = []
+		with open(path, 'r') as f:
+			for line in f:
+				try:
+					entry = json.loads(line)
+					url = entry.get('url')
+					timestamp = entry.get('timestamp')
+					if url and timestamp:
+						seen_at = datetime.fromisoformat(timestamp)
+						rows.append((url, seen_at.timestamp(), seen_at.date().isoformat()))
+				except (ValueError, AttributeError):
+					pass
+		self.bloom.add(url for url, _, _ in rows)
+		self._upsert(rows)
+		return len(rows)
+
+
+_shared_store: Optional[SeenStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_seen_store() -> SeenStore:
+	"""Process-wide store behind the module-level helpers."""
+	global _shared_store
+	with _shared_lock:
+		if _shared_store is None:
+			_shared_store = SeenStore()
+		return _shared_store
+
+
+def load_seen_urls(days_to_keep: int = DAYS_TO_KEEP) -> Set[str]:
 	"""Load URLs of articles we've already reported in the last N days."""
-	if not os.path.exists(SEEN_FILE):
-		return set()
-	
-	cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-	seen = set()
-	
-	with open(SEEN_FILE, 'r') as f:
-		for line in f:
-			try:
-				entry = json.loads(line)
-				url = entry.get('url')
-				timestamp = entry.get('timestamp')
-				
-				# Only keep recent entries
-				if url and timestamp:
-					entry_date = datetime.fromisoformat(timestamp)
-					if entry_date >= cutoff_date:
-						seen.add(url)
-			except:
-				pass
-	
-	return seen
+	return get_seen_store().urls(days_to_keep)
+
+
+def is_seen(url: str, days_to_keep: int = DAYS_TO_KEEP) -> bool:
+	"""Whether url was reported in the last N days (point lookup, no full load)."""
+	return get_seen_store().is_seen(url, days_to_keep)
 
 
 def mark_as_seen(urls: list):
-	"""Mark URLs as seen by appending to the tracking file."""
-	timestamp = datetime.now().isoformat()
-	
-	with open(SEEN_FILE, 'a') as f:
-		for url in urls:
-			entry = {
-				'url': url,
-				'timestamp': timestamp
-			}
-			f.write(json.dumps(entry) + '\n')
-
-
-def cleanup_old_entries(days_to_keep: int = 30):
-	"""Remove entries older than N days to keep the file manageable."""
-	if not os.path.exists(SEEN_FILE):
-		return
-	
-	cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-	kept_entries = []
+	"""Mark URLs as seen."""
+	get_seen_store().mark(urls)
+
+
+def cleanup_old_entries(days_to_keep: int = DAYS_TO_KEEP):
+	"""Remove entries older than N days."""
+	get_seen_store().cleanup(days_to_keep)
+
+
+if __name__ == "__main__":
+	import argparse
 	
-	with open(SEEN_FILE, 'r') as f:
-		for line in f:
-			try:
-				entry = json.loads(line)
-				timestamp = entry.get('timestamp')
-				if timestamp:
-					entry_date = datetime.fromisoformat(timestamp)
-					if entry_date >= cutoff_date:
-						kept_entries.append(line)
-			except:
-				pass
+	parser = argparse.ArgumentParser(description="Import a seen_articles.jsonl log into the SQLite seen store")
+	parser.add_argument("--import-jsonl", default=SEEN_FILE, help="JSONL log to import")
+	args = parser.parse_args()
 	
-	# Rewrite file with only recent entries
-	with open(SEEN_FILE, 'w') as f:
-		for entry in kept_entries:
-			f.write(entry)
-
+	store = SeenStore(legacy_path=None)
+	print(f"✅ Imported {store.import_jsonl(args.import_jsonl)} entries into {store.path} ({store.count()} URLs tracked)")
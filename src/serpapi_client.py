@@ -3,14 +3,16 @@ SerpAPI client for Google News searches.
 Supports date filtering, site: operators, and Boolean queries.
 """
 
-from typing import Dict, List
-import requests
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 
+from src.http_transport import HTTPTransport, get_transport
+
 
 class SerpAPIClient:
-	def __init__(self, api_key: str) -> None:
+	def __init__(self, api_key: str, transport: Optional[HTTPTransport] = None) -> None:
 		self.api_key = api_key
+		self.transport = transport or get_transport()
 		self.base_url = "https://serpapi.com/search.json"
 
 	def search_news(self, query: str, since: str, page_size: int = 10) -> List[Dict]:
@@ -55,7 +57,7 @@ class SerpAPIClient:
 			params["tbs"] = date_filter
 		
 		try:
-			resp = requests.get(self.base_url, params=params, timeout=30)
+			resp = self.transport.get(self.base_url, source="serpapi", params=params)
 			resp.raise_for_status()
 			data = resp.json() or {}
 		except Exception as e:
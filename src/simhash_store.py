@@ -0,0 +1,133 @@
+"""
+Persistent store of 64-bit SimHash fingerprints of articles reported in earlier runs.
+Catches the same story reappearing under a different URL (re-reported by another
+outlet, or wrapped in a newsletter tracking link), which the exact-URL seen
+tracker misses. Near matches are found by Hamming distance through permuted block
+tables: with 4 tables of 16-bit blocks (the default), any fingerprint within 3 bits
+of a stored one shares at least one block with it exactly.
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.deduplication import normalize_title
+
+
+FINGERPRINT_FILE = "seen_fingerprints.jsonl"
+
+BLOCKS = 4
+
+
+def _features(text: str) -> List[str]:
+	words = re.findall(r"[a-z0-9]+", text.lower())
+	return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def simhash(text: str) -> Optional[int]:
+	"""64-bit SimHash of word unigrams and bigrams, or None for text without words."""
+	features = _features(text)
+	if not features:
+		return None
+	digests = b"".join(hashlib.blake2b(f.encode("utf-8"), digest_size=8).digest() for f in features)
+	# One row of 64 bits per feature; a bit is set when most features have it set
+	bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(len(features), 8), axis=1)
+	majority = bits.sum(axis=0) * 2 > len(features)
+	return int.from_bytes(np.packbits(majority).tobytes(), "big")
+
+
+def article_fingerprint(article: Dict) -> Optional[int]:
+	"""Fingerprint of normalized title plus the start of the summary/description (None if both are empty)."""
+	title = normalize_title(article.get("title") or "")
+	summary = (article.get("summary") or article.get("description") or "")[:300]
+	return simhash(f"{title} {summary}")
+
+
+def hamming(a: int, b: int) -> int:
+	return bin(a ^ b).count("1")
+
+
+class SimHashStore:
+	def __init__(self, path: str = FINGERPRINT_FILE, days_to_keep: int = 30, max_distance: int = 3,
+	             blocks: int = BLOCKS) -> None:
+		# Pigeonhole: a match within max_distance bits agrees exactly on at least one of max_distance + 1 blocks
+		if max_distance >= blocks:
+			raise ValueError(f"max_distance must be below the number of blocks ({blocks})")
+		self.path = path
+		self.days_to_keep = days_to_keep
+		self.max_distance = max_distance
+		self.blocks = blocks
+		self._block_bits = 64 // blocks
+		self.entries: List[Dict] = []
+		# One table per block: block value -> indexes into self.entries
+		self._tables: List[Dict[int, List[int]]] = [{} for _ in range(blocks)]
+		self._load()
+
+	def _block_keys(self, fp: int) -> List[int]:
+		mask = (1 << self._block_bits) - 1
+		# The last block takes any leftover bits when 64 is not a multiple of blocks
+		keys = [(fp >> (block * self._block_bits)) & mask for block in range(self.blocks - 1)]
+		keys.append(fp >> ((self.blocks - 1) * self._block_bits))
+		return keys
+
+	def _index(self, i: int) -> None:
+		for table, key in zip(self._tables, self._block_keys(self.entries[i]["fp"])):
+			table.setdefault(key, []).append(i)
+
+	def _load(self) -> None:
+		"""Load fingerprints from the last days_to_keep days (same window as load_seen_urls)."""
+		if not os.path.exists(self.path):
+			return
+		cutoff = datetime.now() - timedelta(days=self.days_to_keep)
+		with open(self.path, "r") as f:
+			for line in f:
+				try:
+					entry = json.loads(line)
+					if datetime.fromisoformat(entry["timestamp"]) < cutoff:
+						continue
+					entry["fp"] = int(entry["fp"], 16)
+				except (ValueError, KeyError, TypeError):
+					continue
+				self.entries.append(entry)
+				self._index(len(self.entries) - 1)
+
+	def find(self, fp: int) -> Optional[Dict]:
+		"""A stored entry within max_distance bits of fp, or None."""
+		for table, key in zip(self._tables, self._block_keys(fp)):
+			for i in table.get(key, ()):
+				if hamming(fp, self.entries[i]["fp"]) <= self.max_distance:
+					return self.entries[i]
+		return None
+
+	def seen(self, article: Dict) -> bool:
+		fp = article_fingerprint(article)
+		# Articles without text all hash alike; they are never near-duplicates of each other
+		return fp is not None and self.find(fp) is not None
+
+	def add(self, articles: List[Dict]) -> None:
+		"""Fingerprint articles and append them to the store."""
+		timestamp = datetime.now().isoformat()
+		with open(self.path, "a") as f:
+			for article in articles:
+				fp = article_fingerprint(article)
+				if fp is None:
+					continue
+				entry = {
+					"fp": fp,
+					"url": article.get("link") or article.get("url"),
+					"timestamp": timestamp,
+				}
+				f.write(json.dumps(dict(entry, fp=f"{entry['fp']:016x}")) + "\n")
+				self.entries.append(entry)
+				self._index(len(self.entries) - 1)
+
+	def cleanup(self) -> None:
+		"""Rewrite the file with only the fingerprints inside the window."""
+		with open(self.path, "w") as f:
+			for entry in self.entries:
+				f.write(json.dumps(dict(entry, fp=f"{entry['fp']:016x}")) + "\n")
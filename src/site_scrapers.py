@@ -3,17 +3,40 @@ Direct web scrapers for curated news sites.
 Each scraper is tailored to the specific site's HTML structure.
 """
 
-from typing import List, Dict
-import requests
+from typing import Callable, List, Dict, Optional, Tuple
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone
 from dateutil import parser as dateparser
 import time
 
+from src.http_cache import ConditionalCache, get_http_cache
+from src.scrape_scheduler import ScrapeScheduler
+
+
+AFR_URLS = [
+	"https://www.afr.com/companies/financial-services",
+	"https://www.afr.com/technology/fintech",
+]
+ASIC_URLS = [
+	"https://asic.gov.au/about-asic/news-centre/find-a-media-release/",
+]
+INNOVATIONAUS_URLS = [
+	"https://www.innovationaus.com/category/fintech/",
+	"https://www.innovationaus.com/category/regulation/",
+]
+INTEREST_NZ_URLS = [
+	"https://www.interest.co.nz/banking",
+]
+ITNEWS_URLS = [
+	"https://www.itnews.com.au/topic/financial-services",
+	"https://www.itnews.com.au/topic/security",
+]
+
 
 class SiteScrapers:
-	def __init__(self):
-		self.timeout = 15
+	def __init__(self, cache: Optional[ConditionalCache] = None, min_delay: float = 1.0, max_in_flight_per_domain: int = 1):
+		self.cache = cache or get_http_cache()
+		self.scheduler = ScrapeScheduler(min_delay=min_delay, max_in_flight_per_domain=max_in_flight_per_domain)
 		self.headers = {
 			"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
 		}
@@ -28,56 +51,66 @@ class SiteScrapers:
 		except:
 			return None
 	
+	def _fetch_page(self, url: str, parse_page: Callable[[str, int], List[Dict]], max_items: int) -> List[Dict]:
+		"""Fetch a listing page (conditional GET) and parse it; 304 reuses the cached parse."""
+		return self.cache.fetch(
+			url,
+			lambda resp: parse_page(resp.text, max_items),
+			key=f"{url}#max={max_items}",
+			headers=self.headers,
+			source="scraper",
+		)
+	
+	def _parse_afr_page(self, html: str, max_items: int) -> List[Dict]:
+		"""Parse an AFR section listing page."""
+		soup = BeautifulSoup(html, 'html.parser')
+		results = []
+		
+		# AFR uses article tags with specific classes
+		articles = soup.find_all('article', limit=max_items)
+		
+		for article in articles:
+			# Find link
+			link_tag = article.find('a', href=True)
+			if not link_tag:
+				continue
+			
+			title = link_tag.get_text(strip=True) or article.find('h3')
+			if isinstance(title, str):
+				title_text = title
+			else:
+				title_text = title.get_text(strip=True) if title else "Untitled"
+			
+			href = link_tag['href']
+			if href.startswith('/'):
+				href = f"https://www.afr.com{href}"
+			
+			# Try to find description
+			desc_tag = article.find(['p', 'div'], class_=lambda x: x and 'summary' in x.lower() if x else False)
+			description = desc_tag.get_text(strip=True) if desc_tag else title_text
+			
+			results.append({
+				"title": title_text,
+				"description": description,
+				"content": description,
+				"url": href,
+				"source": "Australian Financial Review",
+				"publishedAt": None,
+				"_source_type": "Scraper",
+			})
+		
+		return results
+	
 	def scrape_afr_financial_services(self, since: str, max_items: int = 20) -> List[Dict]:
 		"""Scrape Australian Financial Review - Financial Services section."""
 		since_dt = self._parse_date(since)
 		results = []
 		
-		urls_to_scrape = [
-			"https://www.afr.com/companies/financial-services",
-			"https://www.afr.com/technology/fintech",
-		]
-		
-		for url in urls_to_scrape:
+		for url in AFR_URLS:
 			try:
 				print(f"    Scraping AFR: {url}")
-				resp = requests.get(url, timeout=self.timeout, headers=self.headers)
-				resp.raise_for_status()
-				soup = BeautifulSoup(resp.text, 'html.parser')
-				
-				# AFR uses article tags with specific classes
-				articles = soup.find_all('article', limit=max_items)
-				
-				for article in articles:
-					# Find link
-					link_tag = article.find('a', href=True)
-					if not link_tag:
-						continue
-					
-					title = link_tag.get_text(strip=True) or article.find('h3')
-					if isinstance(title, str):
-						title_text = title
-					else:
-						title_text = title.get_text(strip=True) if title else "Untitled"
-					
-					href = link_tag['href']
-					if href.startswith('/'):
-						href = f"https://www.afr.com{href}"
-					
-					# Try to find description
-					desc_tag = article.find(['p', 'div'], class_=lambda x: x and 'summary' in x.lower() if x else False)
-					description = desc_tag.get_text(strip=True) if desc_tag else title_text
-					
-					results.append({
-						"title": title_text,
-						"description": description,
-						"content": description,
-						"url": href,
-						"source": "Australian Financial Review",
-						"publishedAt": None,
-						"_source_type": "Scraper",
-					})
-				
+				articles = self._fetch_page(url, self._parse_afr_page, max_items)
+				results.extend(articles)
 				print(f"    Found {len(articles)} AFR articles")
 				time.sleep(1)  # Be polite
 				
@@ -86,41 +119,45 @@ class SiteScrapers:
 		
 		return results[:max_items]
 	
+	def _parse_asic_page(self, html: str, max_items: int) -> List[Dict]:
+		"""Parse the ASIC media release listing page."""
+		soup = BeautifulSoup(html, 'html.parser')
+		results = []
+		
+		# Find all links in the results area
+		links = soup.find_all('a', href=lambda x: x and '/media-releases/' in x)
+		
+		for link in links[:max_items]:
+			title = link.get_text(strip=True)
+			href = link.get('href', '')
+			
+			if href.startswith('/'):
+				href = f"https://asic.gov.au{href}"
+			
+			# Extract date from URL or text if possible
+			# ASIC URLs often contain date: /media-releases/2024/
+			
+			results.append({
+				"title": title,
+				"description": title,
+				"content": title,
+				"url": href,
+				"source": "ASIC",
+				"publishedAt": None,
+				"_source_type": "Scraper",
+			})
+		
+		return results
+	
 	def scrape_asic_media_releases(self, since: str, max_items: int = 20) -> List[Dict]:
 		"""Scrape ASIC media releases."""
 		since_dt = self._parse_date(since)
 		results = []
-		url = "https://asic.gov.au/about-asic/news-centre/find-a-media-release/"
+		url = ASIC_URLS[0]
 		
 		try:
 			print(f"    Scraping ASIC: {url}")
-			resp = requests.get(url, timeout=self.timeout, headers=self.headers)
-			resp.raise_for_status()
-			soup = BeautifulSoup(resp.text, 'html.parser')
-			
-			# Find all links in the results area
-			links = soup.find_all('a', href=lambda x: x and '/media-releases/' in x)
-			
-			for link in links[:max_items]:
-				title = link.get_text(strip=True)
-				href = link.get('href', '')
-				
-				if href.startswith('/'):
-					href = f"https://asic.gov.au{href}"
-				
-				# Extract date from URL or text if possible
-				# ASIC URLs often contain date: /media-releases/2024/
-				
-				results.append({
-					"title": title,
-					"description": title,
-					"content": title,
-					"url": href,
-					"source": "ASIC",
-					"publishedAt": None,
-					"_source_type": "Scraper",
-				})
-			
+			results = self._fetch_page(url, self._parse_asic_page, max_items)
 			print(f"    Found {len(results)} ASIC articles")
 			
 		except Exception as e:
@@ -128,48 +165,48 @@ class SiteScrapers:
 		
 		return results
 	
+	def _parse_innovationaus_page(self, html: str, max_items: int) -> List[Dict]:
+		"""Parse an InnovationAus category page."""
+		soup = BeautifulSoup(html, 'html.parser')
+		results = []
+		
+		# Find article links
+		articles = soup.find_all(['article', 'div'], class_=lambda x: x and 'post' in x.lower() if x else False, limit=max_items//2)
+		
+		for article in articles:
+			link_tag = article.find('a', href=True)
+			if not link_tag:
+				continue
+			
+			title_tag = article.find(['h2', 'h3'])
+			title = title_tag.get_text(strip=True) if title_tag else link_tag.get_text(strip=True)
+			
+			href = link_tag['href']
+			if not href.startswith('http'):
+				href = f"https://www.innovationaus.com{href}"
+			
+			results.append({
+				"title": title,
+				"description": title,
+				"content": title,
+				"url": href,
+				"source": "InnovationAus",
+				"publishedAt": None,
+				"_source_type": "Scraper",
+			})
+		
+		return results
+	
 	def scrape_innovationaus(self, since: str, max_items: int = 20) -> List[Dict]:
 		"""Scrape InnovationAus fintech and regtech sections."""
 		since_dt = self._parse_date(since)
 		results = []
 		
-		categories = [
-			"https://www.innovationaus.com/category/fintech/",
-			"https://www.innovationaus.com/category/regulation/",
-		]
-		
-		for url in categories:
+		for url in INNOVATIONAUS_URLS:
 			try:
 				print(f"    Scraping InnovationAus: {url}")
-				resp = requests.get(url, timeout=self.timeout, headers=self.headers)
-				resp.raise_for_status()
-				soup = BeautifulSoup(resp.text, 'html.parser')
-				
-				# Find article links
-				articles = soup.find_all(['article', 'div'], class_=lambda x: x and 'post' in x.lower() if x else False, limit=max_items//2)
-				
-				for article in articles:
-					link_tag = article.find('a', href=True)
-					if not link_tag:
-						continue
-					
-					title_tag = article.find(['h2', 'h3'])
-					title = title_tag.get_text(strip=True) if title_tag else link_tag.get_text(strip=True)
-					
-					href = link_tag['href']
-					if not href.startswith('http'):
-						href = f"https://www.innovationaus.com{href}"
-					
-					results.append({
-						"title": title,
-						"description": title,
-						"content": title,
-						"url": href,
-						"source": "InnovationAus",
-						"publishedAt": None,
-						"_source_type": "Scraper",
-					})
-				
+				articles = self._fetch_page(url, self._parse_innovationaus_page, max_items)
+				results.extend(articles)
 				print(f"    Found {len(articles)} InnovationAus articles from {url}")
 				time.sleep(1)
 				
@@ -178,42 +215,46 @@ class SiteScrapers:
 		
 		return results[:max_items]
 	
+	def _parse_interest_nz_page(self, html: str, max_items: int) -> List[Dict]:
+		"""Parse the Interest.co.nz banking page."""
+		soup = BeautifulSoup(html, 'html.parser')
+		results = []
+		
+		# Find article headlines
+		articles = soup.find_all(['article', 'div'], class_=lambda x: x and ('article' in x.lower() or 'story' in x.lower()) if x else False, limit=max_items)
+		
+		for article in articles:
+			link_tag = article.find('a', href=True)
+			if not link_tag:
+				continue
+			
+			title = link_tag.get_text(strip=True)
+			href = link_tag['href']
+			
+			if href.startswith('/'):
+				href = f"https://www.interest.co.nz{href}"
+			
+			results.append({
+				"title": title,
+				"description": title,
+				"content": title,
+				"url": href,
+				"source": "Interest.co.nz",
+				"publishedAt": None,
+				"_source_type": "Scraper",
+			})
+		
+		return results
+	
 	def scrape_interest_nz(self, since: str, max_items: int = 20) -> List[Dict]:
 		"""Scrape Interest.co.nz banking section."""
 		since_dt = self._parse_date(since)
 		results = []
-		url = "https://www.interest.co.nz/banking"
+		url = INTEREST_NZ_URLS[0]
 		
 		try:
 			print(f"    Scraping Interest.co.nz: {url}")
-			resp = requests.get(url, timeout=self.timeout, headers=self.headers)
-			resp.raise_for_status()
-			soup = BeautifulSoup(resp.text, 'html.parser')
-			
-			# Find article headlines
-			articles = soup.find_all(['article', 'div'], class_=lambda x: x and ('article' in x.lower() or 'story' in x.lower()) if x else False, limit=max_items)
-			
-			for article in articles:
-				link_tag = article.find('a', href=True)
-				if not link_tag:
-					continue
-				
-				title = link_tag.get_text(strip=True)
-				href = link_tag['href']
-				
-				if href.startswith('/'):
-					href = f"https://www.interest.co.nz{href}"
-				
-				results.append({
-					"title": title,
-					"description": title,
-					"content": title,
-					"url": href,
-					"source": "Interest.co.nz",
-					"publishedAt": None,
-					"_source_type": "Scraper",
-				})
-			
+			results = self._fetch_page(url, self._parse_interest_nz_page, max_items)
 			print(f"    Found {len(results)} Interest.co.nz articles")
 			
 		except Exception as e:
@@ -221,47 +262,47 @@ class SiteScrapers:
 		
 		return results
 	
+	def _parse_itnews_page(self, html: str, max_items: int) -> List[Dict]:
+		"""Parse an ITnews topic page."""
+		soup = BeautifulSoup(html, 'html.parser')
+		results = []
+		
+		# Find articles
+		articles = soup.find_all(['article', 'div'], class_=lambda x: x and 'story' in x.lower() if x else False, limit=max_items//2)
+		
+		for article in articles:
+			link_tag = article.find('a', href=True)
+			if not link_tag:
+				continue
+			
+			title = link_tag.get_text(strip=True)
+			href = link_tag['href']
+			
+			if href.startswith('/'):
+				href = f"https://www.itnews.com.au{href}"
+			
+			results.append({
+				"title": title,
+				"description": title,
+				"content": title,
+				"url": href,
+				"source": "ITnews",
+				"publishedAt": None,
+				"_source_type": "Scraper",
+			})
+		
+		return results
+	
 	def scrape_itnews(self, since: str, max_items: int = 20) -> List[Dict]:
 		"""Scrape ITnews.com.au for identity, security, fintech topics."""
 		since_dt = self._parse_date(since)
 		results = []
 		
-		topics = [
-			"https://www.itnews.com.au/topic/financial-services",
-			"https://www.itnews.com.au/topic/security",
-		]
-		
-		for url in topics:
+		for url in ITNEWS_URLS:
 			try:
 				print(f"    Scraping ITnews: {url}")
-				resp = requests.get(url, timeout=self.timeout, headers=self.headers)
-				resp.raise_for_status()
-				soup = BeautifulSoup(resp.text, 'html.parser')
-				
-				# Find articles
-				articles = soup.find_all(['article', 'div'], class_=lambda x: x and 'story' in x.lower() if x else False, limit=max_items//2)
-				
-				for article in articles:
-					link_tag = article.find('a', href=True)
-					if not link_tag:
-						continue
-					
-					title = link_tag.get_text(strip=True)
-					href = link_tag['href']
-					
-					if href.startswith('/'):
-						href = f"https://www.itnews.com.au{href}"
-					
-					results.append({
-						"title": title,
-						"description": title,
-						"content": title,
-						"url": href,
-						"source": "ITnews",
-						"publishedAt": None,
-						"_source_type": "Scraper",
-					})
-				
+				articles = self._fetch_page(url, self._parse_itnews_page, max_items)
+				results.extend(articles)
 				print(f"    Found {len(articles)} ITnews articles from {url}")
 				time.sleep(1)
 				
@@ -270,18 +311,44 @@ class SiteScrapers:
 		
 		return results[:max_items]
 	
+	def _site_table(self) -> List[Tuple[str, List[str], Callable[[str, int], List[Dict]]]]:
+		"""(site name, listing pages, page parser) for every curated site, in report order."""
+		return [
+			("AFR", AFR_URLS, self._parse_afr_page),
+			("ASIC", ASIC_URLS, self._parse_asic_page),
+			("InnovationAus", INNOVATIONAUS_URLS, self._parse_innovationaus_page),
+			("Interest.co.nz", INTEREST_NZ_URLS, self._parse_interest_nz_page),
+			("ITnews", ITNEWS_URLS, self._parse_itnews_page),
+		]
+	
+	def _page_job(self, site: str, url: str, parse_page: Callable[[str, int], List[Dict]], max_items: int) -> Callable[[], List[Dict]]:
+		"""Blocking fetch for one page; errors are reported and yield no items."""
+		def fetch() -> List[Dict]:
+			try:
+				print(f"    Scraping {site}: {url}")
+				articles = self._fetch_page(url, parse_page, max_items)
+				print(f"    Found {len(articles)} {site} articles from {url}")
+				return articles
+			except Exception as e:
+				print(f"    Error scraping {site}: {e}")
+				return []
+		return fetch
+	
 	def scrape_all(self, since: str, max_per_site: int = 10) -> List[Dict]:
-		"""Scrape all curated sites."""
+		"""Scrape all curated sites concurrently, staying polite per domain."""
 		all_articles = []
 		
 		print("  Scraping curated news sites...")
-		all_articles.extend(self.scrape_afr_financial_services(since, max_per_site))
-		all_articles.extend(self.scrape_asic_media_releases(since, max_per_site))
-		all_articles.extend(self.scrape_innovationaus(since, max_per_site))
-		all_articles.extend(self.scrape_interest_nz(since, max_per_site))
-		all_articles.extend(self.scrape_itnews(since, max_per_site))
+		sites = {
+			site: [(url, self._page_job(site, url, parse_page, max_per_site)) for url in urls]
+			for site, urls, parse_page in self._site_table()
+		}
+		results, timings = self.scheduler.run(sites)
+		
+		for site in sites:
+			site_articles = results[site][:max_per_site]
+			all_articles.extend(site_articles)
+			print(f"    {site}: {len(site_articles)} articles in {timings[site]:.1f}s")
 		
 		print(f"  Total scraped: {len(all_articles)} articles from curated sites")
 		return all_articles
-
-
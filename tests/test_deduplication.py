@@ -0,0 +1,73 @@
+from src.deduplication import cluster_articles
+
+
+TERMS = ["asic", "credit", "lending", "mortgage", "fraud", "privacy", "banking", "regulator", "penalty", "consumer"]
+
+
+def article(title, summary):
+	return {"title": title, "summary": summary, "importance_score": 50}
+
+
+def test_shared_vocabulary_does_not_chain_across_categories():
+	# Neighbours share 3 terms, so a chain of topic matches would link every article
+	categorized = {
+		f"Category {n}": [article(title, " ".join(TERMS[n:n + 4]))]
+		for n, title in enumerate(["Rates on hold", "Bank profits up", "Scam losses fall", "New CEO named", "Data breach", "Budget wrap"])
+	}
+	result = cluster_articles(categorized)
+	assert sum(len(items) for items in result.values()) == 6
+
+
+def test_same_story_clusters_across_categories():
+	categorized = {
+		"Regulation": [article("ASIC sues lender over hardship failures", "ASIC has sued a lender.")],
+		"Competition": [article("ASIC sues lender over hardship failures - Reuters", "Reuters report.")],
+	}
+	result = cluster_articles(categorized)
+	kept = [item for items in result.values() for item in items]
+	assert len(kept) == 1
+	assert len(kept[0]["also_covered_by"]) == 1
+
+
+def test_topic_match_does_not_chain_within_category():
+	# b matches a and c on topic, but a and c share only one term
+	items = [
+		article("Rates on hold", "asic credit lending mortgage"),
+		article("Bank profits up", "credit lending mortgage fraud privacy banking"),
+		article("Scam losses fall", "mortgage fraud privacy banking"),
+	]
+	result = cluster_articles({"Regulation": items})
+	assert len(result["Regulation"]) == 2
+
+
+def test_clusters_do_not_depend_on_input_order():
+	import random
+
+	categorized = {
+		"Regulation": [
+			article("ASIC sues lender over hardship failures", "asic lender hardship penalty"),
+			article("ASIC sues lender over hardship failure", "asic lender hardship court"),
+			article("Rates on hold", "asic credit lending mortgage"),
+			article("Bank profits up", "credit lending mortgage fraud privacy banking"),
+			article("Scam losses fall", "mortgage fraud privacy banking"),
+		],
+		"Competition": [
+			article("ASIC sues lender over hardship failures - Reuters", "Reuters report."),
+			article("Merger blocked by ACCC", "accc merger banking consumer"),
+			article("ACCC blocks bank merger", "accc merger banking consumer"),
+		],
+	}
+
+	def clusters(result):
+		return sorted(
+			(category, item["title"], tuple(sorted(other["title"] for other in item.get("also_covered_by", []))))
+			for category, items in result.items() for item in items
+		)
+
+	expected = clusters(cluster_articles(categorized))
+	rng = random.Random(5)
+	for _ in range(10):
+		categories = list(categorized)
+		rng.shuffle(categories)
+		shuffled = {category: rng.sample(categorized[category], len(categorized[category])) for category in categories}
+		assert clusters(cluster_articles(shuffled)) == expected
@@ -0,0 +1,68 @@
+import imaplib
+import time
+from datetime import datetime
+
+from src.email_cache import EmailCache
+from src.email_parser import EmailParser
+
+
+DAY = 86400
+
+
+class FakeMailbox:
+	"""Just enough of imaplib.IMAP4_SSL for EmailParser._sync, recording fetched UIDs."""
+
+	def __init__(self, received):
+		self.received = received  # uid -> epoch seconds
+		self.fetched = []
+
+	def select(self, folder):
+		return "OK", [str(len(self.received)).encode()]
+
+	def response(self, code):
+		return code, [b"1"]
+
+	def uid(self, command, *args):
+		if command == "search":
+			criteria = args[1]
+			if criteria.startswith("(SINCE "):
+				since = datetime.strptime(criteria[7:-1], "%d-%b-%Y").timestamp()
+				uids = [uid for uid, received in self.received.items() if received >= since]
+			else:
+				first = int(criteria[5:].split(":")[0])
+				uids = [uid for uid in self.received if uid >= first] or [max(self.received)]
+			return "OK", [" ".join(str(uid) for uid in sorted(uids)).encode()]
+		uids = [int(uid) for uid in args[0].split(",")]
+		self.fetched.extend(uids)
+		data = []
+		for uid in uids:
+			date = imaplib.Time2Internaldate(self.received[uid]).encode()
+			data.append((b"%d (UID %d INTERNALDATE %s RFC822 {0}" % (uid, uid, date), b""))
+			data.append(b")")
+		return "OK", data
+
+	def close(self):
+		pass
+
+	def logout(self):
+		pass
+
+
+def test_window_longer_than_retention(tmp_path, monkeypatch):
+	now = time.time()
+	mailbox = FakeMailbox({1: now - 45 * DAY, 2: now - 35 * DAY, 3: now - 10 * DAY, 4: now - DAY})
+	cache = EmailCache(path=str(tmp_path / "email_cache.db"), days_to_keep=30)
+	parser = EmailParser("imap.example.com", 993, "user", "secret", cache=cache)
+	monkeypatch.setattr(parser, "connect", lambda: mailbox)
+	monkeypatch.setattr(parser, "_parse_email", lambda msg: [{"title": "story"}])
+
+	assert len(parser.parse_emails_since(days_ago=50)) == 4
+	assert sorted(mailbox.fetched) == [1, 2, 3, 4]
+
+	# Messages inside the window survive cleanup, so the next run downloads nothing
+	assert len(parser.parse_emails_since(days_ago=50)) == 4
+	assert sorted(mailbox.fetched) == [1, 2, 3, 4]
+
+	# A shorter window lets retention drop them
+	assert len(parser.parse_emails_since(days_ago=7)) == 1
+	assert cache.cached_uids(parser._folder_key("INBOX")) == {3, 4}
@@ -0,0 +1,46 @@
+import json
+
+from src.feedback_store import FeedbackStore
+
+
+def test_import_jsonl_is_idempotent(tmp_path):
+	log = tmp_path / "feedback.jsonl"
+	entries = [
+		{"article_url": "https://example.com/a", "rating": 1, "timestamp": "2026-01-01T00:00:00"},
+		{"article_url": "https://example.com/b", "rating": 5, "timestamp": "2026-01-02T00:00:00"},
+	]
+	log.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+
+	# Created with the log present: imported automatically, then again by hand
+	store = FeedbackStore(path=str(tmp_path / "feedback.db"), legacy_path=str(log))
+	assert store.import_jsonl(str(log)) == 0
+	assert store.count() == 2
+	assert store.count(1) == 1
+
+	entries.append({"article_url": "https://example.com/a", "rating": 4, "timestamp": "2026-01-03T00:00:00"})
+	log.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+	assert store.import_jsonl(str(log)) == 1
+	assert store.count() == 3
+
+
+def test_imported_feedback_reaches_bloom(tmp_path, monkeypatch):
+	from src import feedback_filter, feedback_store
+
+	def fresh_process():
+		monkeypatch.setattr(feedback_store, "_shared_store", FeedbackStore(path=str(tmp_path / "feedback.db"), legacy_path=None))
+		monkeypatch.setattr(feedback_filter, "_bloom", None)
+		monkeypatch.setattr(feedback_filter, "_index", None)
+
+	monkeypatch.setattr(feedback_filter, "FEEDBACK_BLOOM", str(tmp_path / "feedback_blocked.bloom"))
+	fresh_process()
+	# The bloom file exists before anything is imported
+	assert not feedback_filter.is_blocked("https://example.com/a")
+
+	log = tmp_path / "feedback.jsonl"
+	log.write_text(json.dumps({"article_url": "https://example.com/a", "rating": 1, "timestamp": "2026-01-01T00:00:00"}) + "\n")
+	assert feedback_store.get_feedback_store().import_jsonl(str(log)) == 1
+	assert feedback_filter.is_blocked("https://example.com/a")
+
+	fresh_process()
+	assert feedback_filter.is_blocked("https://example.com/a")
+	assert not feedback_filter.is_blocked("https://example.com/b")
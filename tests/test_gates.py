@@ -0,0 +1,24 @@
+from src.gates import GateStage, KeywordScan, corporate_pr_gate, relevance_gate, url_lookup_gate
+
+
+def test_keyword_gates_share_one_scan():
+	scanned = []
+
+	def keyword_matches(title, description):
+		scanned.append(title)
+		return {"relevant": {"credit"}} if "credit" in title.lower() else {}
+
+	scan = KeywordScan(keyword_matches)
+	gates = GateStage([
+		("seen in previous runs", url_lookup_gate(lambda url: url == "https://example.com/seen")),
+		("keyword relevance", relevance_gate(lambda t, d, matches: "relevant" in matches, scan)),
+		("corporate PR", corporate_pr_gate(lambda t, d, u, matches: False, scan)),
+	])
+	kept = {"title": "Credit reporting reform", "url": "https://example.com/a"}
+	seen = {"title": "Credit reporting reform", "url": "https://example.com/seen"}
+
+	assert gates.rejected_by(kept) is None
+	assert scanned == ["Credit reporting reform"]
+	assert scan.matches_of(kept) == {"relevant": {"credit"}}
+	assert gates.rejected_by(seen) == "seen in previous runs"
+	assert scan.matches_of(seen) is None
@@ -0,0 +1,17 @@
+"""Import smoke test: every module and entry point must import cleanly."""
+
+import importlib
+import pkgutil
+
+import pytest
+
+import src
+
+
+MODULES = sorted(f"src.{info.name}" for info in pkgutil.iter_modules(src.__path__))
+ENTRY_POINTS = ["main", "main_simple", "main_newsletters", "main_scrapers", "main_serpapi", "main_no_gpt"]
+
+
+@pytest.mark.parametrize("name", MODULES + ENTRY_POINTS)
+def test_imports(name):
+	importlib.import_module(name)
@@ -0,0 +1,35 @@
+import sqlite3
+
+from src.feedback_store import FeedbackStore
+from src.llm_cache import LLMCache
+from src.local_classifier import article_text, load_training_data
+
+
+ARTICLE = {"title": "Lender fined $2m", "description": "ASIC fined a payday lender.", "url": "https://example.com/a"}
+GPT_RESULT = {"title": "ASIC penalises payday lender", "summary": "A rewritten summary.", "category": "Regulation",
+              "importance_score": 70, "link": "https://example.com/a"}
+
+
+def test_training_uses_the_article_text_not_gpt_output(tmp_path):
+	cache = LLMCache(path=str(tmp_path / "llm_cache.db"))
+	cache.put("key", "gpt", GPT_RESULT, input_text=article_text(ARTICLE))
+	cache.put("old", "gpt", dict(GPT_RESULT, link="https://example.com/b"))
+	feedback = FeedbackStore(path=str(tmp_path / "feedback.db"), legacy_path=None)
+	feedback.add({"article_url": "https://example.com/a", "article_title": GPT_RESULT["title"], "rating": 5})
+
+	labelled, rated = load_training_data(cache.examples(model="gpt"), feedback)
+	# Results stored without their input are left out
+	assert labelled == [(article_text(ARTICLE), "Regulation", 70.0)]
+	assert rated == [(article_text(ARTICLE), 95.0)]
+
+
+def test_cache_from_before_inputs_gains_the_column(tmp_path):
+	path = tmp_path / "llm_cache.db"
+	conn = sqlite3.connect(path)
+	conn.execute("CREATE TABLE llm_results (key TEXT PRIMARY KEY, model TEXT NOT NULL, result TEXT NOT NULL,"
+	             " created_at REAL NOT NULL, last_used REAL NOT NULL)")
+	conn.commit()
+	conn.close()
+	cache = LLMCache(path=str(path))
+	cache.put("key", "gpt", GPT_RESULT, input_text="raw text")
+	assert cache.examples() == [("raw text", GPT_RESULT)]
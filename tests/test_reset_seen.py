@@ -0,0 +1,36 @@
+import json
+from datetime import datetime, timedelta
+
+from reset_seen import reset_seen
+from src.seen_tracker import SeenStore
+from src.simhash_store import FINGERPRINT_FILE, SimHashStore
+
+
+STORY = {"title": "ASIC sues lender over hardship failures", "summary": "The regulator has filed proceedings.",
+         "link": "https://example.com/a"}
+
+
+def test_full_reset_forgets_story_fingerprints(tmp_path, monkeypatch):
+	monkeypatch.chdir(tmp_path)
+	SeenStore(legacy_path=None).mark([STORY["link"]])
+	SimHashStore().add([STORY])
+
+	reset_seen(keep_days=0)
+	assert not SimHashStore().seen(dict(STORY, link="https://other.example.com/a"))
+
+
+def test_partial_reset_trims_fingerprints_to_the_same_window(tmp_path, monkeypatch):
+	monkeypatch.chdir(tmp_path)
+	SeenStore(legacy_path=None)
+	old = dict(STORY, title="Bank fined for unfair fees", link="https://example.com/old")
+	SimHashStore().add([STORY, old])
+	# Backdate the second fingerprint past the window
+	lines = (tmp_path / FINGERPRINT_FILE).read_text().splitlines()
+	entry = json.loads(lines[1])
+	entry["timestamp"] = (datetime.now() - timedelta(days=10)).isoformat()
+	(tmp_path / FINGERPRINT_FILE).write_text(lines[0] + "\n" + json.dumps(entry) + "\n")
+
+	reset_seen(keep_days=7)
+	fingerprints = SimHashStore(days_to_keep=30)
+	assert fingerprints.seen(STORY)
+	assert not fingerprints.seen(old)
@@ -0,0 +1,57 @@
+import sqlite3
+import time
+
+from src.seen_tracker import SeenStore
+
+
+DAY = 86400
+
+
+def make_store(tmp_path):
+	return SeenStore(path=str(tmp_path / "seen.db"), legacy_path=None, bloom_path=str(tmp_path / "seen.bloom"))
+
+
+def test_window_and_expiry_by_day_table(tmp_path):
+	store = make_store(tmp_path)
+	now = time.time()
+	store.mark(["https://example.com/old"], seen_at=now - 40 * DAY)
+	store.mark(["https://example.com/new"], seen_at=now)
+	assert store.is_seen("https://example.com/new")
+	assert not store.is_seen("https://example.com/old")
+	assert store.count() == 2
+
+	assert store.cleanup(days_to_keep=30) == 1
+	assert store.count() == 1
+	tables = {row[0] for row in sqlite3.connect(store.path).execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+	assert len(tables) == 1
+
+
+def test_url_marked_again_survives_its_first_day(tmp_path):
+	store = make_store(tmp_path)
+	now = time.time()
+	store.mark(["https://example.com/a"], seen_at=now - 40 * DAY)
+	store.mark(["https://example.com/a"], seen_at=now)
+	store.cleanup(days_to_keep=30)
+	assert store.is_seen("https://example.com/a")
+	assert store.count() == 1
+
+
+def test_single_table_database_is_migrated(tmp_path):
+	path = tmp_path / "seen.db"
+	conn = sqlite3.connect(path)
+	conn.execute("CREATE TABLE seen (url TEXT PRIMARY KEY, seen_at REAL NOT NULL)")
+	conn.execute("INSERT INTO seen VALUES (?, ?)", ("https://example.com/a", time.time()))
+	conn.commit()
+	conn.close()
+	store = SeenStore(path=str(path), legacy_path=None, bloom_path=str(tmp_path / "seen.bloom"))
+	assert store.is_seen("https://example.com/a")
+	assert store.count() == 1
+
+
+def test_count_is_rows_across_day_tables(tmp_path):
+	store = make_store(tmp_path)
+	now = time.time()
+	store.mark(["https://example.com/a", "https://example.com/b"], seen_at=now - 2 * DAY)
+	store.mark(["https://example.com/a"], seen_at=now)
+	assert store.count() == 3
+	assert len(store.urls()) == 2
@@ -0,0 +1,22 @@
+from src.simhash_store import SimHashStore, simhash
+
+
+def test_simhash_of_text_without_words_is_none():
+	assert simhash("") is None
+	assert simhash("   \n\t ") is None
+	assert simhash("ASIC sues lender") is not None
+
+
+def test_empty_articles_are_neither_stored_nor_suppressed(tmp_path):
+	store = SimHashStore(path=str(tmp_path / "fingerprints.jsonl"))
+	empty = {"title": " ", "summary": "", "link": "https://example.com/a"}
+	store.add([empty])
+	assert store.entries == []
+	assert not store.seen({"title": "", "summary": "  ", "link": "https://example.com/b"})
+
+
+def test_stored_story_is_seen_again(tmp_path):
+	store = SimHashStore(path=str(tmp_path / "fingerprints.jsonl"))
+	story = {"title": "ASIC sues lender over hardship failures", "summary": "The regulator has filed proceedings."}
+	store.add([story])
+	assert store.seen(dict(story, link="https://other.example.com/story"))
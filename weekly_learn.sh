@@ -10,7 +10,7 @@ echo "================================"
 echo ""
 
 # Check feedback count
-feedback_count=$(wc -l < feedback.jsonl 2>/dev/null || echo "0")
+feedback_count=$(python -c "from src.feedback_store import get_feedback_store; print(get_feedback_store().count())" 2>/dev/null || echo "0")
 echo "📊 Current feedback: $feedback_count ratings"
 echo ""
 